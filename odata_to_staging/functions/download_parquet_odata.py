@@ -5,10 +5,13 @@ import logging
 import base64
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
-from typing import Any, Dict, Iterable, List, Optional, Set
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
 
 import polars as pl
 
+from utils.parquet.spill import SpillManager
+from utils.parquet.write_options import ParquetWriteOptions
+
 
 logger = logging.getLogger("odata_to_staging.download_parquet")
 
@@ -214,6 +217,9 @@ def download_parquet_odata(
     row_limit: Optional[int] = None,
     log_row_count: bool = True,
     per_entity_options: Optional[Dict[str, Dict[str, str]]] = None,
+    parquet_options: Optional[ParquetWriteOptions] = None,
+    on_table_dumped: Optional[Callable[[str, List[str]], None]] = None,
+    spill: Optional[SpillManager] = None,
 ) -> Optional[str]:
     """
     Stream OData entity sets to chunked Parquet files.
@@ -228,11 +234,19 @@ def download_parquet_odata(
       {
         "Employees": {"select": "EmployeeID,LastName", "filter": "Active eq true", "expand": "Orders"}
       }
+
+    parquet_options sets the codec, row-group size, dictionary encoding and
+    statistics of the part files (see utils.parquet.write_options).
+
+    on_table_dumped and spill work as in sql_to_staging's download_parquet:
+    the callback gets each finished entity set with its files (to upload it
+    right away), and the spill budget blocks the download while it is exceeded.
     """
 
     os.makedirs(output_dir, exist_ok=True)
     run_id = uuid.uuid4().hex
     created_files: List[str] = []
+    parquet_options = parquet_options or ParquetWriteOptions()
 
     # Track overall progress and statistics
     total_entities = len(entity_sets)
@@ -334,6 +348,7 @@ def download_parquet_odata(
         part_idx = 0
         skip = 0
         wrote_any = False
+        files_before = len(created_files)
         entity_rows = 0  # Track rows for this entity
 
         # Primary paging using skip/top; additionally follow next links when provided
@@ -446,9 +461,11 @@ def download_parquet_odata(
             out_path = os.path.join(
                 output_dir, f"{es_name}_{run_id}_part{part_idx:04d}.parquet"
             )
-            df.write_parquet(out_path)
+            parquet_options.write(df, out_path)
             created_files.append(os.path.basename(out_path))
             wrote_any = True
+            if spill is not None:
+                spill.written(es_name, out_path)
 
             try:
                 nrows = len(df)
@@ -481,6 +498,10 @@ def download_parquet_odata(
             total_rows_exported += entity_rows
             entities_completed += 1
             logger.info("   -> %s rows in %d chunk(s)", f"{entity_rows:,}", part_idx)
+        if spill is not None:
+            spill.finished(es_name)
+        if on_table_dumped is not None:
+            on_table_dumped(es_name, created_files[files_before:])
 
     # Write manifest for this run
     manifest_path = os.path.join(
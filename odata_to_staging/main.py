@@ -1,4 +1,6 @@
 import logging
+import os
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any, Dict, List, Optional, cast
 
@@ -11,7 +13,10 @@ from utils.logging.setup_logging import setup_logging
 # Reuse shared destination engine loader and parquet uploader
 from odata_to_staging.functions.engine_loaders import load_odata_client
 from utils.database.destination_engine import load_destination_engine
+from utils.parquet.spill import SpillManager
 from utils.parquet.upload_parquet import upload_parquet
+from utils.parquet.upload_pipeline import UploadPipeline
+from utils.parquet.write_options import parquet_write_options_from_config
 
 from odata_to_staging.functions.download_parquet_odata import (
     download_parquet_odata,
@@ -228,17 +233,8 @@ def main() -> None:
         "Preparing to export %d entity set(s): %s", len(entities), ", ".join(entities)
     )
 
-    manifest_path = download_parquet_odata(
-        client,
-        entity_sets=entities,
-        output_dir="data",
-        page_size=page_size,
-        row_limit=row_limit,
-        log_row_count=log_row_count,
-        per_entity_options=per_entity,
-    )
-
-    # Destination engine and upload
+    # Destination engine and upload settings; read up front because tables
+    # may be uploaded while the download continues (PIPELINED_UPLOAD)
     log.info("Connecting to destination database...")
     dest_engine = load_destination_engine(cfg)
 
@@ -260,38 +256,117 @@ def main() -> None:
         ),
     )
 
-    upload_parquet(
-        dest_engine,
-        schema=get_config_value(
-            "DST_SCHEMA", section="database-destination", cfg_parser=cfg
+    cleanup = cast(
+        bool,
+        get_config_value(
+            "CLEANUP_PARQUET_FILES",
+            section="settings",
+            cfg_parser=cfg,
+            default=True,
+            cast_type=bool,
         ),
-        input_dir="data",
-        cleanup=cast(
-            bool,
-            get_config_value(
-                "CLEANUP_PARQUET_FILES",
-                section="settings",
-                cfg_parser=cfg,
-                default=True,
-                cast_type=bool,
-            ),
+    )
+    dest_schema = get_config_value(
+        "DST_SCHEMA", section="database-destination", cfg_parser=cfg
+    )
+    # Normalize table names to lower-case in staging (configurable; default True)
+    lower_table_names = cast(
+        bool,
+        get_config_value(
+            "LOWER_TABLE_NAMES",
+            section="settings",
+            cfg_parser=cfg,
+            default=True,
+            cast_type=bool,
         ),
-        manifest_path=manifest_path,
-        write_mode=write_mode,
-        admin_database=admin_db_override,
-        # Normalize table names to lower-case in staging (configurable; default True)
-        lower_table_names=cast(
-            bool,
-            get_config_value(
-                "LOWER_TABLE_NAMES",
+    )
+
+    def _upload(**files: Any) -> None:
+        upload_parquet(
+            dest_engine,
+            schema=dest_schema,
+            input_dir="data",
+            cleanup=cleanup,
+            write_mode=write_mode,
+            admin_database=admin_db_override,
+            lower_table_names=lower_table_names,
+            **files,
+        )
+
+    def _upload_entity_set(es_name: str, files: List[str]) -> None:
+        # Same table name as an upload of the whole manifest: the file name
+        # without its _partNNNN suffix
+        table = Path(files[0]).stem.rsplit("_part", 1)[0]
+        _upload(table_files={table: files})
+
+    # Disk budget for the data directory; only uploads can free it up
+    spill_max_gb = cast(
+        float,
+        get_config_value(
+            "SPILL_MAX_GB",
+            section="settings",
+            cfg_parser=cfg,
+            default=0,
+            cast_type=float,
+        ),
+    )
+    if spill_max_gb and spill_max_gb > 0 and not cleanup:
+        # Without cleanup, uploaded files stay on disk and the dump would
+        # wait for space that never frees up
+        raise ValueError("SPILL_MAX_GB requires CLEANUP_PARQUET_FILES = True")
+    spill = (
+        SpillManager("data", int(spill_max_gb * 1024**3))
+        if spill_max_gb and spill_max_gb > 0
+        else None
+    )
+    pipelined = get_config_value(
+        "PIPELINED_UPLOAD",
+        section="settings",
+        cfg_parser=cfg,
+        default=False,
+        cast_type=bool,
+    )
+    if spill is not None and not pipelined:
+        log.info("SPILL_MAX_GB is set; uploading each entity set once it is downloaded")
+        pipelined = True
+    pipeline = (
+        UploadPipeline(
+            _upload_entity_set,
+            queue_size=get_config_value(
+                "PIPELINED_UPLOAD_QUEUE",
                 section="settings",
                 cfg_parser=cfg,
-                default=True,
-                cast_type=bool,
+                default=1,
+                cast_type=int,
             ),
-        ),
+            on_done=spill.released if spill is not None else None,
+        )
+        if pipelined
+        else None
     )
 
+    with pipeline if pipeline is not None else nullcontext():
+        manifest_path = download_parquet_odata(
+            client,
+            entity_sets=entities,
+            output_dir="data",
+            page_size=page_size,
+            row_limit=row_limit,
+            log_row_count=log_row_count,
+            per_entity_options=per_entity,
+            parquet_options=parquet_write_options_from_config(cfg),
+            on_table_dumped=pipeline.submit if pipeline is not None else None,
+            spill=spill,
+        )
+
+    if pipeline is None:
+        _upload(manifest_path=manifest_path)
+    elif cleanup and manifest_path:
+        # Every entity set was uploaded (and its files deleted) by the pipeline
+        os.remove(manifest_path)
+    if spill is not None:
+        spill.log_summary()
+
     elapsed = time.perf_counter() - start_time
     log.info("Pipeline complete in %.1fs", elapsed)
 
@@ -0,0 +1,535 @@
+"""Arrow-native direct transfer: ConnectorX record batches straight into a bulk loader.
+
+ConnectorX streams Arrow record batches from the source, column names are
+lowercased and NUL bytes stripped once per batch with Arrow compute, and each
+batch is handed to the destination's bulk loader (`load_arrow`).
+
+Only the PostgreSQL COPY loader keeps a batch in Arrow until it reaches the
+driver (the CSV is written by pyarrow). The SQL Server, Oracle and MySQL
+loaders convert each batch column-wise to Python values and zip them into row
+tuples, because their drivers take Python parameter sequences (and MySQL's
+LOAD DATA file is rendered in Python); that still avoids a dict per row and
+the Parquet round trip, but not per-row Python objects.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Callable, Collection, Iterator, Mapping, Sequence
+
+import connectorx as cx
+import pyarrow as pa
+import pyarrow.compute as pc
+from sqlalchemy import Column, MetaData, Table
+from sqlalchemy import types as satypes
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+
+from sql_to_staging.functions.chunk_sizing import ChunkSizer, connectorx_row_bytes
+from sql_to_staging.functions.checkpoints import CheckpointStore
+from sql_to_staging.functions.connectorx_sql import (
+    connectorx_select,
+    connectorx_target,
+)
+from sql_to_staging.functions.direct_transfer import (
+    TableTransferResult,
+    _coerce_generic_type,
+    _log_summary,
+    _prepare_destination_table,
+    _write_with_retry,
+)
+from sql_to_staging.functions.partitioning import (
+    connectorx_partition_kwargs,
+    table_partitions,
+)
+from sql_to_staging.functions.projection import (
+    connectorx_columns,
+    drop_arrow_column,
+    table_where,
+)
+from sql_to_staging.functions.source_queries import source_query_sql, table_query
+from sql_to_staging.functions.row_estimates import (
+    format_progress,
+    report_row_count,
+    source_row_count,
+)
+from utils.bulk_load import BulkLoader, get_bulk_loader
+from utils.database.dialects import connectorx_scheme
+from utils.database.ensure_db import ensure_database_and_schema
+from utils.database.minimal_logging import (
+    attach_minimal_logging,
+    unlogged_table_kwargs,
+)
+from utils.database.swap import (
+    drop_shadow_tables,
+    new_run_id,
+    shadow_table_name,
+    swap_table,
+)
+from utils.logging.metrics import (
+    TableMetrics,
+    TransferMetrics,
+    timed,
+    timed_iter,
+)
+
+logger = logging.getLogger("sql_to_staging.arrow_transfer")
+
+
+def _arrow_to_sqlalchemy_type(t: pa.DataType) -> satypes.TypeEngine:
+    """Map an Arrow type to a generic SQLAlchemy type for destination DDL."""
+    if pa.types.is_dictionary(t):
+        return _arrow_to_sqlalchemy_type(t.value_type)
+    if pa.types.is_boolean(t):
+        return satypes.Boolean()
+    if pa.types.is_int8(t) or pa.types.is_int16(t) or pa.types.is_uint8(t):
+        return satypes.SmallInteger()
+    if pa.types.is_int32(t) or pa.types.is_uint16(t):
+        return satypes.Integer()
+    if pa.types.is_integer(t):
+        return satypes.BigInteger()
+    if pa.types.is_floating(t):
+        return satypes.Float(precision=24 if t.bit_width <= 32 else 53)
+    if pa.types.is_decimal(t):
+        return satypes.Numeric(precision=t.precision, scale=t.scale)
+    if pa.types.is_timestamp(t):
+        return satypes.DateTime(timezone=t.tz is not None)
+    if pa.types.is_date(t):
+        return satypes.Date()
+    if pa.types.is_time(t):
+        return satypes.Time()
+    if pa.types.is_binary(t) or pa.types.is_large_binary(t):
+        return satypes.LargeBinary()
+    # Strings, all-null columns and anything else land in an unbounded text column
+    return satypes.Text()
+
+
+def _build_arrow_destination_table(
+    schema: pa.Schema,
+    dest_meta: MetaData,
+    dest_table_name: str,
+    dest_schema: str | None,
+    lowercase_columns: bool,
+    *,
+    dest_dialect: str,
+    minimal_logging: bool = False,
+) -> Table:
+    """Mirror an Arrow schema as a destination Table using the direct-transfer type rules."""
+    cols: list[Column] = []
+    for field in schema:
+        name = field.name.lower() if lowercase_columns else field.name
+        generic = Column(name, _arrow_to_sqlalchemy_type(field.type))
+        portable_type = _coerce_generic_type(generic, "arrow", dest_dialect)
+        cols.append(Column(name, portable_type, nullable=True))
+    if not minimal_logging:
+        return Table(dest_table_name, dest_meta, *cols, schema=dest_schema)
+    table = Table(
+        dest_table_name,
+        dest_meta,
+        *cols,
+        schema=dest_schema,
+        **unlogged_table_kwargs(dest_dialect),
+    )
+    return attach_minimal_logging(table, dest_dialect)
+
+
+def _normalize_batch(
+    batch: pa.RecordBatch, *, lowercase_columns: bool, strip_nul: bool
+) -> pa.RecordBatch:
+    """Lowercase column names and optionally strip NUL from string columns."""
+    if lowercase_columns:
+        batch = batch.rename_columns([n.lower() for n in batch.schema.names])
+    if not strip_nul:
+        return batch
+    arrays = []
+    for field, column in zip(batch.schema, batch.columns):
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            column = pc.replace_substring(column, "\x00", "")
+        arrays.append(column)
+    return pa.RecordBatch.from_arrays(arrays, names=batch.schema.names)
+
+
+def _iter_record_batches(reader: Any) -> Iterator[pa.RecordBatch]:
+    """Iterate a RecordBatchReader (or any iterable of batches), skipping empty ones."""
+    try:
+        iterator = iter(reader)
+    except TypeError:
+
+        def _read() -> Iterator[pa.RecordBatch]:
+            while True:
+                batch = reader.read_next_batch()
+                if batch is None:
+                    return
+                yield batch
+
+        iterator = _read()
+    for batch in iterator:
+        if batch.num_rows:
+            yield batch
+
+
+def _transfer_table(
+    uri: str,
+    dest_engine: Engine,
+    table_name: str,
+    *,
+    source_schema: str | None,
+    dest_schema: str | None,
+    chunk_size: int,
+    lowercase_columns: bool,
+    write_mode: str,
+    row_limit: int | None,
+    log_row_count: bool,
+    max_retries: int,
+    backoff_base_seconds: float,
+    backoff_max_seconds: float,
+    partitions: int,
+    partition_column: str | None,
+    loader: BulkLoader | None,
+    memory_budget_mb: int | None = None,
+    exact_row_count: bool = False,
+    shadow_run_id: str | None = None,
+    minimal_logging: bool = False,
+    columns: Sequence[str] | None = None,
+    where: str | None = None,
+    query: str | None = None,
+    metrics: TableMetrics | None = None,
+) -> int:
+    scheme = connectorx_scheme(uri)
+    quoted_src = connectorx_target(scheme, source_schema, table_name)
+
+    def _select(limit: int | None) -> str:
+        if query is not None:
+            return source_query_sql(scheme, query, limit, where=where, columns=columns)
+        return connectorx_select(
+            scheme, quoted_src, limit, where=where, columns=columns
+        )
+
+    qualified_dst = f"{dest_schema}.{table_name}" if dest_schema else table_name
+    dest_dialect = dest_engine.dialect.name.lower()
+    logger.info(
+        "Copying table %s -> %s via Arrow (chunk_size=%s)",
+        quoted_src,
+        qualified_dst,
+        chunk_size,
+    )
+
+    expected_rows: int | None = None
+    if query is not None:
+        logger.info("   (custom source query; row count skipped)")
+    elif log_row_count:
+        expected_rows = source_row_count(
+            uri, source_schema, table_name, exact=exact_row_count
+        )
+        report_row_count(expected_rows, exact=exact_row_count, source=uri)
+        if where:
+            # The count of the whole table says nothing about a filtered read
+            expected_rows = None
+        if expected_rows is not None and row_limit and row_limit > 0:
+            expected_rows = min(expected_rows, row_limit)
+    else:
+        logger.info("   (row count skipped; LOG_ROW_COUNT disabled)")
+
+    cx_kwargs = connectorx_partition_kwargs(
+        uri,
+        source_schema,
+        table_name,
+        partitions,
+        partition_column,
+        row_limit=row_limit,
+        is_query=query is not None,
+    )
+    partition_on = cx_kwargs.get("partition_on")
+    # Read only to split the query; not part of the SRC_COLUMNS projection
+    helper_column: str | None = None
+    if (
+        partition_on
+        and columns is not None
+        and partition_on.lower() not in {c.lower() for c in columns}
+    ):
+        columns = [*columns, partition_on]
+        helper_column = partition_on
+
+    batch_size = chunk_size
+    if memory_budget_mb:
+        # Arrow bytes per row of a small sample; the batches in flight are the
+        # one being read and the one being loaded, per ConnectorX partition
+        row_bytes = connectorx_row_bytes(uri, _select(1_000))
+        if row_bytes is not None:
+            sizer = ChunkSizer(
+                memory_budget_mb,
+                row_bytes,
+                label=table_name,
+                in_flight=2 * cx_kwargs.get("partition_num", 1),
+            )
+            sizer.log_choice()
+            batch_size = sizer.fixed_size("ConnectorX")
+
+    reader = cx.read_sql(
+        uri,
+        _select(row_limit),
+        return_type="arrow_stream",
+        batch_size=batch_size,
+        **cx_kwargs,
+    )
+
+    retry_kwargs = dict(
+        max_retries=max_retries,
+        backoff_base_seconds=backoff_base_seconds,
+        backoff_max_seconds=backoff_max_seconds,
+    )
+    dest_table: Table | None = None
+
+    load_name = table_name
+    if write_mode == "replace" and shadow_run_id is not None:
+        load_name = shadow_table_name(table_name, shadow_run_id)
+        drop_shadow_tables(dest_engine, schema=dest_schema, target=table_name)
+        logger.info("   (loading into shadow table %s)", load_name)
+
+    def _ensure_table(schema: pa.Schema) -> Table:
+        table = _build_arrow_destination_table(
+            schema,
+            MetaData(),
+            dest_table_name=load_name,
+            dest_schema=dest_schema,
+            lowercase_columns=lowercase_columns,
+            dest_dialect=dest_dialect,
+            minimal_logging=minimal_logging,
+        )
+        _prepare_destination_table(
+            dest_engine,
+            table,
+            dest_schema=dest_schema,
+            table_name=load_name,
+            write_mode=write_mode,
+        )
+        return table
+
+    # The reader knows the result schema even when the table is empty
+    reader_schema = getattr(reader, "schema", None)
+    if isinstance(reader_schema, pa.Schema):
+        if helper_column is not None:
+            reader_schema = pa.schema(
+                f for f in reader_schema if f.name.lower() != helper_column.lower()
+            )
+        dest_table = _ensure_table(reader_schema)
+
+    started = time.perf_counter()
+    inserted_total = 0
+    for raw_batch in timed_iter(_iter_record_batches(reader), metrics, "fetch"):
+        if helper_column is not None:
+            raw_batch = drop_arrow_column(raw_batch, helper_column)
+        with timed(metrics, "transform"):
+            batch = _normalize_batch(
+                raw_batch,
+                lowercase_columns=lowercase_columns,
+                strip_nul=dest_dialect == "postgresql" and loader is None,
+            )
+        if dest_table is None:
+            dest_table = _ensure_table(raw_batch.schema)
+        target = dest_table
+
+        def _write(dconn: Connection, data: pa.RecordBatch = batch) -> int:
+            if loader is not None:
+                # Rows rejected by Oracle batch errors are not counted
+                return loader.load_arrow(dconn, target, data)
+            dconn.execute(target.insert(), data.to_pylist())
+            return data.num_rows
+
+        with timed(metrics, "insert"):
+            try:
+                written = _write_with_retry(dest_engine, _write, **retry_kwargs)
+            except DBAPIError as e:
+                if loader is None:
+                    raise
+                logger.warning(
+                    "   %s: %s bulk load failed, falling back to INSERT: %s",
+                    table_name,
+                    loader.name,
+                    e,
+                )
+                loader = None
+                batch = _normalize_batch(
+                    batch,
+                    lowercase_columns=False,
+                    strip_nul=dest_dialect == "postgresql",
+                )
+                _write_with_retry(
+                    dest_engine,
+                    lambda dconn: dconn.execute(target.insert(), batch.to_pylist()),
+                    **retry_kwargs,
+                )
+                written = batch.num_rows
+
+        inserted_total += written
+        if metrics is not None:
+            metrics.add_chunk(written, batch.nbytes)
+        logger.info(
+            "   %s: inserted %s rows (total %s%s)",
+            table_name,
+            written,
+            inserted_total,
+            format_progress(
+                inserted_total, expected_rows, time.perf_counter() - started
+            ),
+        )
+
+    if dest_table is None:
+        logger.info("   (no rows and no result schema; destination table not created)")
+    elif load_name != table_name:
+        swap_table(dest_engine, schema=dest_schema, target=table_name, shadow=load_name)
+    logger.info("Finished table %s (%s rows)", qualified_dst, f"{inserted_total:,}")
+    return inserted_total
+
+
+def arrow_transfer(
+    source_uri: str,
+    dest_engine: Engine,
+    tables: Sequence[str],
+    *,
+    source_schema: str | None = None,
+    dest_schema: str | None = None,
+    chunk_size: int = 100_000,
+    lowercase_columns: bool = True,
+    write_mode: str = "replace",  # replace | truncate | append
+    row_limit: int | None = None,
+    log_row_count: bool = True,
+    max_retries: int = 3,
+    backoff_base_seconds: float = 0.5,
+    backoff_max_seconds: float = 8.0,
+    admin_database: str | None = None,
+    partitions: int = 1,
+    table_options: Mapping[str, Mapping[str, str]] | None = None,
+    bulk_load: bool = True,
+    bulk_load_options: Mapping[str, Any] | None = None,
+    checkpoints: CheckpointStore | None = None,
+    memory_budget_mb: int | None = None,
+    exact_row_count: bool = False,
+    shadow_load: bool = False,
+    minimal_logging: bool = False,
+    unchanged_tables: Collection[str] | None = None,
+    on_table_loaded: Callable[[str], None] | None = None,
+    metrics: TransferMetrics | None = None,
+) -> list[TableTransferResult]:
+    """
+    Copy listed tables from a ConnectorX source URI into the destination engine
+    as Arrow record batches (TRANSFER_MODE=ARROW_DIRECT).
+
+    - Reads with ConnectorX `arrow_stream` in batches of `chunk_size` rows.
+    - Destination tables are created from the Arrow schema using the same type
+      rules as `direct_transfer`, honoring write_mode.
+    - Batches go to the destination's native bulk loader (`load_arrow`). Without
+      one (or after a loader error) batches are inserted with executemany, which
+      does build Python rows.
+    - Partitioning uses ConnectorX partition_on/partition_num on the configured
+      partition column, or on the first integer primary key column.
+    - With checkpoints, finished tables are recorded; a store opened with
+      resume=True skips them (tables are resumed as a whole, not per batch).
+    - With memory_budget_mb, the batch size per table is derived from the
+      budget and the Arrow size of a small sample instead of chunk_size.
+    - Row counts for progress/ETA logging are catalog-statistics estimates,
+      or COUNT(*) with exact_row_count.
+    - With shadow_load, write_mode "replace" loads into `<table>__load_<runid>`
+      and swaps it into place once the table is complete.
+    - With minimal_logging, created tables are UNLOGGED (PostgreSQL) or
+      NOLOGGING (Oracle).
+    - Per-table "columns" and "where" options are pushed down to the
+      ConnectorX query; the destination table follows the selected columns.
+    - Tables with a "query" option (SRC_QUERY_<table>) load the result of
+      that SELECT instead of a source table, typed from its Arrow schema.
+    - Tables in unchanged_tables are skipped and reported as such in the
+      summary; on_table_loaded is called after every table that was loaded.
+    - Every batch is timed as fetch, transform and insert, logged per table
+      and collected in `metrics` (see utils.logging.metrics).
+
+    Stops at the first failing table; returns one TableTransferResult per table.
+    """
+    assert chunk_size > 0, "chunk_size must be > 0"
+    if write_mode not in {"replace", "truncate", "append"}:
+        raise ValueError("write_mode must be one of: replace|truncate|append")
+
+    ensure_database_and_schema(dest_engine, dest_schema, admin_database=admin_database)
+
+    loader = (
+        get_bulk_loader(
+            dest_engine, {**(bulk_load_options or {}), "write_mode": write_mode}
+        )
+        if bulk_load
+        else None
+    )
+    if loader is None:
+        logger.warning(
+            "No native bulk loader for %s destination (or BULK_LOAD disabled); "
+            "ARROW_DIRECT falls back to executemany inserts",
+            dest_engine.dialect.name,
+        )
+
+    started = time.perf_counter()
+    metrics = metrics if metrics is not None else TransferMetrics()
+    shadow_run_id = new_run_id() if shadow_load else None
+    results: list[TableTransferResult] = []
+    for table_name in tables:
+        if table_name in (unchanged_tables or ()):
+            results.append(TableTransferResult(table_name, skipped=True))
+            continue
+        if checkpoints is not None and checkpoints.is_done(table_name):
+            rows = int((checkpoints.get(table_name) or {}).get("rows") or 0)
+            logger.info("Skipping table %s (finished in the resumed run)", table_name)
+            results.append(TableTransferResult(table_name, rows=rows))
+            continue
+        t0 = time.perf_counter()
+        n_partitions, partition_column = table_partitions(
+            table_options, table_name, partitions
+        )
+        table_metrics = metrics.table("arrow_transfer", table_name)
+        try:
+            rows = _transfer_table(
+                source_uri,
+                dest_engine,
+                table_name,
+                source_schema=source_schema,
+                dest_schema=dest_schema,
+                chunk_size=chunk_size,
+                lowercase_columns=lowercase_columns,
+                write_mode=write_mode,
+                row_limit=row_limit,
+                log_row_count=log_row_count,
+                max_retries=max_retries,
+                backoff_base_seconds=backoff_base_seconds,
+                backoff_max_seconds=backoff_max_seconds,
+                partitions=n_partitions,
+                partition_column=partition_column,
+                loader=loader,
+                memory_budget_mb=memory_budget_mb,
+                exact_row_count=exact_row_count,
+                shadow_run_id=shadow_run_id,
+                minimal_logging=minimal_logging,
+                columns=connectorx_columns(table_options, table_name),
+                where=table_where(table_options, table_name),
+                query=table_query(table_options, table_name),
+                metrics=table_metrics,
+            )
+        except Exception as e:
+            table_metrics.finish()
+            results.append(
+                TableTransferResult(
+                    table_name, seconds=time.perf_counter() - t0, error=e
+                )
+            )
+            _log_summary(results, time.perf_counter() - started)
+            raise
+        metrics.log_table(table_metrics)
+        if checkpoints is not None:
+            checkpoints.mark_done(table_name, rows=rows)
+        if on_table_loaded is not None:
+            on_table_loaded(table_name)
+        results.append(
+            TableTransferResult(table_name, rows=rows, seconds=time.perf_counter() - t0)
+        )
+
+    _log_summary(results, time.perf_counter() - started)
+    return results
+
+
+__all__ = ["arrow_transfer"]
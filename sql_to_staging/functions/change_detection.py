@@ -0,0 +1,248 @@
+"""Skip unchanged tables (CHANGE_DETECTION).
+
+Code tables and other slowly changing tables are often identical between runs
+but would still be copied completely. With change detection, a cheap
+fingerprint of every source table is read before the copy:
+
+- with SRC_CHANGE_COLUMN_<table> (e.g. a mutation timestamp): COUNT(*) and
+  MAX of that column, on any dialect
+- otherwise an aggregate hash over all rows:
+  - PostgreSQL: md5 of the ordered md5 hashes of the row texts
+  - SQL Server: CHECKSUM_AGG(BINARY_CHECKSUM(*))
+  - Oracle: SUM(ORA_HASH(...)) over the non-LOB columns
+  - MySQL/MariaDB: SUM(CRC32(CONCAT_WS(...))) over all columns
+
+The fingerprint (combined with the table's extraction settings) is stored in
+a small state table in the destination schema once the table was loaded. A
+table is skipped when its fingerprint equals the stored one and the staging
+table still exists. Tables without a fingerprint (e.g. SQLite sources without
+a change column, or custom source queries) are always copied.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Mapping, Sequence
+
+import connectorx as cx
+from sqlalchemy import Column, DateTime, MetaData, String, Table, Text, inspect
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+
+from sql_to_staging.functions.source_queries import table_query
+from utils.database.dialects import dialect_of, sql_literal
+from utils.database.identifiers import quote_fqn, quote_ident
+
+logger = logging.getLogger("sql_to_staging.change_detection")
+
+# Name of the state table in the destination schema
+STATE_TABLE = "sql_to_staging_fingerprints"
+
+# Per-table options that change what ends up in the staging table
+_SETTING_OPTIONS = ("columns", "where", "change_column")
+
+
+def columns_query(dialect: str, schema: str | None, table: str) -> str | None:
+    """SQL listing the hashable columns of a table, for dialects hashing per column."""
+    if dialect == "oracle":
+        owner = f"UPPER({sql_literal(schema)})" if schema else "USER"
+        # ORA_HASH does not accept LOBs; changes in LOB columns go unnoticed
+        return (
+            "SELECT COLUMN_NAME FROM ALL_TAB_COLUMNS "
+            f"WHERE OWNER = {owner} "
+            f"AND TABLE_NAME IN ({sql_literal(table)}, UPPER({sql_literal(table)})) "
+            "AND DATA_TYPE NOT IN ('CLOB', 'NCLOB', 'BLOB', 'BFILE', 'LONG', 'LONG RAW') "
+            "ORDER BY COLUMN_ID"
+        )
+    if dialect in ("mysql", "mariadb"):
+        db = sql_literal(schema) if schema else "DATABASE()"
+        return (
+            "SELECT COLUMN_NAME FROM information_schema.COLUMNS "
+            f"WHERE TABLE_SCHEMA = {db} AND TABLE_NAME = {sql_literal(table)} "
+            "ORDER BY ORDINAL_POSITION"
+        )
+    return None
+
+
+def fingerprint_query(
+    dialect: str,
+    qualified: str,
+    *,
+    change_column: str | None = None,
+    columns: Sequence[str] | None = None,
+) -> str | None:
+    """SQL returning one row that changes with the table's data, or None if unsupported."""
+    if change_column:
+        return f"SELECT COUNT(*), MAX({change_column}) FROM {qualified}"
+    if dialect == "postgresql":
+        return (
+            "SELECT COUNT(*), md5(string_agg(md5(t::text), '' ORDER BY md5(t::text))) "
+            f"FROM {qualified} t"
+        )
+    if dialect == "mssql":
+        return f"SELECT COUNT_BIG(*), CHECKSUM_AGG(BINARY_CHECKSUM(*)) FROM {qualified}"
+    if not columns:
+        return None
+    quoted = [quote_ident(dialect, c) for c in columns]
+    if dialect == "oracle":
+        row = " || '|' || ".join(quoted)
+        return f"SELECT COUNT(*), SUM(ORA_HASH({row})) FROM {qualified}"
+    if dialect in ("mysql", "mariadb"):
+        # ISNULL markers keep (NULL, 'a') and ('a', NULL) apart
+        parts = ", ".join(f"{c}, ISNULL({c})" for c in quoted)
+        return f"SELECT COUNT(*), SUM(CRC32(CONCAT_WS('|', {parts}))) FROM {qualified}"
+    return None
+
+
+def _rows(source: Engine | str, sql: str) -> list[tuple]:
+    if isinstance(source, Engine):
+        with source.connect() as conn:
+            return [tuple(r) for r in conn.exec_driver_sql(sql).all()]
+    result = cx.read_sql(source, sql, return_type="arrow")
+    return [tuple(r.values()) for r in result.to_pylist()]
+
+
+def table_fingerprint(
+    source: Engine | str,
+    schema: str | None,
+    table: str,
+    *,
+    change_column: str | None = None,
+    settings: Any = None,
+) -> str | None:
+    """
+    Fingerprint of the table's data (and the extraction settings), or None
+    when it cannot be computed cheaply.
+    """
+    dialect = dialect_of(source)
+    parts = [schema, table] if schema else [table]
+    try:
+        qualified = quote_fqn(source if isinstance(source, Engine) else dialect, parts)
+    except Exception:
+        qualified = ".".join(parts)
+    try:
+        columns = None
+        listing = None if change_column else columns_query(dialect, schema, table)
+        if listing is not None:
+            columns = [r[0] for r in _rows(source, listing)]
+        sql = fingerprint_query(
+            dialect, qualified, change_column=change_column, columns=columns
+        )
+        if sql is None:
+            return None
+        values = _rows(source, sql)
+    except Exception as e:
+        logger.warning("Failed to read change fingerprint for %s: %s", table, e)
+        return None
+    payload = json.dumps([settings, [str(v) for v in values[0]]], default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class FingerprintStore:
+    """Fingerprints of the last loaded state per table, in the destination."""
+
+    def __init__(
+        self, engine: Engine, schema: str | None = None, table_name: str = STATE_TABLE
+    ):
+        self.engine = engine
+        self.table = Table(
+            table_name,
+            MetaData(),
+            Column("table_name", String(255), primary_key=True),
+            Column("fingerprint", Text),
+            Column("updated_at", DateTime),
+            schema=schema,
+        )
+
+    def ensure(self) -> None:
+        with self.engine.begin() as conn:
+            self.table.create(bind=conn, checkfirst=True)
+
+    def get(self, table: str) -> str | None:
+        t = self.table
+        with self.engine.connect() as conn:
+            return conn.execute(
+                select(t.c.fingerprint).where(t.c.table_name == table)
+            ).scalar()
+
+    def save(self, table: str, fingerprint: str) -> None:
+        t = self.table
+        with self.engine.begin() as conn:
+            conn.execute(t.delete().where(t.c.table_name == table))
+            conn.execute(
+                t.insert().values(
+                    table_name=table, fingerprint=fingerprint, updated_at=datetime.now()
+                )
+            )
+
+
+@dataclass
+class ChangeDetection:
+    """Outcome of comparing the source fingerprints with the stored ones."""
+
+    store: FingerprintStore
+    unchanged: list[str] = field(default_factory=list)
+    fingerprints: dict[str, str] = field(default_factory=dict)
+
+    def save(self, table: str) -> None:
+        """Record the fingerprint read for `table` once it has been loaded."""
+        fingerprint = self.fingerprints.get(table)
+        if fingerprint is not None:
+            self.store.save(table, fingerprint)
+
+
+def detect_changes(
+    source: Engine | str,
+    tables: Sequence[str],
+    store: FingerprintStore,
+    *,
+    source_schema: str | None = None,
+    table_options: Mapping[str, Mapping[str, str]] | None = None,
+    row_limit: int | None = None,
+) -> ChangeDetection:
+    """Read the fingerprint of every table and find the ones that did not change."""
+    store.ensure()
+    dest = inspect(store.engine)
+    result = ChangeDetection(store)
+    for table in tables:
+        opts = (table_options or {}).get(table, {})
+        if table_query(table_options, table) is not None:
+            continue
+        fingerprint = table_fingerprint(
+            source,
+            source_schema,
+            table,
+            change_column=opts.get("change_column"),
+            settings={
+                "options": {k: opts[k] for k in _SETTING_OPTIONS if k in opts},
+                "row_limit": row_limit or None,
+            },
+        )
+        if fingerprint is None:
+            logger.info("Change detection: %s has no fingerprint; copying", table)
+            continue
+        result.fingerprints[table] = fingerprint
+        if store.get(table) == fingerprint and dest.has_table(
+            table, schema=store.table.schema
+        ):
+            result.unchanged.append(table)
+    if result.unchanged:
+        logger.info(
+            "Change detection: %d unchanged table(s) skipped: %s",
+            len(result.unchanged),
+            ", ".join(result.unchanged),
+        )
+    return result
+
+
+__all__ = [
+    "ChangeDetection",
+    "FingerprintStore",
+    "detect_changes",
+    "fingerprint_query",
+    "table_fingerprint",
+]
@@ -0,0 +1,179 @@
+"""Run checkpoints for resumable extraction (`--resume`).
+
+A small JSON file records, per table, whether it finished in the current run
+(in the dump modes: dumped, and uploaded) and, for keyset-paginated tables,
+the last key that was committed (direct transfer) or written to a Parquet
+part (dump modes). A run started with
+`--resume` continues from that file; a run without it starts fresh. The file
+is removed once a run completes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from typing import Any
+
+logger = logging.getLogger("sql_to_staging.checkpoints")
+
+
+def encode_key(value: Any) -> Any:
+    """Encode a keyset value as JSON, keeping its Python type."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, datetime):
+        return {"type": "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {"type": "date", "value": value.isoformat()}
+    if isinstance(value, time):
+        return {"type": "time", "value": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"type": "decimal", "value": str(value)}
+    raise TypeError(f"Unsupported keyset value type: {type(value).__name__}")
+
+
+def decode_key(value: Any) -> Any:
+    """Inverse of encode_key."""
+    if not isinstance(value, dict):
+        return value
+    kind, raw = value.get("type"), value.get("value")
+    if kind == "datetime":
+        return datetime.fromisoformat(raw)
+    if kind == "date":
+        return date.fromisoformat(raw)
+    if kind == "time":
+        return time.fromisoformat(raw)
+    if kind == "decimal":
+        return Decimal(raw)
+    raise ValueError(f"Unknown keyset value type in checkpoint: {kind!r}")
+
+
+class CheckpointStore:
+    """
+    Thread-safe per-table checkpoint state persisted to a JSON file.
+
+    Each table entry is a plain dict (e.g. {"done": True, "rows": 10} or
+    {"keyset_column": "id", "last_key": 500, "rows": 500}); every update is
+    written atomically (temp file + rename) so a crash never leaves a
+    half-written checkpoint behind.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        scope: str = "",
+        tables: dict[str, dict[str, Any]] | None = None,
+        meta: dict[str, Any] | None = None,
+    ):
+        self.path = path
+        self.scope = scope
+        self._tables: dict[str, dict[str, Any]] = tables or {}
+        # Run-level values that must survive a resume (e.g. incremental plans)
+        self._meta: dict[str, Any] = meta or {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, path: str, *, scope: str = "", resume: bool = False):
+        """
+        Load the checkpoint at path when resuming, else start with an empty one.
+
+        A checkpoint written for a different scope (e.g. another transfer mode
+        or table list) is ignored with a warning.
+        """
+        if not resume:
+            if os.path.exists(path):
+                logger.info("Discarding previous checkpoint %s (no --resume)", path)
+                os.remove(path)
+            return cls(path, scope=scope)
+        if not os.path.exists(path):
+            logger.info("No checkpoint found at %s; starting from scratch", path)
+            return cls(path, scope=scope)
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("scope") != scope:
+            logger.warning(
+                "Checkpoint %s was written for %r, not %r; starting from scratch",
+                path,
+                data.get("scope"),
+                scope,
+            )
+            return cls(path, scope=scope)
+        tables = data.get("tables") or {}
+        logger.info(
+            "Resuming from checkpoint %s (%d table(s) recorded)", path, len(tables)
+        )
+        return cls(path, scope=scope, tables=tables, meta=data.get("meta") or {})
+
+    def get(self, table: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._tables.get(table)
+            return dict(entry) if entry is not None else None
+
+    def is_done(self, table: str) -> bool:
+        entry = self.get(table)
+        return bool(entry and entry.get("done"))
+
+    def update(self, table: str, **fields: Any) -> None:
+        """Merge fields into the table entry and persist the checkpoint."""
+        with self._lock:
+            self._tables.setdefault(table, {}).update(fields)
+            self._write()
+
+    def mark_done(self, table: str, **fields: Any) -> None:
+        self.update(table, done=True, **fields)
+
+    def is_uploaded(self, table: str) -> bool:
+        entry = self.get(table)
+        return bool(entry and entry.get("uploaded"))
+
+    def mark_uploaded(self, table: str) -> None:
+        """The dumped files of table were loaded into the destination (dump modes)."""
+        self.update(table, uploaded=True)
+
+    def get_meta(self, key: str) -> Any:
+        with self._lock:
+            return self._meta.get(key)
+
+    def set_meta(self, key: str, value: Any) -> None:
+        """Store a run-level value next to the table entries and persist it."""
+        with self._lock:
+            self._meta[key] = value
+            self._write()
+
+    def reset(self, table: str) -> None:
+        """Forget any previous progress of table."""
+        with self._lock:
+            if self._tables.pop(table, None) is not None:
+                self._write()
+
+    def clear(self) -> None:
+        """Remove the checkpoint file once the run has completed."""
+        with self._lock:
+            self._tables = {}
+            self._meta = {}
+            if os.path.exists(self.path):
+                os.remove(self.path)
+                logger.info("Run completed; checkpoint %s removed", self.path)
+
+    def _write(self) -> None:
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        payload = {
+            "scope": self.scope,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "tables": self._tables,
+            "meta": self._meta,
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+__all__ = ["CheckpointStore", "encode_key", "decode_key"]
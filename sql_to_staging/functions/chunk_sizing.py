@@ -0,0 +1,251 @@
+"""Memory-budgeted chunk sizing (MEMORY_BUDGET_MB).
+
+Instead of a fixed SRC_CHUNK_SIZE, the number of rows per chunk is derived per
+table from a memory budget: an initial bytes-per-row estimate (from the
+reflected column types, or from a small ConnectorX sample) is refined with the
+measured size of the batches actually read. Half of the budget is reserved for
+the chunks in flight (prefetch queue, partitions, parallel tables); the rest
+is left for the process itself. When the process RSS approaches the budget the
+chunk size is halved until memory drops again (backpressure).
+
+Backpressure and refinement need a reader that asks for every chunk (SQLAlchemy
+fetchmany, keyset pages). ConnectorX arrow streams and pl.read_database fix
+their batch size when the query starts; there the budget only sets that size
+(`ChunkSizer.fixed_size`) and a warning is logged.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+from typing import Iterable, Sequence
+
+import connectorx as cx
+from sqlalchemy import Table
+from sqlalchemy import types as satypes
+
+logger = logging.getLogger("sql_to_staging.chunk_sizing")
+
+MIN_CHUNK_ROWS = 1_000
+MAX_CHUNK_ROWS = 1_000_000
+
+# Share of the budget used for the chunks in flight
+_CHUNK_SHARE = 0.5
+# RSS thresholds (fraction of the budget) for shrinking and growing chunks again
+_RSS_HIGH = 0.9
+_RSS_LOW = 0.7
+
+# Rows sampled to measure a batch of Python rows
+_SAMPLE_ROWS = 100
+# Rough in-memory size of one row of dicts before its values
+_ROW_OVERHEAD = 240
+
+
+def current_rss_bytes() -> int | None:
+    """Resident set size of this process, or None when it cannot be measured."""
+    try:
+        import psutil  # type: ignore[import-not-found]
+
+        return int(psutil.Process().memory_info().rss)
+    except ImportError:
+        pass
+    except Exception:
+        return None
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError, IndexError):
+        return None
+
+
+def _value_bytes(t: satypes.TypeEngine) -> int:
+    """Estimated in-memory size of one Python value of type t."""
+    if isinstance(t, satypes.Boolean):
+        return 28
+    if isinstance(t, satypes.Integer):
+        return 32
+    if isinstance(t, satypes.Float):
+        return 24
+    if isinstance(t, satypes.Numeric):
+        return 104
+    if isinstance(t, satypes.DateTime):
+        return 48
+    if isinstance(t, (satypes.Date, satypes.Time, satypes.Interval)):
+        return 40
+    if isinstance(t, satypes.LargeBinary):
+        length = getattr(t, "length", None)
+        return 33 + min(length or 8_000, 8_000)
+    if isinstance(t, satypes.Text) or (
+        isinstance(t, satypes.String) and getattr(t, "length", None) is None
+    ):
+        # CLOB-ish columns: assume a few KB per value
+        return 49 + 4_000
+    if isinstance(t, satypes.String):
+        return 49 + min(t.length or 255, 4_000)
+    return 64
+
+
+def estimate_row_bytes(types: Iterable[satypes.TypeEngine]) -> int:
+    """Estimated in-memory bytes of one row with columns of the given types."""
+    return _ROW_OVERHEAD + sum(8 + _value_bytes(t) for t in types)
+
+
+def measure_batch_bytes(batch: Sequence[dict]) -> int:
+    """Approximate in-memory bytes of a batch of dict rows (sampled)."""
+    if not batch:
+        return 0
+    sample = batch[:_SAMPLE_ROWS]
+    sampled = sum(
+        sys.getsizeof(row) + sum(sys.getsizeof(v) for v in row.values())
+        for row in sample
+    )
+    return int(sampled * len(batch) / len(sample))
+
+
+def connectorx_row_bytes(uri: str, sample_query: str) -> int | None:
+    """Bytes per row of a small Arrow sample read via ConnectorX (None if empty)."""
+    try:
+        sample = cx.read_sql(uri, sample_query, return_type="arrow")
+    except Exception as e:
+        logger.warning("Failed to sample row size via ConnectorX: %s", e)
+        return None
+    if not sample.num_rows:
+        return None
+    return max(1, sample.nbytes // sample.num_rows)
+
+
+class ChunkSizer:
+    """
+    Thread-safe chunk size for one table within a memory budget.
+
+    `next_size()` returns the rows to read for the next chunk (applying RSS
+    backpressure); `observe()` refines the bytes-per-row estimate with a batch
+    that was actually read. One sizer may be shared by the partitions of a table.
+    """
+
+    def __init__(
+        self,
+        budget_mb: int,
+        row_bytes: int,
+        *,
+        label: str,
+        in_flight: int = 1,
+        min_rows: int = MIN_CHUNK_ROWS,
+        max_rows: int = MAX_CHUNK_ROWS,
+    ):
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self.label = label
+        self.in_flight = max(1, in_flight)
+        self.min_rows = min_rows
+        self.max_rows = max(min_rows, max_rows)
+        self.row_bytes = max(1, row_bytes)
+        self._measured = False
+        self._target = self._fit()
+        self._size = self._target
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_table(
+        cls, budget_mb: int, table: Table, *, label: str, in_flight: int = 1
+    ) -> "ChunkSizer":
+        """Sizer with an initial estimate from the reflected column types."""
+        return cls(
+            budget_mb,
+            estimate_row_bytes(c.type for c in table.columns),
+            label=label,
+            in_flight=in_flight,
+        )
+
+    @property
+    def chunk_size(self) -> int:
+        with self._lock:
+            return self._size
+
+    def _fit(self) -> int:
+        rows = int(self.budget_bytes * _CHUNK_SHARE / self.in_flight / self.row_bytes)
+        return max(self.min_rows, min(self.max_rows, rows))
+
+    def log_choice(self) -> None:
+        logger.info(
+            "   (%s: chunk size %s rows; ~%s bytes/row, %d chunk(s) in flight, "
+            "MEMORY_BUDGET_MB=%s)",
+            self.label,
+            f"{self._target:,}",
+            f"{self.row_bytes:,}",
+            self.in_flight,
+            self.budget_bytes // (1024 * 1024),
+        )
+
+    def next_size(self) -> int:
+        """Rows for the next chunk; halved while RSS is near the budget."""
+        rss = current_rss_bytes()
+        with self._lock:
+            if rss is not None and rss >= self.budget_bytes * _RSS_HIGH:
+                if self._size > self.min_rows:
+                    self._size = max(self.min_rows, self._size // 2)
+                    logger.warning(
+                        "   %s: RSS %s MB near MEMORY_BUDGET_MB=%s; chunk size "
+                        "reduced to %s rows",
+                        self.label,
+                        rss // (1024 * 1024),
+                        self.budget_bytes // (1024 * 1024),
+                        f"{self._size:,}",
+                    )
+            elif self._size < self._target and (
+                rss is None or rss <= self.budget_bytes * _RSS_LOW
+            ):
+                self._size = min(self._target, self._size * 2)
+            return self._size
+
+    def fixed_size(self, reader: str) -> int:
+        """
+        Rows per batch for a reader whose batch size is fixed when it starts.
+
+        Later batches cannot be re-sized, so neither the measured row size nor
+        RSS backpressure applies after this call.
+        """
+        size = self.next_size()
+        logger.warning(
+            "   %s: %s reads fixed batches of %s rows; MEMORY_BUDGET_MB only "
+            "sets this initial size (no backpressure while reading)",
+            self.label,
+            reader,
+            f"{size:,}",
+        )
+        return size
+
+    def observe(self, rows: int, nbytes: int) -> None:
+        """Refine the bytes-per-row estimate with a batch that was read."""
+        if rows <= 0 or nbytes <= 0:
+            return
+        measured = max(1, nbytes // rows)
+        with self._lock:
+            # The first measurement replaces the type-based guess; later ones
+            # are smoothed so a single odd batch does not swing the size
+            if self._measured:
+                measured = (self.row_bytes + measured) // 2
+            self._measured = True
+            self.row_bytes = measured
+            target = self._fit()
+            if target != self._target:
+                previous, self._target = self._target, target
+                self._size = min(self._size, target)
+                if abs(target - previous) * 4 >= previous:
+                    logger.info(
+                        "   %s: chunk size adapted to %s rows (measured ~%s bytes/row)",
+                        self.label,
+                        f"{target:,}",
+                        f"{measured:,}",
+                    )
+
+
+__all__ = [
+    "ChunkSizer",
+    "connectorx_row_bytes",
+    "current_rss_bytes",
+    "estimate_row_bytes",
+    "measure_batch_bytes",
+]
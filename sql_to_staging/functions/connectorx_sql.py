@@ -0,0 +1,52 @@
+"""SELECT statements for ConnectorX reads (quoted source table, column list, row limit)."""
+
+from __future__ import annotations
+
+import logging
+from typing import Sequence
+
+from utils.database.identifiers import quote_fqn
+
+logger = logging.getLogger("sql_to_staging.connectorx_sql")
+
+
+def connectorx_target(scheme: str, schema: str | None, table: str) -> str:
+    """Quote [schema.]table for the URI's dialect."""
+    try:
+        return (
+            quote_fqn(scheme, [schema, table]) if schema else quote_fqn(scheme, [table])
+        )
+    except Exception:
+        # Fallback: leave unquoted if quoting fails
+        return f"{schema}.{table}" if schema else table
+
+
+def connectorx_select(
+    scheme: str,
+    quoted_target: str,
+    row_limit: int | None,
+    where: str | None = None,
+    columns: Sequence[str] | None = None,
+) -> str:
+    """
+    Compose the SELECT with an optional column list (as configured, unquoted),
+    WHERE and dialect-specific row limit.
+    """
+    select_list = ", ".join(columns) if columns else "*"
+    source = f"{quoted_target} WHERE {where}" if where else quoted_target
+    if row_limit and row_limit > 0:
+        if scheme in ("postgres", "postgresql", "mysql", "sqlite", "redshift"):
+            return f"SELECT {select_list} FROM {source} LIMIT {row_limit}"
+        if scheme in ("mssql", "sqlserver", "sql server"):
+            return f"SELECT TOP ({row_limit}) {select_list} FROM {source}"
+        if scheme == "oracle":
+            return (
+                f"SELECT {select_list} FROM {source} FETCH FIRST {row_limit} ROWS ONLY"
+            )
+        logger.warning(
+            "Unknown URI scheme %r – skipping ROW_LIMIT for %s", scheme, quoted_target
+        )
+    return f"SELECT {select_list} FROM {source}"
+
+
+__all__ = ["connectorx_select", "connectorx_target"]
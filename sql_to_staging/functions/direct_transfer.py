@@ -1,22 +1,85 @@
 import logging
 import random
 import time
-from typing import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    TypeVar,
+)
 
-from sqlalchemy import MetaData, Table, Column, select, text
+from sqlalchemy import MetaData, Table, Column, inspect, select, text
 from sqlalchemy import types as satypes
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.exc import ProgrammingError, DBAPIError
 from sqlalchemy.schema import CreateSchema
+from sqlalchemy.sql.elements import ColumnElement
+from sql_to_staging.functions.chunk_sizing import ChunkSizer, measure_batch_bytes
+from sql_to_staging.functions.checkpoints import (
+    CheckpointStore,
+    decode_key,
+    encode_key,
+)
+from sql_to_staging.functions.keyset import keyset_page, resolve_keyset_column
+from sql_to_staging.functions.partitioning import (
+    partition_predicates,
+    resolve_partition_column,
+    table_partitions,
+)
+from sql_to_staging.functions.pipeline import prefetch
+from sql_to_staging.functions.projection import (
+    combine_where,
+    project_table,
+    table_columns,
+    table_where,
+)
+from sql_to_staging.functions.row_estimates import (
+    format_progress,
+    report_row_count,
+    source_row_count,
+)
+from sql_to_staging.functions.schema_cache import SchemaCache, reflect_table
+from sql_to_staging.functions.source_queries import (
+    query_table,
+    source_query_sql,
+    table_query,
+)
+from sql_to_staging.functions.watermarks import (
+    IncrementalPlan,
+    WatermarkStore,
+    effective_write_mode,
+    resolve_column,
+)
+from utils.bulk_load import BulkLoader, get_bulk_loader
 from utils.database.ensure_db import ensure_database_and_schema
+from utils.database.merge import merge_from_staging
+from utils.database.minimal_logging import (
+    attach_minimal_logging,
+    unlogged_table_kwargs,
+)
+from utils.database.swap import (
+    drop_shadow_tables,
+    new_run_id,
+    shadow_table_name,
+    swap_table,
+)
 from utils.database.identifiers import (
-    quote_ident,
     quote_truncate_target,
     mssql_bracket_escape,
 )
+from utils.logging.metrics import TableMetrics, TransferMetrics, timed
 
 logger = logging.getLogger("sql_to_staging.direct_transfer")
 
+T = TypeVar("T")
+
 
 def _coerce_generic_type(
     col: Column, source_dialect: str, dest_dialect: str
@@ -207,10 +270,14 @@ def _build_destination_table(
     *,
     source_dialect: str,
     dest_dialect: str,
+    minimal_logging: bool = False,
 ) -> Table:
     """
     Create a lightweight Table in dest metadata mirroring columns and types from
     source_table. Keeps nullability; omits constraints for portability.
+
+    With minimal_logging the table is created UNLOGGED on PostgreSQL and
+    NOLOGGING on Oracle (see utils.database.minimal_logging).
     """
     cols: list[Column] = []
     for col in source_table.columns:
@@ -219,7 +286,918 @@ def _build_destination_table(
         portable_type = _coerce_generic_type(col, source_dialect, dest_dialect)
         new_col = Column(new_name, portable_type, nullable=col.nullable)
         cols.append(new_col)
-    return Table(dest_table_name, dest_meta, *cols, schema=dest_schema)
+    if not minimal_logging:
+        return Table(dest_table_name, dest_meta, *cols, schema=dest_schema)
+    table = Table(
+        dest_table_name,
+        dest_meta,
+        *cols,
+        schema=dest_schema,
+        **unlogged_table_kwargs(dest_dialect),
+    )
+    return attach_minimal_logging(table, dest_dialect)
+
+
+@dataclass
+class TableTransferResult:
+    """Outcome of copying a single table, used for the end-of-run summary."""
+
+    table: str
+    rows: int = 0
+    seconds: float = 0.0
+    error: BaseException | None = None
+    # Not copied because it did not change since the previous run
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _schedule_largest_first(
+    tables: Sequence[str], row_counts: dict[str, int | None]
+) -> list[str]:
+    """
+    Order tables by descending row count so the biggest tables start first and
+    the long tail of small tables fills up the remaining workers. Tables without
+    a known row count keep their configured order after the counted ones.
+    """
+    counted = [t for t in tables if row_counts.get(t) is not None]
+    uncounted = [t for t in tables if row_counts.get(t) is None]
+    counted.sort(key=lambda t: row_counts[t] or 0, reverse=True)
+    return counted + uncounted
+
+
+def _prepare_destination_table(
+    dest_engine: Engine,
+    dest_table: Table,
+    *,
+    dest_schema: str | None,
+    table_name: str,
+    write_mode: str,
+) -> None:
+    """Create, recreate or truncate the destination table according to write_mode."""
+    with dest_engine.begin() as dconn:
+        if write_mode == "replace":
+            dest_table.drop(bind=dconn, checkfirst=True)
+            dest_table.create(bind=dconn, checkfirst=True)
+        elif write_mode == "truncate":
+            # Create if missing, then truncate
+            dest_table.create(bind=dconn, checkfirst=True)
+            # SQLite does not support TRUNCATE; fall back to DELETE
+            if dest_engine.dialect.name.lower() == "sqlite":
+                # Prefer SQLAlchemy DELETE for safe quoting
+                dconn.execute(dest_table.delete())
+            else:
+                # Use dialect-aware quoted identifier for TRUNCATE
+                qname = quote_truncate_target(
+                    dest_engine,
+                    db=None,
+                    schema=dest_schema,
+                    table=table_name,
+                )
+                dconn.execute(text(f"TRUNCATE TABLE {qname}"))
+        else:  # append
+            dest_table.create(bind=dconn, checkfirst=True)
+
+
+def _insert_with_retry(
+    dest_engine: Engine,
+    insert_stmt,
+    batch: list[dict],
+    *,
+    max_retries: int,
+    backoff_base_seconds: float,
+    backoff_max_seconds: float,
+    loader: BulkLoader | None = None,
+) -> int:
+    """
+    Execute an insert batch with small retry/backoff on transient DB errors and
+    return the number of rows written.
+
+    With a bulk loader, the batch is written through the loader's native path
+    (e.g. COPY on PostgreSQL) instead of an executemany INSERT, and the count
+    is the loader's (rows rejected by Oracle batch errors are not included).
+    """
+
+    def _write(dconn: Connection) -> int:
+        if loader is not None:
+            return loader.load_rows(dconn, insert_stmt.table, batch)
+        dconn.execute(insert_stmt, batch)
+        return len(batch)
+
+    return _write_with_retry(
+        dest_engine,
+        _write,
+        max_retries=max_retries,
+        backoff_base_seconds=backoff_base_seconds,
+        backoff_max_seconds=backoff_max_seconds,
+    )
+
+
+def _write_with_retry(
+    dest_engine: Engine,
+    write: Callable[[Connection], T],
+    *,
+    max_retries: int,
+    backoff_base_seconds: float,
+    backoff_max_seconds: float,
+) -> T:
+    """
+    Run write(conn) in its own transaction, retrying transient DB errors, and
+    return what the successful write returned.
+    """
+    attempt = 0
+    while True:
+        try:
+            with dest_engine.begin() as dconn:
+                result = write(dconn)
+            return result  # success
+        except DBAPIError as e:  # type: ignore[asynckind]
+            # Determine if error looks transient and should be retried
+            msg = str(e).lower()
+            is_disconnect = bool(
+                getattr(e, "is_disconnect", False)
+                or getattr(e, "connection_invalidated", False)
+            )
+            looks_transient = is_disconnect or any(
+                tok in msg
+                for tok in (
+                    "deadlock",
+                    "timeout",
+                    "could not serialize access",
+                    "lock wait timeout exceeded",
+                    "connection reset",
+                    "broken pipe",
+                )
+            )
+            if attempt >= max_retries or not looks_transient:
+                logger.error(
+                    "Insert batch failed (attempt %s/%s). Giving up. Error: %s",
+                    attempt + 1,
+                    max_retries,
+                    e,
+                )
+                raise
+            # Backoff with jitter
+            sleep = min(
+                backoff_max_seconds,
+                backoff_base_seconds * (2**attempt),
+            )
+            # full jitter in [0.5x, 1.5x]
+            sleep *= 0.5 + random.random()
+            attempt += 1
+            logger.warning(
+                "Transient DB error on insert (attempt %s/%s). Retrying in %.2fs: %s",
+                attempt,
+                max_retries,
+                sleep,
+                e,
+            )
+            time.sleep(sleep)
+
+
+def _strip_nul(batch: list[dict]) -> None:
+    """Remove NUL (0x00) characters from all string values in place."""
+    for rec in batch:
+        for key, val in rec.items():
+            if isinstance(val, str) and "\x00" in val:
+                rec[key] = val.replace("\x00", "")
+
+
+def _to_batch(
+    rows: Sequence, *, lowercase_columns: bool, strip_nul: bool
+) -> list[dict]:
+    """Turn fetched mapping rows into an insert-ready list of dicts."""
+    # Normalize case if needed
+    if lowercase_columns:
+        batch = [
+            {k.lower(): v for k, v in row.items()}  # type: ignore[union-attr]
+            for row in rows
+        ]
+    else:
+        batch = [dict(row) for row in rows]  # type: ignore[union-attr]
+
+    # For PostgreSQL, strip NUL (0x00) from all string values.
+    # Postgres text/varchar columns cannot contain NUL bytes; psycopg will error.
+    # (The COPY bulk loader strips NUL while serializing instead.)
+    if strip_nul:
+        _strip_nul(batch)
+    return batch
+
+
+def _iter_batches(
+    source_engine: Engine,
+    select_stmt,
+    *,
+    chunk_size: int,
+    lowercase_columns: bool,
+    strip_nul: bool,
+    sizer: ChunkSizer | None = None,
+    metrics: TableMetrics | None = None,
+) -> Iterator[list[dict]]:
+    """
+    Stream select_stmt from the source and yield insert-ready dict batches.
+
+    With a sizer, each fetch uses its current chunk size instead of chunk_size.
+    With metrics, fetching and transforming are timed as "fetch"/"transform".
+    """
+    with source_engine.connect() as sconn:
+        # Enable streaming results to avoid reading entire result set into memory
+        with timed(metrics, "fetch"):
+            result = sconn.execution_options(stream_results=True).execute(select_stmt)
+        mapping_result = result.mappings()
+
+        while True:
+            with timed(metrics, "fetch"):
+                rows = mapping_result.fetchmany(
+                    sizer.next_size() if sizer is not None else chunk_size
+                )
+            if not rows:
+                break
+            with timed(metrics, "transform"):
+                batch = _to_batch(
+                    rows, lowercase_columns=lowercase_columns, strip_nul=strip_nul
+                )
+            if sizer is not None:
+                sizer.observe(len(batch), measure_batch_bytes(batch))
+            yield batch
+
+
+def _iter_keyset_batches(
+    source_engine: Engine,
+    src_table: Table,
+    key_column: str,
+    *,
+    after: Any,
+    chunk_size: int,
+    row_limit: int | None,
+    lowercase_columns: bool,
+    strip_nul: bool,
+    where: ColumnElement[bool] | None = None,
+    sizer: ChunkSizer | None = None,
+    metrics: TableMetrics | None = None,
+) -> Iterator[list[dict]]:
+    """
+    Yield insert-ready batches page by page (`WHERE key > :last ORDER BY key`),
+    each page read with a short query on its own connection.
+    """
+    fetched = 0
+    while True:
+        limit = sizer.next_size() if sizer is not None else chunk_size
+        if row_limit and row_limit > 0:
+            limit = min(limit, row_limit - fetched)
+            if limit <= 0:
+                return
+        stmt = keyset_page(src_table, key_column, after=after, limit=limit, where=where)
+        with timed(metrics, "fetch"), source_engine.connect() as sconn:
+            rows = sconn.execute(stmt).mappings().all()
+        if not rows:
+            return
+        after = rows[-1][key_column]
+        fetched += len(rows)
+        with timed(metrics, "transform"):
+            batch = _to_batch(
+                rows, lowercase_columns=lowercase_columns, strip_nul=strip_nul
+            )
+        if sizer is not None:
+            sizer.observe(len(batch), measure_batch_bytes(batch))
+        yield batch
+        if len(rows) < limit:
+            return
+
+
+def _stream_copy(
+    source_engine: Engine,
+    dest_engine: Engine,
+    select_stmt,
+    insert_stmt,
+    *,
+    label: str,
+    chunk_size: int,
+    lowercase_columns: bool,
+    dest_dialect: str,
+    max_retries: int,
+    backoff_base_seconds: float,
+    backoff_max_seconds: float,
+    pipeline_depth: int = 0,
+    loader: BulkLoader | None = None,
+    sizer: ChunkSizer | None = None,
+    expected_rows: int | None = None,
+    metrics: TableMetrics | None = None,
+) -> int:
+    """Stream the rows of select_stmt into insert_stmt in chunks; return rows inserted."""
+    batches = _iter_batches(
+        source_engine,
+        select_stmt,
+        chunk_size=chunk_size,
+        lowercase_columns=lowercase_columns,
+        strip_nul=dest_dialect == "postgresql" and loader is None,
+        sizer=sizer,
+        metrics=metrics,
+    )
+    return _copy_batches(
+        batches,
+        dest_engine,
+        insert_stmt,
+        label=label,
+        dest_dialect=dest_dialect,
+        max_retries=max_retries,
+        backoff_base_seconds=backoff_base_seconds,
+        backoff_max_seconds=backoff_max_seconds,
+        pipeline_depth=pipeline_depth,
+        loader=loader,
+        expected_rows=expected_rows,
+        metrics=metrics,
+    )
+
+
+def _copy_batches(
+    batches: Iterable[list[dict]],
+    dest_engine: Engine,
+    insert_stmt,
+    *,
+    label: str,
+    dest_dialect: str,
+    max_retries: int,
+    backoff_base_seconds: float,
+    backoff_max_seconds: float,
+    pipeline_depth: int = 0,
+    loader: BulkLoader | None = None,
+    on_batch: Callable[[list[dict], int], None] | None = None,
+    expected_rows: int | None = None,
+    metrics: TableMetrics | None = None,
+) -> int:
+    """
+    Insert batches into insert_stmt; return rows inserted.
+
+    With pipeline_depth > 0, fetching and transforming the next chunks runs in a
+    producer thread (bounded to pipeline_depth chunks) while this thread inserts.
+    With a bulk loader, batches are written through it; if the loader fails
+    with a non-recoverable error, the batch and the rest of the stream fall
+    back to regular executemany INSERTs. on_batch(batch, inserted_total) is
+    called after each batch has been committed. With expected_rows (e.g. a
+    catalog estimate), progress is logged as a percentage with an ETA. With
+    metrics, inserts are timed as "insert" and every batch is counted.
+    """
+    started = time.perf_counter()
+    inserted_total = 0
+    retry_kwargs = dict(
+        max_retries=max_retries,
+        backoff_base_seconds=backoff_base_seconds,
+        backoff_max_seconds=backoff_max_seconds,
+    )
+    fell_back = False
+    with closing(prefetch(batches, pipeline_depth, name=f"{label}_fetch")) as it:
+        for batch in it:
+            if fell_back and dest_dialect == "postgresql":
+                # Batches produced for the loader were not NUL-stripped yet
+                _strip_nul(batch)
+            with timed(metrics, "insert"):
+                try:
+                    written = _insert_with_retry(
+                        dest_engine, insert_stmt, batch, loader=loader, **retry_kwargs
+                    )
+                except DBAPIError as e:
+                    if loader is None:
+                        raise
+                    logger.warning(
+                        "   %s: %s bulk load failed, falling back to INSERT: %s",
+                        label,
+                        loader.name,
+                        e,
+                    )
+                    loader = None
+                    fell_back = True
+                    if dest_dialect == "postgresql":
+                        _strip_nul(batch)
+                    written = _insert_with_retry(
+                        dest_engine, insert_stmt, batch, **retry_kwargs
+                    )
+
+            inserted_total += written
+            if metrics is not None:
+                metrics.add_chunk(written, measure_batch_bytes(batch))
+            logger.info(
+                "   %s: inserted %s rows (total %s%s)",
+                label,
+                written,
+                inserted_total,
+                format_progress(
+                    inserted_total, expected_rows, time.perf_counter() - started
+                ),
+            )
+            if on_batch is not None:
+                on_batch(batch, inserted_total)
+    return inserted_total
+
+
+def _transfer_table(
+    source_engine: Engine,
+    dest_engine: Engine,
+    table_name: str,
+    *,
+    source_schema: str | None,
+    dest_schema: str | None,
+    chunk_size: int,
+    lowercase_columns: bool,
+    write_mode: str,
+    row_limit: int | None,
+    row_count: int | None,
+    log_row_count: bool,
+    max_retries: int,
+    backoff_base_seconds: float,
+    backoff_max_seconds: float,
+    partitions: int = 1,
+    partition_column: str | None = None,
+    pipeline_depth: int = 0,
+    loader: BulkLoader | None = None,
+    keyset_column: str | None = None,
+    checkpoints: CheckpointStore | None = None,
+    incremental: IncrementalPlan | None = None,
+    memory_budget_mb: int | None = None,
+    concurrent_tables: int = 1,
+    exact_row_count: bool = False,
+    schema_cache: SchemaCache | None = None,
+    shadow_run_id: str | None = None,
+    minimal_logging: bool = False,
+    table_options: Mapping[str, Mapping[str, str]] | None = None,
+    metrics: TableMetrics | None = None,
+) -> int:
+    """
+    Copy a single table from source to destination and return the number of rows
+    inserted. Uses its own MetaData and its own pooled connections so it can run
+    concurrently with other tables.
+
+    With keyset_column (a column name or "auto" for the primary key), the table
+    is read in keyset pages and the last committed key is checkpointed after
+    each chunk; a checkpoint from a previous run is continued instead of
+    recreating the table.
+
+    With an incremental plan only the rows within its watermark bounds are
+    read; write_mode "merge" loads them into `<table>__delta` and merges that
+    into the existing table by the plan's merge keys.
+
+    With memory_budget_mb, the chunk size is derived from the budget and the
+    row size (see sql_to_staging.functions.chunk_sizing) instead of chunk_size.
+
+    With a schema_cache, the source table definition is reused from the cache
+    while its catalog fingerprint is unchanged instead of being reflected.
+
+    Per-table "columns" and "where" in table_options narrow the source query
+    (see sql_to_staging.functions.projection); the destination table only
+    gets the selected columns.
+
+    With a shadow_run_id, write_mode "replace" loads into
+    `<table>__load_<runid>` and swaps it into place once all rows are in, so
+    the existing table stays readable during the copy.
+    """
+    qualified_src = f"{source_schema}.{table_name}" if source_schema else table_name
+    qualified_dst = f"{dest_schema}.{table_name}" if dest_schema else table_name
+    dest_dialect = dest_engine.dialect.name.lower()
+    logger.info(
+        "Copying table %s -> %s (chunk_size=%s)",
+        qualified_src,
+        qualified_dst,
+        chunk_size,
+    )
+
+    # Upfront row count: a catalog estimate, or an exact COUNT(*) when opted in
+    if log_row_count:
+        if row_count is None:
+            row_count = source_row_count(
+                source_engine, source_schema, table_name, exact=exact_row_count
+            )
+        report_row_count(row_count, exact=exact_row_count, source=source_engine)
+    else:
+        row_count = None
+        logger.info("   (row count skipped; LOG_ROW_COUNT disabled)")
+
+    # Reflect source table, narrowed to the configured columns
+    src_meta = MetaData()
+    dest_meta = MetaData()
+    src_table = project_table(
+        reflect_table(
+            source_engine,
+            table_name,
+            schema=source_schema,
+            metadata=src_meta,
+            cache=schema_cache,
+        ),
+        table_options,
+        table_name,
+    )
+    source_filter = table_where(table_options, table_name)
+
+    sizer: ChunkSizer | None = None
+    if memory_budget_mb:
+        # Chunks in flight: the prefetch queue plus the one being fetched and
+        # the one being inserted, for every partition and parallel table
+        sizer = ChunkSizer.for_table(
+            memory_budget_mb,
+            src_table,
+            label=table_name,
+            in_flight=(pipeline_depth + 2) * max(1, partitions) * concurrent_tables,
+        )
+        sizer.log_choice()
+
+    where = combine_where(
+        incremental.predicate(
+            src_table.c[resolve_column(src_table, incremental.column)]
+        )
+        if incremental is not None
+        else None,
+        source_filter,
+    )
+
+    # Rows expected for progress/ETA logging (unknown for deltas and filters)
+    expected_rows = row_count if incremental is None and not source_filter else None
+    if expected_rows is not None and row_limit and row_limit > 0:
+        expected_rows = min(expected_rows, row_limit)
+
+    # A merge loads the delta into a side table first; without an existing
+    # table there is nothing to merge into and the delta is loaded directly
+    load_name = table_name
+    if write_mode == "merge":
+        if inspect(dest_engine).has_table(table_name, schema=dest_schema):
+            load_name = f"{table_name}__delta"
+            logger.info("   (merging delta through %s)", load_name)
+        else:
+            write_mode = "replace"
+    if write_mode == "replace" and shadow_run_id is not None:
+        # A resumed keyset table keeps loading into the shadow of its run
+        previous = checkpoints.get(table_name) if checkpoints is not None else None
+        load_name = (previous or {}).get("load_table") or shadow_table_name(
+            table_name, shadow_run_id
+        )
+        drop_shadow_tables(
+            dest_engine, schema=dest_schema, target=table_name, keep=load_name
+        )
+        logger.info("   (loading into shadow table %s)", load_name)
+
+    dest_table = _build_destination_table(
+        src_table,
+        dest_meta,
+        dest_table_name=load_name,
+        dest_schema=dest_schema,
+        lowercase_columns=lowercase_columns,
+        source_dialect=source_engine.dialect.name.lower(),
+        dest_dialect=dest_dialect,
+        minimal_logging=minimal_logging,
+    )
+
+    key_column: str | None = None
+    if keyset_column is not None:
+        key_column = resolve_keyset_column(src_table, keyset_column)
+        if key_column is None:
+            logger.info(
+                "   (keyset pagination skipped; no single-column primary key on %s)",
+                qualified_src,
+            )
+    key_out = None
+    if key_column is not None:
+        key_out = key_column.lower() if lowercase_columns else key_column
+
+    # Continue a keyset checkpoint of a previous (failed) run when present
+    state = checkpoints.get(table_name) if checkpoints is not None else None
+    resume_after: Any = None
+    rows_before = 0
+    if (
+        key_out is not None
+        and state
+        and state.get("keyset_column") == key_column
+        and state.get("last_key") is not None
+    ):
+        resume_after = decode_key(state["last_key"])
+        rows_before = int(state.get("rows") or 0)
+
+    if resume_after is not None and write_mode == "append":
+        # The cleanup below would also delete rows of earlier runs above the key
+        raise ValueError(
+            f"Cannot resume the keyset copy of {table_name!r} with WRITE_MODE=append: "
+            "rows of the failed run cannot be told apart from rows of earlier runs; "
+            "remove them and run again without --resume"
+        )
+    if resume_after is not None:
+        logger.info(
+            "   (resuming after %s=%r; %s rows already copied)",
+            key_column,
+            resume_after,
+            f"{rows_before:,}",
+        )
+        with dest_engine.begin() as dconn:
+            dest_table.create(bind=dconn, checkfirst=True)
+            # Drop rows of a chunk that was committed but not yet checkpointed
+            dconn.execute(
+                dest_table.delete().where(dest_table.c[key_out] > resume_after)
+            )
+    else:
+        # Prepare destination table according to write mode
+        _prepare_destination_table(
+            dest_engine,
+            dest_table,
+            dest_schema=dest_schema,
+            table_name=load_name,
+            write_mode="replace" if write_mode == "merge" else write_mode,
+        )
+        if checkpoints is not None:
+            checkpoints.reset(table_name)
+
+    # Stream copy rows (optionally limited for development)
+    select_stmt = select(src_table)
+    if where is not None:
+        select_stmt = select_stmt.where(where)
+    if row_limit and row_limit > 0:
+        select_stmt = select_stmt.limit(row_limit)
+    insert_stmt = dest_table.insert()
+    stream_kwargs = dict(
+        chunk_size=chunk_size,
+        lowercase_columns=lowercase_columns,
+        dest_dialect=dest_dialect,
+        max_retries=max_retries,
+        backoff_base_seconds=backoff_base_seconds,
+        backoff_max_seconds=backoff_max_seconds,
+        pipeline_depth=pipeline_depth,
+        loader=loader,
+        sizer=sizer,
+        metrics=metrics,
+    )
+
+    if key_column is not None and key_out is not None:
+        if partitions > 1:
+            logger.info("   (partitioning skipped; keyset pagination is used)")
+
+        def _checkpoint(batch: list[dict], inserted: int) -> None:
+            if checkpoints is not None:
+                checkpoints.update(
+                    table_name,
+                    keyset_column=key_column,
+                    last_key=encode_key(batch[-1][key_out]),
+                    rows=rows_before + inserted,
+                    **({"load_table": load_name} if shadow_run_id else {}),
+                )
+
+        # Rows still allowed by ROW_LIMIT after the rows of the resumed run
+        remaining = (
+            max(0, row_limit - rows_before) if row_limit and row_limit > 0 else None
+        )
+        if remaining == 0:
+            logger.info("   (ROW_LIMIT already reached in the resumed run)")
+            batches: Iterator[list[dict]] = iter(())
+        else:
+            batches = _iter_keyset_batches(
+                source_engine,
+                src_table,
+                key_column,
+                after=resume_after,
+                chunk_size=chunk_size,
+                row_limit=remaining,
+                lowercase_columns=lowercase_columns,
+                strip_nul=dest_dialect == "postgresql" and loader is None,
+                where=where,
+                sizer=sizer,
+                metrics=metrics,
+            )
+        inserted_total = rows_before + _copy_batches(
+            batches,
+            dest_engine,
+            insert_stmt,
+            label=table_name,
+            dest_dialect=dest_dialect,
+            max_retries=max_retries,
+            backoff_base_seconds=backoff_base_seconds,
+            backoff_max_seconds=backoff_max_seconds,
+            pipeline_depth=pipeline_depth,
+            loader=loader,
+            on_batch=_checkpoint,
+            expected_rows=(
+                max(0, expected_rows - rows_before)
+                if expected_rows is not None
+                else None
+            ),
+            metrics=metrics,
+        )
+        _finish_load(
+            dest_engine, dest_schema, table_name, load_name, write_mode, incremental
+        )
+        logger.info("Finished table %s (%s rows)", qualified_dst, f"{inserted_total:,}")
+        return inserted_total
+
+    # Optionally split the table into key ranges streamed by parallel workers
+    predicates: list = []
+    if partitions > 1:
+        if row_limit and row_limit > 0:
+            logger.info("   (partitioning skipped; ROW_LIMIT is set)")
+        else:
+            key_column = resolve_partition_column(src_table, partition_column)
+            if key_column is None:
+                logger.info(
+                    "   (partitioning skipped; no numeric/date primary key on %s)",
+                    qualified_src,
+                )
+            else:
+                predicates = partition_predicates(
+                    source_engine, src_table, key_column, partitions, where=where
+                )
+
+    if len(predicates) > 1:
+        with ThreadPoolExecutor(
+            max_workers=len(predicates), thread_name_prefix=f"{table_name}_part"
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _stream_copy,
+                    source_engine,
+                    dest_engine,
+                    select_stmt.where(pred),
+                    insert_stmt,
+                    label=f"{table_name}[{idx + 1}/{len(predicates)}]",
+                    **stream_kwargs,
+                )
+                for idx, pred in enumerate(predicates)
+            ]
+            inserted_total = sum(f.result() for f in futures)
+    else:
+        inserted_total = _stream_copy(
+            source_engine,
+            dest_engine,
+            select_stmt,
+            insert_stmt,
+            label=table_name,
+            expected_rows=expected_rows,
+            **stream_kwargs,
+        )
+
+    _finish_load(
+        dest_engine, dest_schema, table_name, load_name, write_mode, incremental
+    )
+    logger.info("Finished table %s (%s rows)", qualified_dst, f"{inserted_total:,}")
+    return inserted_total
+
+
+def _transfer_query(
+    source_engine: Engine,
+    dest_engine: Engine,
+    table_name: str,
+    query: str,
+    *,
+    dest_schema: str | None,
+    chunk_size: int,
+    lowercase_columns: bool,
+    write_mode: str,
+    row_limit: int | None,
+    max_retries: int,
+    backoff_base_seconds: float,
+    backoff_max_seconds: float,
+    pipeline_depth: int = 0,
+    loader: BulkLoader | None = None,
+    shadow_run_id: str | None = None,
+    minimal_logging: bool = False,
+    table_options: Mapping[str, Mapping[str, str]] | None = None,
+    metrics: TableMetrics | None = None,
+) -> int:
+    """
+    Copy the result of a custom source query (SRC_QUERY_<table>) into the
+    staging table `table_name` and return the number of rows inserted.
+
+    Nothing is reflected: the destination columns are typed from the cursor
+    description and the first chunk (see sql_to_staging.functions.source_queries).
+    The query is sent as-is to the driver, so bind-parameter syntax is not
+    interpreted.
+    """
+    qualified_dst = f"{dest_schema}.{table_name}" if dest_schema else table_name
+    source_dialect = source_engine.dialect.name.lower()
+    dest_dialect = dest_engine.dialect.name.lower()
+    logger.info(
+        "Copying query %s -> %s (chunk_size=%s)",
+        table_name,
+        qualified_dst,
+        chunk_size,
+    )
+    sql = source_query_sql(
+        source_dialect,
+        query,
+        row_limit,
+        where=table_where(table_options, table_name),
+        columns=table_columns(table_options, table_name),
+    )
+
+    load_name = table_name
+    if write_mode == "replace" and shadow_run_id is not None:
+        load_name = shadow_table_name(table_name, shadow_run_id)
+        drop_shadow_tables(dest_engine, schema=dest_schema, target=table_name)
+        logger.info("   (loading into shadow table %s)", load_name)
+
+    dbapi = getattr(source_engine.dialect, "loaded_dbapi", None) or getattr(
+        source_engine.dialect, "dbapi", None
+    )
+    strip_nul = dest_dialect == "postgresql" and loader is None
+    with source_engine.connect() as sconn:
+        with timed(metrics, "fetch"):
+            result = sconn.execution_options(stream_results=True).exec_driver_sql(sql)
+            mapping_result = result.mappings()
+            # Server-side cursors only describe the result after the first fetch
+            first = mapping_result.fetchmany(chunk_size)
+        src_table = query_table(
+            table_name, result.cursor.description, dbapi, sample_rows=first
+        )
+        dest_table = _build_destination_table(
+            src_table,
+            MetaData(),
+            dest_table_name=load_name,
+            dest_schema=dest_schema,
+            lowercase_columns=lowercase_columns,
+            source_dialect=source_dialect,
+            dest_dialect=dest_dialect,
+            minimal_logging=minimal_logging,
+        )
+        _prepare_destination_table(
+            dest_engine,
+            dest_table,
+            dest_schema=dest_schema,
+            table_name=load_name,
+            write_mode="replace" if write_mode == "merge" else write_mode,
+        )
+
+        def _batches() -> Iterator[list[dict]]:
+            rows = first
+            while rows:
+                with timed(metrics, "transform"):
+                    batch = _to_batch(
+                        rows, lowercase_columns=lowercase_columns, strip_nul=strip_nul
+                    )
+                yield batch
+                with timed(metrics, "fetch"):
+                    rows = mapping_result.fetchmany(chunk_size)
+
+        inserted_total = _copy_batches(
+            _batches(),
+            dest_engine,
+            dest_table.insert(),
+            label=table_name,
+            dest_dialect=dest_dialect,
+            max_retries=max_retries,
+            backoff_base_seconds=backoff_base_seconds,
+            backoff_max_seconds=backoff_max_seconds,
+            pipeline_depth=pipeline_depth,
+            loader=loader,
+            metrics=metrics,
+        )
+
+    _finish_load(dest_engine, dest_schema, table_name, load_name, write_mode, None)
+    logger.info("Finished table %s (%s rows)", qualified_dst, f"{inserted_total:,}")
+    return inserted_total
+
+
+def _finish_load(
+    dest_engine: Engine,
+    dest_schema: str | None,
+    table_name: str,
+    load_name: str,
+    write_mode: str,
+    incremental: IncrementalPlan | None,
+) -> None:
+    """
+    Move a side table into its target: merge a delta, or swap a shadow table
+    into place (no-op when the target was loaded directly).
+    """
+    if load_name == table_name:
+        return
+    if write_mode != "merge":
+        swap_table(dest_engine, schema=dest_schema, target=table_name, shadow=load_name)
+        return
+    merge_from_staging(
+        dest_engine,
+        schema=dest_schema,
+        target=table_name,
+        staging=load_name,
+        key_columns=incremental.merge_keys if incremental is not None else [],
+    )
+
+
+def _log_summary(results: list[TableTransferResult], elapsed: float) -> None:
+    """Log an aggregated per-table summary once all tables have been processed."""
+    ok = [r for r in results if r.ok and not r.skipped]
+    failed = [r for r in results if not r.ok]
+    skipped = [r for r in results if r.skipped]
+    logger.info(
+        "Direct transfer summary: %d table(s) ok, %d failed, %d unchanged, "
+        "%s rows in %.1fs",
+        len(ok),
+        len(failed),
+        len(skipped),
+        f"{sum(r.rows for r in ok):,}",
+        elapsed,
+    )
+    for r in results:
+        if r.skipped:
+            logger.info("   SKIPPED %s: unchanged since the previous run", r.table)
+        elif r.ok:
+            logger.info(
+                "   OK     %s: %s rows in %.1fs", r.table, f"{r.rows:,}", r.seconds
+            )
+        else:
+            logger.info("   FAILED %s after %.1fs: %s", r.table, r.seconds, r.error)
 
 
 def direct_transfer(
@@ -231,7 +1209,7 @@ def direct_transfer(
     dest_schema: str | None = None,
     chunk_size: int = 100_000,
     lowercase_columns: bool = True,
-    write_mode: str = "replace",  # replace | truncate | append
+    write_mode: str = "replace",  # replace | truncate | append | merge
     row_limit: int | None = None,
     log_row_count: bool = True,
     # Retry/backoff for transient insert errors
@@ -240,7 +1218,43 @@ def direct_transfer(
     backoff_max_seconds: float = 8.0,
     # Optional override for admin DB hop when creating databases on Postgres/MSSQL
     admin_database: str | None = None,
-) -> None:
+    # Number of tables copied concurrently (1 = sequential, historical behavior)
+    workers: int = 1,
+    # Number of key ranges read in parallel per table (1 = single stream)
+    partitions: int = 1,
+    # Per-table options, e.g. {"szukhis": {"partition_column": "id", "partitions": "8"}}
+    table_options: Mapping[str, Mapping[str, str]] | None = None,
+    # Chunks fetched ahead while the previous chunk is inserted (0 = sequential)
+    pipeline_depth: int = 2,
+    # Use a native bulk load path when available (e.g. COPY on PostgreSQL)
+    bulk_load: bool = True,
+    # Loader options, e.g. {"tablock": True} for SQL Server
+    bulk_load_options: Mapping[str, Any] | None = None,
+    # Read tables in keyset pages (primary key or per-table "keyset_column")
+    keyset: bool = False,
+    # Per-table progress for --resume (see sql_to_staging.functions.checkpoints)
+    checkpoints: CheckpointStore | None = None,
+    # Watermark plans per table (see sql_to_staging.functions.watermarks)
+    incremental: Mapping[str, IncrementalPlan] | None = None,
+    # Where the high-water mark of a table is advanced once it is loaded
+    watermarks: WatermarkStore | None = None,
+    # Adapt the chunk size per table to this memory budget (None/0 = chunk_size)
+    memory_budget_mb: int | None = None,
+    # Exact COUNT(*) per table instead of catalog-statistics estimates
+    exact_row_count: bool = False,
+    # Reuse reflected source tables across runs (see ...functions.schema_cache)
+    schema_cache: SchemaCache | None = None,
+    # Replace tables through a shadow table swapped in at the end (see utils.database.swap)
+    shadow_load: bool = False,
+    # Create staging tables UNLOGGED (PostgreSQL) / NOLOGGING (Oracle)
+    minimal_logging: bool = False,
+    # Tables left as they are because their source did not change (CHANGE_DETECTION)
+    unchanged_tables: Collection[str] | None = None,
+    # Called with the table name after each table has been loaded
+    on_table_loaded: Callable[[str], None] | None = None,
+    # Collects per-table phase timings for the run report (METRICS_REPORT)
+    metrics: TransferMetrics | None = None,
+) -> list[TableTransferResult]:
     """
     Copy listed tables from source to destination using SQLAlchemy only, in chunks.
 
@@ -249,166 +1263,217 @@ def direct_transfer(
     - Creates or truncates destination tables depending on write_mode.
     - Optionally lowercases column names for consistency (default True, matching
       historical staging behavior in this repo).
+    - With workers > 1, copies up to `workers` tables concurrently, each with its
+      own pooled source/destination connections. Tables are scheduled largest-first
+      (when row counts are known); a failing table does not stop the others, and
+      a RuntimeError listing the failed tables is raised after the summary.
+    - With partitions > 1 (globally or per table via table_options), a table is
+      split into key ranges using MIN/MAX of a numeric/date column (configured
+      as "partition_column" or auto-detected from the primary key); each range
+      is streamed and inserted by its own worker.
+    - With pipeline_depth > 0, each stream fetches the next chunk(s) in a producer
+      thread while the current chunk is inserted, through a queue bounded to
+      pipeline_depth chunks.
+    - With bulk_load, batches are written through the destination's native bulk
+      loader when one exists (see utils.bulk_load), e.g. COPY FROM STDIN on
+      PostgreSQL or pyodbc fast_executemany on SQL Server, falling back to
+      executemany INSERTs otherwise.
+    - With keyset (or a per-table "keyset_column"), tables are read in pages of
+      `WHERE key > :last ORDER BY key` with a row limit instead of one
+      long-running cursor; partitioning is not used for those tables.
+    - With checkpoints, finished tables and the last committed key of keyset
+      tables are recorded; a store opened with resume=True skips finished
+      tables and continues keyset tables after their last committed key.
+    - With incremental plans, tables with a watermark column only read the
+      rows changed since the previous run and append them or (write_mode
+      "merge") merge them by key; the high-water mark in `watermarks` is
+      advanced once the table is loaded. With write_mode "merge", tables
+      without a plan are replaced.
+    - With memory_budget_mb, chunk sizes are chosen per table from the budget,
+      the reflected column types and the measured size of the batches read,
+      and shrink while the process RSS approaches the budget.
+    - Row counts (for LOG_ROW_COUNT, progress/ETA logging and largest-first
+      scheduling) are catalog-statistics estimates; exact_row_count uses
+      COUNT(*) instead (see sql_to_staging.functions.row_estimates).
+    - With a schema_cache, source tables are reflected once and reused in later
+      runs until their catalog fingerprint changes.
+    - With shadow_load, write_mode "replace" fills `<table>__load_<runid>` and
+      swaps it into place when the table is complete; until then (and after a
+      failure) readers keep seeing the previous table.
+    - With minimal_logging, created tables skip WAL/redo where the destination
+      supports it (UNLOGGED on PostgreSQL, NOLOGGING on Oracle).
+    - Per-table "columns" and "where" options (SRC_COLUMNS_<table>,
+      SRC_WHERE_<table>) are pushed down to the source query; the destination
+      DDL only has the extracted columns.
+    - Tables with a "query" option (SRC_QUERY_<table>) are filled with the
+      result of that SELECT instead of a source table; their columns are typed
+      from the cursor description, without reflection. Keyset pagination,
+      partitioning and watermarks do not apply to them.
+    - Tables in unchanged_tables are not copied and reported as skipped in
+      the summary (see sql_to_staging.functions.change_detection);
+      on_table_loaded is called after every table that was loaded.
+    - Every chunk is timed as fetch, transform and insert; a line per table
+      logs the breakdown with rows/s and estimated bytes/s, and the timings
+      are collected in `metrics` (see utils.logging.metrics).
+
+    Returns one TableTransferResult per table.
     """
     assert chunk_size > 0, "chunk_size must be > 0"
-    if write_mode not in {"replace", "truncate", "append"}:
-        raise ValueError("write_mode must be one of: replace|truncate|append")
+    if write_mode not in {"replace", "truncate", "append", "merge"}:
+        raise ValueError("write_mode must be one of: replace|truncate|append|merge")
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    if pipeline_depth < 0:
+        raise ValueError("pipeline_depth must be >= 0")
 
     ensure_database_and_schema(dest_engine, dest_schema, admin_database=admin_database)
 
-    dest_dialect = dest_engine.dialect.name.lower()
-
-    src_meta = MetaData()
-    dest_meta = MetaData()
-
-    for table_name in tables:
-        qualified_src = f"{source_schema}.{table_name}" if source_schema else table_name
-        qualified_dst = f"{dest_schema}.{table_name}" if dest_schema else table_name
-        logger.info(
-            "Copying table %s -> %s (chunk_size=%s)",
-            qualified_src,
-            qualified_dst,
-            chunk_size,
+    loader = (
+        get_bulk_loader(
+            dest_engine, {**(bulk_load_options or {}), "write_mode": write_mode}
         )
+        if bulk_load
+        else None
+    )
 
-        # Optional upfront row count logging (can be expensive on huge tables)
-        if log_row_count:
-            try:
-                with source_engine.connect() as sconn:
-                    qname = quote_ident(source_engine, table_name)
-                    if source_schema:
-                        qname = f"{quote_ident(source_engine, source_schema)}.{qname}"
-                    cnt = sconn.execute(text(f"SELECT COUNT(*) FROM {qname}")).scalar()
-                logger.info("   (source rows: %s)", f"{cnt:,}")
-            except Exception as e:
-                logger.warning("Failed to COUNT(*) for %s: %s", qualified_src, e)
-        else:
-            logger.info("   (row count skipped; LOG_ROW_COUNT disabled)")
+    started = time.perf_counter()
+    metrics = metrics if metrics is not None else TransferMetrics()
+    workers = min(workers, len(tables)) if tables else 1
+    shadow_run_id = new_run_id() if shadow_load else None
 
-        # Reflect source table
-        src_table = Table(
-            table_name, src_meta, schema=source_schema, autoload_with=source_engine
-        )
-        dest_table = _build_destination_table(
-            src_table,
-            dest_meta,
-            dest_table_name=table_name,
-            dest_schema=dest_schema,
-            lowercase_columns=lowercase_columns,
-            source_dialect=source_engine.dialect.name.lower(),
-            dest_dialect=dest_engine.dialect.name.lower(),
-        )
+    # Row counts are gathered upfront when running in parallel so the scheduler
+    # can start the biggest tables first (catalog estimates are cheap enough to
+    # read even without LOG_ROW_COUNT)
+    row_counts: dict[str, int | None] = {}
+    if workers > 1 and not (row_limit and row_limit > 0):
+        for table_name in tables:
+            if table_query(table_options, table_name) is not None:
+                continue
+            row_counts[table_name] = source_row_count(
+                source_engine,
+                source_schema,
+                table_name,
+                exact=exact_row_count,
+            )
+        ordered = _schedule_largest_first(tables, row_counts)
+        logger.info("Scheduling %d table(s) largest-first: %s", len(ordered), ordered)
+    else:
+        ordered = list(tables)
 
-        # Prepare destination table according to write mode
-        with dest_engine.begin() as dconn:
-            if write_mode == "replace":
-                dest_table.drop(bind=dconn, checkfirst=True)
-                dest_table.create(bind=dconn, checkfirst=True)
-            elif write_mode == "truncate":
-                # Create if missing, then truncate
-                dest_table.create(bind=dconn, checkfirst=True)
-                # SQLite does not support TRUNCATE; fall back to DELETE
-                if dest_engine.dialect.name.lower() == "sqlite":
-                    # Prefer SQLAlchemy DELETE for safe quoting
-                    dconn.execute(dest_table.delete())
-                else:
-                    # Use dialect-aware quoted identifier for TRUNCATE
-                    qname = quote_truncate_target(
-                        dest_engine,
-                        db=None,
-                        schema=dest_schema,
-                        table=table_name,
+    def _run(table_name: str) -> TableTransferResult:
+        t0 = time.perf_counter()
+        result = TableTransferResult(table=table_name)
+        if table_name in (unchanged_tables or ()):
+            result.skipped = True
+            return result
+        if checkpoints is not None and checkpoints.is_done(table_name):
+            state = checkpoints.get(table_name) or {}
+            result.rows = int(state.get("rows") or 0)
+            logger.info("Skipping table %s (finished in the resumed run)", table_name)
+            return result
+        n_partitions, partition_column = table_partitions(
+            table_options, table_name, partitions
+        )
+        configured_key = (table_options or {}).get(table_name, {}).get("keyset_column")
+        plan = (incremental or {}).get(table_name)
+        query = table_query(table_options, table_name)
+        table_metrics = metrics.table("direct_transfer", table_name)
+        try:
+            if query is not None:
+                if n_partitions > 1 or configured_key or keyset:
+                    logger.info(
+                        "   (%s: keyset pagination and partitioning are not used "
+                        "for custom source queries)",
+                        table_name,
                     )
-                    dconn.execute(text(f"TRUNCATE TABLE {qname}"))
-            else:  # append
-                dest_table.create(bind=dconn, checkfirst=True)
-
-        # Stream copy rows (optionally limited for development)
-        select_stmt = select(src_table)
-        if row_limit and row_limit > 0:
-            select_stmt = select_stmt.limit(row_limit)
-        inserted_total = 0
-        with source_engine.connect() as sconn:
-            # Enable streaming results to avoid reading entire result set into memory
-            result = sconn.execution_options(stream_results=True).execute(select_stmt)
-            mapping_result = result.mappings()
-            insert_stmt = dest_table.insert()
-
-            while True:
-                rows = mapping_result.fetchmany(chunk_size)
-                if not rows:
-                    break
-
-                # Normalize case if needed
-                if lowercase_columns:
-                    batch = [
-                        {k.lower(): v for k, v in row.items()}  # type: ignore[union-attr]
-                        for row in rows
-                    ]
-                else:
-                    batch = [dict(row) for row in rows]  # type: ignore[union-attr]
-
-                # For PostgreSQL, strip NUL (0x00) from all string values.
-                # Postgres text/varchar columns cannot contain NUL bytes; psycopg will error.
-                if dest_dialect == "postgresql":
-                    for rec in batch:
-                        for key, val in rec.items():
-                            if isinstance(val, str) and "\x00" in val:
-                                rec[key] = val.replace("\x00", "")
-
-                # Execute insert with small retry/backoff on transient DB errors
-                attempt = 0
-                while True:
-                    try:
-                        with dest_engine.begin() as dconn:
-                            dconn.execute(insert_stmt, batch)
-                        break  # success
-                    except DBAPIError as e:  # type: ignore[asynckind]
-                        # Determine if error looks transient and should be retried
-                        msg = str(e).lower()
-                        is_disconnect = bool(
-                            getattr(e, "is_disconnect", False)
-                            or getattr(e, "connection_invalidated", False)
-                        )
-                        looks_transient = is_disconnect or any(
-                            tok in msg
-                            for tok in (
-                                "deadlock",
-                                "timeout",
-                                "could not serialize access",
-                                "lock wait timeout exceeded",
-                                "connection reset",
-                                "broken pipe",
-                            )
-                        )
-                        if attempt >= max_retries or not looks_transient:
-                            logger.error(
-                                "Insert batch failed (attempt %s/%s). Giving up. Error: %s",
-                                attempt + 1,
-                                max_retries,
-                                e,
-                            )
-                            raise
-                        # Backoff with jitter
-                        sleep = min(
-                            backoff_max_seconds,
-                            backoff_base_seconds * (2**attempt),
-                        )
-                        # full jitter in [0.5x, 1.5x]
-                        sleep *= 0.5 + random.random()
-                        attempt += 1
-                        logger.warning(
-                            "Transient DB error on insert (attempt %s/%s). Retrying in %.2fs: %s",
-                            attempt,
-                            max_retries,
-                            sleep,
-                            e,
-                        )
-                        time.sleep(sleep)
-
-                inserted_total += len(batch)
-                logger.info(
-                    "   inserted %s rows (total %s)", len(batch), inserted_total
+                result.rows = _transfer_query(
+                    source_engine,
+                    dest_engine,
+                    table_name,
+                    query,
+                    dest_schema=dest_schema,
+                    chunk_size=chunk_size,
+                    lowercase_columns=lowercase_columns,
+                    write_mode=effective_write_mode(None, table_name, write_mode),
+                    row_limit=row_limit,
+                    max_retries=max_retries,
+                    backoff_base_seconds=backoff_base_seconds,
+                    backoff_max_seconds=backoff_max_seconds,
+                    pipeline_depth=pipeline_depth,
+                    loader=loader,
+                    shadow_run_id=shadow_run_id,
+                    minimal_logging=minimal_logging,
+                    table_options=table_options,
+                    metrics=table_metrics,
                 )
+            else:
+                result.rows = _transfer_table(
+                    source_engine,
+                    dest_engine,
+                    table_name,
+                    source_schema=source_schema,
+                    dest_schema=dest_schema,
+                    chunk_size=chunk_size,
+                    lowercase_columns=lowercase_columns,
+                    write_mode=effective_write_mode(
+                        incremental, table_name, write_mode
+                    ),
+                    row_limit=row_limit,
+                    row_count=row_counts.get(table_name),
+                    log_row_count=log_row_count,
+                    max_retries=max_retries,
+                    backoff_base_seconds=backoff_base_seconds,
+                    backoff_max_seconds=backoff_max_seconds,
+                    partitions=n_partitions,
+                    partition_column=partition_column,
+                    pipeline_depth=pipeline_depth,
+                    loader=loader,
+                    keyset_column=configured_key or ("auto" if keyset else None),
+                    checkpoints=checkpoints,
+                    incremental=plan,
+                    memory_budget_mb=memory_budget_mb,
+                    concurrent_tables=workers,
+                    exact_row_count=exact_row_count,
+                    schema_cache=schema_cache,
+                    shadow_run_id=shadow_run_id,
+                    minimal_logging=minimal_logging,
+                    table_options=table_options,
+                    metrics=table_metrics,
+                )
+            metrics.log_table(table_metrics)
+            if watermarks is not None and plan is not None:
+                watermarks.save(plan)
+            if on_table_loaded is not None:
+                on_table_loaded(table_name)
+            if checkpoints is not None:
+                checkpoints.mark_done(table_name, rows=result.rows)
+        except Exception as e:
+            if workers == 1:
+                # Sequential mode keeps fail-fast semantics
+                raise
+            logger.exception("Table %s failed: %s", table_name, e)
+            result.error = e
+        finally:
+            result.seconds = time.perf_counter() - t0
+            table_metrics.finish()
+        return result
 
-        logger.info("Finished table %s (%s rows)", qualified_dst, f"{inserted_total:,}")
+    if workers == 1:
+        results = [_run(t) for t in ordered]
+    else:
+        logger.info("Copying %d table(s) with %d worker(s)", len(ordered), workers)
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="direct_transfer"
+        ) as pool:
+            results = list(pool.map(_run, ordered))
+
+    _log_summary(results, time.perf_counter() - started)
+    if schema_cache is not None:
+        schema_cache.log_summary()
+
+    failed = [r.table for r in results if not r.ok]
+    if failed:
+        raise RuntimeError(
+            f"Direct transfer failed for {len(failed)} table(s): {', '.join(failed)}"
+        )
+    return results
@@ -1,17 +1,64 @@
 import os
 import json
+import time
 import uuid
 import logging
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Iterable
+from typing import Callable, Iterable, Mapping
 
 import polars as pl
 import pyarrow as pa
 import connectorx as cx
-from sqlalchemy import text
+from sqlalchemy import Table, select
 from sqlalchemy.engine import Engine
-from sqlalchemy.engine.url import make_url
+from sql_to_staging.functions.chunk_sizing import ChunkSizer, connectorx_row_bytes
+from sql_to_staging.functions.checkpoints import (
+    CheckpointStore,
+    decode_key,
+    encode_key,
+)
+from sql_to_staging.functions.connectorx_sql import (
+    connectorx_select,
+    connectorx_target,
+)
+from sql_to_staging.functions.keyset import keyset_page, resolve_keyset_column
+from sql_to_staging.functions.parquet_writer import TableParquetWriter
+from sql_to_staging.functions.partitioning import (
+    connectorx_partition_kwargs,
+    partition_predicates,
+    resolve_partition_column,
+    table_partitions,
+)
+from sql_to_staging.functions.projection import (
+    combine_where,
+    combine_where_sql,
+    connectorx_columns,
+    drop_arrow_column,
+    project_table,
+    table_columns,
+    table_where,
+)
+from sql_to_staging.functions.row_estimates import (
+    format_progress,
+    report_row_count,
+    source_row_count,
+)
+from sql_to_staging.functions.schema_cache import SchemaCache, reflect_table
+from sql_to_staging.functions.source_queries import source_query_sql, table_query
+from sql_to_staging.functions.watermarks import (
+    IncrementalPlan,
+    literal_where,
+    resolve_column,
+)
+from utils.database.dialects import connectorx_scheme
 from utils.database.identifiers import quote_fqn
+from utils.logging.metrics import TableMetrics, TransferMetrics, timed, timed_iter
+from utils.parquet.spill import SpillManager
+from utils.parquet.write_options import ParquetWriteOptions
 
 logger = logging.getLogger("sql_to_staging.download_parquet")
 
@@ -25,6 +72,19 @@ def download_parquet(
     *,
     row_limit: int | None = None,
     log_row_count: bool = True,
+    partitions: int = 1,
+    table_options: Mapping[str, Mapping[str, str]] | None = None,
+    keyset: bool = False,
+    checkpoints: CheckpointStore | None = None,
+    incremental: Mapping[str, IncrementalPlan] | None = None,
+    memory_budget_mb: int | None = None,
+    exact_row_count: bool = False,
+    schema_cache: SchemaCache | None = None,
+    metrics: TransferMetrics | None = None,
+    max_file_mb: int | None = None,
+    parquet_options: ParquetWriteOptions | None = None,
+    on_table_dumped: Callable[[str, list[str]], None] | None = None,
+    spill: SpillManager | None = None,
 ):
     """
     Dumps specified *tables* to Parquet files **without ever holding more than
@@ -40,6 +100,72 @@ def download_parquet(
             with `batch_size` to iterate and write Parquet part files.
 
         This avoids manual SQL pagination and keeps memory bounded to ~chunk_size rows.
+
+        With partitions > 1 (globally or per table via table_options), a table is
+        read in parallel key ranges: the SQLAlchemy path splits a numeric/date
+        column ("partition_column", or the primary key) using MIN/MAX and streams
+        each range with its own connection and worker; the ConnectorX path passes
+        the "partition_column" (or the first integer primary key column from the
+        catalog) as partition_on/partition_num and writes the parts of all
+        ranges with a pool of one writer per partition.
+
+        With keyset (or a per-table "keyset_column"), the SQLAlchemy path reads
+        the table in pages of `WHERE key > :last ORDER BY key` with a row limit,
+        one part file per page, instead of one long-running cursor.
+
+        With checkpoints, the files of every finished table and the last written
+        key of keyset tables are recorded. A store opened with resume=True skips
+        finished tables (reusing their files when still present) and continues
+        keyset tables after their last written part.
+
+        With incremental plans (see sql_to_staging.functions.watermarks), tables
+        with a watermark column only dump the rows within the plan's bounds.
+
+        Per-table "columns" and "where" options (see
+        sql_to_staging.functions.projection) are pushed down to the source
+        query, so only those columns and rows end up in the Parquet files.
+
+        With memory_budget_mb, the rows per chunk are chosen per table from the
+        budget (see sql_to_staging.functions.chunk_sizing): from the reflected
+        column types on the SQLAlchemy path (refined per page for keyset
+        tables), and from a small Arrow sample on the ConnectorX path.
+
+        With log_row_count, the rows of each table are taken from the catalog
+        statistics (see sql_to_staging.functions.row_estimates), or counted
+        with COUNT(*) when exact_row_count is set, and chunk logs show the
+        progress and ETA against that count.
+
+        With a schema_cache, the SQLAlchemy path reuses source table definitions
+        from the cache (see sql_to_staging.functions.schema_cache); each table
+        is reflected at most once per run either way.
+
+        Tables with a "query" option (SRC_QUERY_<table>, see
+        sql_to_staging.functions.source_queries) dump the result of that query
+        instead of the table; on the ConnectorX path an explicit partition
+        column still applies, keyset pagination and row estimates do not.
+
+        With max_file_mb, the chunks of a table are written as row groups of
+        one parquet file straight from Arrow, starting a new file once it
+        reaches max_file_mb (see sql_to_staging.functions.parquet_writer),
+        instead of one file per chunk. Keyset-paginated tables keep one file
+        per page.
+
+        All parquet files are written with `parquet_options` (codec, level,
+        row-group size, dictionary encoding, statistics; see
+        utils.parquet.write_options); without it the polars defaults apply.
+
+        `on_table_dumped` is called with the table name and its files as soon
+        as a table is complete (also for tables taken from a resumed run), so
+        it can be uploaded while the next table is dumped (see
+        utils.parquet.upload_pipeline). It may block to slow the dump down.
+
+        With `spill`, every written file is recorded in the spill budget and
+        the dump blocks while it is exceeded, until finished tables have been
+        uploaded and deleted (see utils.parquet.spill).
+
+        Every chunk is timed as fetch (source read) and write (parquet file);
+        a line per table logs the breakdown with rows/s and bytes/s, and the
+        timings are collected in `metrics` (see utils.logging.metrics).
     """
 
     # Create destination directory once
@@ -49,6 +175,9 @@ def download_parquet(
     # limit itself strictly to these files (avoids picking up leftovers from previous runs).
     run_id = uuid.uuid4().hex
     created_files: list[str] = []  # file names relative to output_dir
+    table_files: dict[str, list[str]] = {}  # the same files per table
+    metrics = metrics if metrics is not None else TransferMetrics()
+    parquet_options = parquet_options or ParquetWriteOptions()
 
     # ──────────────────────────────────────────────────────────────────────
     # 1 Identify connection mode
@@ -73,61 +202,238 @@ def download_parquet(
         # and will rebuild the SELECT accordingly; here, just join parts plainly.
         return f"{schema}.{tbl}"
 
+    reflected: dict[str, Table] = {}
+
+    def _reflect(table: str) -> Table:
+        if table not in reflected:
+            reflected[table] = project_table(
+                reflect_table(engine, table, schema=schema, cache=schema_cache),
+                table_options,
+                table,
+            )
+        return reflected[table]
+
+    def _sizer_for(table: str, src_table: Table, in_flight: int) -> ChunkSizer | None:
+        if not memory_budget_mb:
+            return None
+        sizer = ChunkSizer.for_table(
+            memory_budget_mb, src_table, label=table, in_flight=in_flight
+        )
+        sizer.log_choice()
+        return sizer
+
+    def _dump_keyset(
+        table: str,
+        src_table: Table,
+        key_column: str,
+        where=None,
+        sizer: ChunkSizer | None = None,
+        tm: TableMetrics | None = None,
+    ) -> None:
+        # One short query and one part file per page; the checkpoint holds the
+        # last key and the files written so far
+        state = checkpoints.get(table) if checkpoints is not None else None
+        after = None
+        files: list[str] = []
+        rows = 0
+        if (
+            state
+            and state.get("keyset_column") == key_column
+            and state.get("last_key") is not None
+        ):
+            after = decode_key(state["last_key"])
+            files = list(state.get("files") or [])
+            rows = int(state.get("rows") or 0)
+            logger.info(
+                "   (resuming after %s=%r; %s rows in %d file(s) already written)",
+                key_column,
+                after,
+                f"{rows:,}",
+                len(files),
+            )
+        elif checkpoints is not None:
+            checkpoints.reset(table)
+
+        while True:
+            limit = sizer.next_size() if sizer is not None else chunk_size
+            if row_limit and row_limit > 0:
+                limit = min(limit, row_limit - rows)
+                if limit <= 0:
+                    break
+            with timed(tm, "fetch"), engine.connect() as pconn:
+                page_df = pl.read_database(
+                    query=keyset_page(
+                        src_table, key_column, after=after, limit=limit, where=where
+                    ),
+                    connection=pconn,
+                    infer_schema_length=limit,
+                )
+            if page_df.height == 0:
+                break
+            if sizer is not None:
+                sizer.observe(page_df.height, page_df.estimated_size())
+            out = os.path.join(output_dir, f"{table}_part{len(files):04d}.parquet")
+            with timed(tm, "write"):
+                parquet_options.write(page_df, out)
+            _spilled(table, out)
+            if tm is not None:
+                tm.add_chunk(page_df.height, page_df.estimated_size())
+            files.append(os.path.basename(out))
+            after = page_df.get_column(key_column)[-1]
+            rows += page_df.height
+            if checkpoints is not None:
+                checkpoints.update(
+                    table,
+                    keyset_column=key_column,
+                    last_key=encode_key(after),
+                    rows=rows,
+                    files=list(files),
+                )
+            logger.info(
+                "keyset page %s written: %s (%s rows, %s=%r)",
+                len(files) - 1,
+                out,
+                page_df.height,
+                key_column,
+                after,
+            )
+            if page_df.height < limit:
+                break
+        created_files.extend(files)
+
     # ──────────────────────────────────────────────────────────────────────
     # 2 Export loop per table
     # ──────────────────────────────────────────────────────────────────────
-    for table in tables:
+    def _expected_rows(table: str, source, plan) -> int | None:
+        # Upfront row count: a catalog estimate, or an exact COUNT(*) when opted in
+        if not log_row_count:
+            logger.info("   (row count skipped; LOG_ROW_COUNT disabled)")
+            return None
+        if table_query(table_options, table) is not None:
+            logger.info("   (row count skipped; custom source query)")
+            return None
+        count = source_row_count(source, schema, table, exact=exact_row_count)
+        report_row_count(count, exact=exact_row_count, source=source)
+        if count is None or plan is not None or table_where(table_options, table):
+            # The count of the whole table says nothing about a delta or filter
+            return None
+        return min(count, row_limit) if row_limit and row_limit > 0 else count
+
+    def _table_writer(table: str, slots: int) -> TableParquetWriter | None:
+        if not max_file_mb:
+            return None
+        return TableParquetWriter(
+            output_dir,
+            table,
+            max_file_bytes=max_file_mb * 1024 * 1024,
+            slots=slots,
+            options=parquet_options,
+        )
+
+    def _spilled(table: str, out: str) -> None:
+        # Blocks while the spill directory is over its budget (SPILL_MAX_GB)
+        if spill is not None:
+            spill.written(table, out)
+
+    def _close_writer(writer: TableParquetWriter | None) -> None:
+        # Also on errors: an unclosed file has no parquet footer
+        if writer is not None:
+            created_files.extend(writer.close())
+
+    def _dump_table(table: str, tm: TableMetrics) -> None:
         qualified = qualify(table)
+        keyset_cfg = (table_options or {}).get(table, {}).get("keyset_column") or (
+            "auto" if keyset else None
+        )
+        plan = (incremental or {}).get(table)
         base_select = f"SELECT * FROM {qualified}"
+        query = table_query(table_options, table)
+        if query is not None:
+            keyset_cfg = None
 
         # ── ConnectorX path ───────────────────────────────────
         if is_uri:
             logger.info("Dumping table via ConnectorX (arrow_stream): %s", qualified)
-            # Parse the URI robustly and normalize driver suffixes (e.g. postgresql+psycopg2 -> postgresql)
-            try:
-                parsed = make_url(uri)
-                scheme = (parsed.drivername or "").lower()
-            except Exception:
-                # Fallback to string parsing if URL parsing fails
-                scheme = uri.split("://", 1)[0].lower()
-            scheme = scheme.split("+", 1)[0]
-
-            # Build a quoted target and a dialect-correct SELECT, preserving any row limits
-            try:
-                quoted_target = (
-                    quote_fqn(scheme, [schema, table])
-                    if schema
-                    else quote_fqn(scheme, [table])
+            scheme = connectorx_scheme(uri)
+            quoted_target = connectorx_target(scheme, schema, table)
+            cx_columns = connectorx_columns(table_options, table)
+            cx_where = combine_where_sql(
+                literal_where(plan, scheme) if plan is not None else None,
+                table_where(table_options, table),
+            )
+            # ConnectorX reads the key ranges in parallel (an explicit partition
+            # column, or the integer primary key)
+            n_partitions, partition_column = table_partitions(
+                table_options, table, partitions
+            )
+            cx_kwargs = connectorx_partition_kwargs(
+                uri,
+                schema,
+                table,
+                n_partitions,
+                partition_column,
+                row_limit=row_limit,
+                is_query=query is not None,
+            )
+            partition_on = cx_kwargs.get("partition_on")
+            # Read only to split the query; not part of the SRC_COLUMNS projection
+            helper_column: str | None = None
+            if (
+                partition_on
+                and cx_columns is not None
+                and partition_on.lower() not in {c.lower() for c in cx_columns}
+            ):
+                cx_columns.append(partition_on)
+                helper_column = partition_on
+            if query is not None:
+                logger.info("   (custom source query)")
+                base_select = source_query_sql(
+                    scheme, query, row_limit, where=cx_where, columns=cx_columns
                 )
-            except Exception:
-                # Fallback: leave unquoted if quoting fails
-                quoted_target = qualified
-
-            # Compose the SELECT with optional row limit per dialect
-            if row_limit and row_limit > 0:
-                if scheme in ("postgres", "postgresql", "mysql", "sqlite", "redshift"):
-                    base_select = f"SELECT * FROM {quoted_target} LIMIT {row_limit}"
-                elif scheme in ("mssql", "sqlserver", "sql server"):
-                    base_select = f"SELECT TOP ({row_limit}) * FROM {quoted_target}"
-                elif scheme == "oracle":
-                    base_select = f"SELECT * FROM {quoted_target} FETCH FIRST {row_limit} ROWS ONLY"
-                else:
-                    logger.warning(
-                        "Unknown URI scheme %r – skipping ROW_LIMIT for %s",
+            else:
+                base_select = connectorx_select(
+                    scheme, quoted_target, row_limit, where=cx_where, columns=cx_columns
+                )
+            if keyset_cfg is not None:
+                logger.info(
+                    "   (keyset pagination not available via ConnectorX; "
+                    "the table is resumed as a whole)"
+                )
+            batch_size = chunk_size
+            if memory_budget_mb:
+                # Arrow bytes per row of a small sample of the same query
+                row_bytes = connectorx_row_bytes(
+                    uri,
+                    source_query_sql(
+                        scheme, query, 1_000, where=cx_where, columns=cx_columns
+                    )
+                    if query is not None
+                    else connectorx_select(
                         scheme,
-                        qualified,
+                        quoted_target,
+                        1_000,
+                        where=cx_where,
+                        columns=cx_columns,
+                    ),
+                )
+                if row_bytes is not None:
+                    sizer = ChunkSizer(
+                        memory_budget_mb,
+                        row_bytes,
+                        label=table,
+                        in_flight=2 * cx_kwargs.get("partition_num", 1),
                     )
-                    base_select = f"SELECT * FROM {quoted_target}"
-            else:
-                base_select = f"SELECT * FROM {quoted_target}"
-            # Stream arrow record batches directly from the source using ConnectorX
+                    sizer.log_choice()
+                    batch_size = sizer.fixed_size("ConnectorX")
             reader_or_iter: Iterable
-            reader_or_iter = cx.read_sql(
-                uri,
-                base_select,
-                return_type="arrow_stream",
-                batch_size=chunk_size,
-            )
+            with timed(tm, "fetch"):
+                reader_or_iter = cx.read_sql(
+                    uri,
+                    base_select,
+                    return_type="arrow_stream",
+                    batch_size=batch_size,
+                    **cx_kwargs,
+                )
 
             # The return can be a RecordBatchReader or an iterable of RecordBatch
             try:
@@ -154,91 +460,89 @@ def download_parquet(
 
                 iterator = _ReaderIter(reader)
 
-            # Optional row count upfront for connectorx path (may be costly).
-            #
-            # NOTE: This path historically depended on pandas, which is only
-            # included in the dev extra. To avoid raising ImportError in
-            # production installs, we guard the pandas dependency and fall back
-            # to a best-effort COUNT(*) when pandas is unavailable.
-            if log_row_count:
-                try:
-                    import pandas as _pd  # type: ignore[import-not-found]
+            expected_rows = _expected_rows(table, uri, plan)
+            started = time.perf_counter()
+            rows_written = 0
 
-                    cnt_select = f"SELECT COUNT(*) FROM {quoted_target}"
-                    cnt_df = cx.read_sql(uri, cnt_select, return_type="pandas")
-                    cnt_value_repr = str(cnt_df.iloc[0, 0])
-                    logger.info("   (total rows: %s)", cnt_value_repr)
-                except ImportError:
-                    logger.info(
-                        "   (row count skipped; pandas not installed – "
-                        "install the dev extra or set LOG_ROW_COUNT=False)"
-                    )
-                except Exception as e:
-                    logger.warning(
-                        "Failed to COUNT(*) via ConnectorX for %s: %s", qualified, e
-                    )
-            else:
-                logger.info("   (row count skipped; LOG_ROW_COUNT disabled)")
+            # With partitions, the batches of all ranges are written by a pool
+            # of writers (parquet encoding releases the GIL); at most two
+            # batches per writer are in flight, and parts are recorded in order
+            writers = cx_kwargs.get("partition_num", 1)
+            writer = _table_writer(table, writers)
 
-            wrote_any = False
-            part_written = 0
-            for batch in iterator:
-                # Ensure we have a non-empty batch; some sources could return empty
-                if getattr(batch, "num_rows", None) in (0, None):
-                    continue
-                table_arrow = pa.Table.from_batches([batch])
-                df: pl.DataFrame = pl.from_arrow(table_arrow)  # type: ignore[assignment]
-
-                out = os.path.join(
-                    output_dir, f"{table}_part{part_written:04d}.parquet"
-                )
-                df.write_parquet(out)
-                created_files.append(os.path.basename(out))
-                wrote_any = True
-                try:
-                    nrows = len(df)
-                except Exception:
-                    nrows = "?"
+            def _write_part(batch, out: str, slot: int) -> tuple[str, int]:
+                with timed(tm, "write"):
+                    if writer is not None:
+                        out = writer.write(batch, slot)
+                    else:
+                        table_arrow = pa.Table.from_batches([batch])
+                        df: pl.DataFrame = pl.from_arrow(table_arrow)  # type: ignore[assignment]
+                        parquet_options.write(df, out)
+                _spilled(table, out)
+                tm.add_chunk(batch.num_rows, batch.nbytes)
+                return out, batch.num_rows
+
+            def _part_done(part: int, written: tuple[str, int]) -> None:
+                nonlocal rows_written
+                out, rows = written
+                if writer is None:
+                    created_files.append(os.path.basename(out))
+                rows_written += rows
                 logger.info(
-                    "ConnectorX chunk %s written: %s (%s rows)",
-                    part_written,
+                    "ConnectorX chunk %s written: %s (%s rows%s)",
+                    part,
                     out,
-                    nrows,
+                    rows,
+                    format_progress(
+                        rows_written, expected_rows, time.perf_counter() - started
+                    ),
                 )
-                part_written += 1
 
-            if not wrote_any:
+            pending: deque = deque()
+            part_written = 0
+            with ThreadPoolExecutor(
+                max_workers=writers, thread_name_prefix=f"{table}_write"
+            ) as pool:
+                try:
+                    for batch in timed_iter(iterator, tm, "fetch"):
+                        # Some sources return empty batches; skip them
+                        if getattr(batch, "num_rows", None) in (0, None):
+                            continue
+                        if helper_column is not None:
+                            batch = drop_arrow_column(batch, helper_column)
+                        out = os.path.join(
+                            output_dir, f"{table}_part{part_written:04d}.parquet"
+                        )
+                        slot = part_written % writers
+                        if writers == 1:
+                            _part_done(part_written, _write_part(batch, out, slot))
+                        else:
+                            pending.append(
+                                (
+                                    part_written,
+                                    pool.submit(_write_part, batch, out, slot),
+                                )
+                            )
+                            while len(pending) >= 2 * writers:
+                                part, future = pending.popleft()
+                                _part_done(part, future.result())
+                        part_written += 1
+                    while pending:
+                        part, future = pending.popleft()
+                        _part_done(part, future.result())
+                finally:
+                    for _, future in pending:
+                        future.cancel()
+                    _close_writer(writer)
+
+            if part_written == 0:
                 logger.info("   (no rows)")
 
         # ── SQLAlchemy Engine path  ────────────
         else:
             logger.info("Dumping table via SQLAlchemy: %s", qualified)
+            expected_rows = _expected_rows(table, engine, plan)
             with engine.connect() as conn:
-                if log_row_count:
-                    if row_limit and row_limit > 0:
-                        logger.info(
-                            "   (row count skipped; ROW_LIMIT is set – using limit instead)"
-                        )
-                    else:
-                        try:
-                            qname = (
-                                quote_fqn(engine, [schema, table])
-                                if schema
-                                else quote_fqn(engine, [table])
-                            )
-                            row_count = conn.execute(
-                                text(f"SELECT COUNT(*) FROM {qname}")
-                            ).scalar()
-                            logger.info("   (total rows: %s)", f"{row_count:,}")
-                        except Exception as err:
-                            logger.warning(
-                                "Failed to COUNT(*) via SQLAlchemy for %s: %s",
-                                qualified,
-                                err,
-                            )
-                else:
-                    logger.info("   (row count skipped; LOG_ROW_COUNT disabled)")
-
                 # Apply optional row limit based on SQLAlchemy engine dialect
                 # Ensure base_select uses quoted target
                 q_target = (
@@ -264,18 +568,225 @@ def download_parquet(
                             qualified,
                         )
 
-                batches = pl.read_database(
-                    query=limited_select,
-                    connection=conn,
-                    iter_batches=True,
-                    batch_size=chunk_size,
-                    infer_schema_length=chunk_size,
+                # Incremental tables only read the rows within the watermark
+                # bounds; configured columns and filters are pushed down as well
+                where = None
+                filter_sql = table_where(table_options, table)
+                if query is not None:
+                    logger.info("   (custom source query)")
+                    limited_select = source_query_sql(
+                        engine.dialect.name.lower(),
+                        query,
+                        row_limit,
+                        where=filter_sql,
+                        columns=table_columns(table_options, table),
+                    )
+                elif (
+                    plan is not None
+                    or filter_sql
+                    or table_columns(table_options, table) is not None
+                ):
+                    src_table = _reflect(table)
+                    where = combine_where(
+                        plan.predicate(
+                            src_table.c[resolve_column(src_table, plan.column)]
+                        )
+                        if plan is not None
+                        else None,
+                        filter_sql,
+                    )
+                    stmt = select(src_table)
+                    if where is not None:
+                        stmt = stmt.where(where)
+                    if row_limit and row_limit > 0:
+                        stmt = stmt.limit(row_limit)
+                    limited_select = stmt
+
+                if keyset_cfg is not None:
+                    src_table = _reflect(table)
+                    key_column = resolve_keyset_column(src_table, keyset_cfg)
+                    if key_column is not None:
+                        _dump_keyset(
+                            table,
+                            src_table,
+                            key_column,
+                            where=where,
+                            sizer=_sizer_for(table, src_table, 2),
+                            tm=tm,
+                        )
+                        return
+                    logger.info(
+                        "   (keyset pagination skipped; no single-column primary key on %s)",
+                        qualified,
+                    )
+
+                n_partitions, partition_column = table_partitions(
+                    table_options, table, partitions
+                )
+                predicates: list = []
+                if n_partitions > 1 and query is not None:
+                    logger.info("   (partitioning skipped; custom source query)")
+                elif n_partitions > 1:
+                    if row_limit and row_limit > 0:
+                        logger.info("   (partitioning skipped; ROW_LIMIT is set)")
+                    else:
+                        src_table = _reflect(table)
+                        key_column = resolve_partition_column(
+                            src_table, partition_column
+                        )
+                        if key_column is None:
+                            logger.info(
+                                "   (partitioning skipped; no numeric/date primary key on %s)",
+                                qualified,
+                            )
+                        else:
+                            predicates = partition_predicates(
+                                engine,
+                                src_table,
+                                key_column,
+                                n_partitions,
+                                where=where,
+                            )
+
+                batch_size = chunk_size
+                if memory_budget_mb and query is None:
+                    src_table = _reflect(table)
+                    sizer = _sizer_for(table, src_table, 2 * max(1, len(predicates)))
+                    if sizer is not None:
+                        batch_size = sizer.fixed_size("pl.read_database")
+
+                if len(predicates) <= 1:
+                    batches = pl.read_database(
+                        query=limited_select,
+                        connection=conn,
+                        iter_batches=True,
+                        batch_size=batch_size,
+                        infer_schema_length=batch_size,
+                    )
+                    started = time.perf_counter()
+                    rows_written = 0
+                    writer = _table_writer(table, 1)
+                    try:
+                        for idx, batch_df in enumerate(
+                            timed_iter(batches, tm, "fetch")
+                        ):
+                            out = os.path.join(
+                                output_dir, f"{table}_part{idx:04d}.parquet"
+                            )
+                            with timed(tm, "write"):
+                                if writer is not None:
+                                    out = writer.write(batch_df.to_arrow())
+                                else:
+                                    parquet_options.write(batch_df, out)
+                                    created_files.append(os.path.basename(out))
+                            _spilled(table, out)
+                            tm.add_chunk(batch_df.height, batch_df.estimated_size())
+                            rows_written += batch_df.height
+                            logger.info(
+                                "pl.read_database chunk %s written: %s (%s rows%s)",
+                                idx,
+                                out,
+                                batch_df.height,
+                                format_progress(
+                                    rows_written,
+                                    expected_rows,
+                                    time.perf_counter() - started,
+                                ),
+                            )
+                    finally:
+                        _close_writer(writer)
+                    return
+
+            # Partitioned read: each key range is streamed by its own worker and
+            # connection; part numbers are shared across workers.
+            part_counter = itertools.count()
+            files_lock = threading.Lock()
+            writer = _table_writer(table, len(predicates))
+
+            def _dump_range(pred, label: str, slot: int) -> None:
+                range_select = select(src_table).where(pred)
+                if where is not None:
+                    range_select = range_select.where(where)
+                with engine.connect() as pconn:
+                    batches = pl.read_database(
+                        query=range_select,
+                        connection=pconn,
+                        iter_batches=True,
+                        batch_size=batch_size,
+                        infer_schema_length=batch_size,
+                    )
+                    for batch_df in timed_iter(batches, tm, "fetch"):
+                        with files_lock:
+                            idx = next(part_counter)
+                        out = os.path.join(output_dir, f"{table}_part{idx:04d}.parquet")
+                        with timed(tm, "write"):
+                            if writer is not None:
+                                out = writer.write(batch_df.to_arrow(), slot)
+                            else:
+                                parquet_options.write(batch_df, out)
+                                with files_lock:
+                                    created_files.append(os.path.basename(out))
+                        _spilled(table, out)
+                        tm.add_chunk(batch_df.height, batch_df.estimated_size())
+                        logger.info(
+                            "pl.read_database %s chunk %s written: %s", label, idx, out
+                        )
+
+            try:
+                with ThreadPoolExecutor(
+                    max_workers=len(predicates), thread_name_prefix=f"{table}_part"
+                ) as pool:
+                    futures = [
+                        pool.submit(
+                            _dump_range, pred, f"{table}[{i + 1}/{len(predicates)}]", i
+                        )
+                        for i, pred in enumerate(predicates)
+                    ]
+                    for f in futures:
+                        f.result()
+            finally:
+                _close_writer(writer)
+
+    for table in tables:
+        if checkpoints is not None and checkpoints.is_uploaded(table):
+            # Loaded by the resumed run (e.g. PIPELINED_UPLOAD); its files may
+            # already be cleaned up and it must not be loaded twice
+            logger.info("Skipping table %s (uploaded in the resumed run)", table)
+            continue
+        if checkpoints is not None and checkpoints.is_done(table):
+            done_files = (checkpoints.get(table) or {}).get("files") or []
+            if all(os.path.exists(os.path.join(output_dir, f)) for f in done_files):
+                logger.info(
+                    "Skipping table %s (dumped in the resumed run; %d file(s))",
+                    table,
+                    len(done_files),
                 )
-                for idx, batch_df in enumerate(batches):
-                    out = os.path.join(output_dir, f"{table}_part{idx:04d}.parquet")
-                    batch_df.write_parquet(out)
-                    created_files.append(os.path.basename(out))
-                    logger.info("pl.read_database chunk %s written: %s", idx, out)
+                created_files.extend(done_files)
+                table_files[table] = list(done_files)
+                if spill is not None:
+                    spill.track(
+                        table, [os.path.join(output_dir, f) for f in done_files]
+                    )
+                    spill.finished(table)
+                if on_table_dumped is not None:
+                    on_table_dumped(table, list(done_files))
+                continue
+            logger.info("   (files of %s from the resumed run are missing)", table)
+            checkpoints.reset(table)
+        files_before = len(created_files)
+        table_metrics = metrics.table("download_parquet", table)
+        try:
+            _dump_table(table, table_metrics)
+        finally:
+            table_metrics.finish()
+        metrics.log_table(table_metrics)
+        table_files[table] = created_files[files_before:]
+        if checkpoints is not None:
+            checkpoints.mark_done(table, files=created_files[files_before:])
+        if spill is not None:
+            spill.finished(table)
+        if on_table_dumped is not None:
+            on_table_dumped(table, list(table_files[table]))
 
     # Write a manifest for this run so upload can be restricted to the current files only.
     # Fail fast if the manifest cannot be written – silently returning None causes the
@@ -290,6 +801,7 @@ def download_parquet(
             "created_at": datetime.now(timezone.utc).isoformat(),
             "output_dir": os.path.abspath(output_dir),
             "files": created_files,
+            "tables": table_files,
         }
         # Atomic-ish write: write to a temp file first then rename
         tmp_path = f"{manifest_path}.tmp"
@@ -313,4 +825,6 @@ def download_parquet(
     logger.info("Export complete - all tables written")
 
     # Return the manifest path for callers that wish to limit subsequent upload
+    if schema_cache is not None:
+        schema_cache.log_summary()
     return manifest_path
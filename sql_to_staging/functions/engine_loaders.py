@@ -11,7 +11,7 @@ def load_source_connection(cfg: Any, transfer_mode: str):
     """Create a source connection based on TRANSFER_MODE.
 
     Returns either a SQLAlchemy Engine (for SQLALCHEMY_* modes)
-    or a ConnectorX URI (for CONNECTORX_DUMP).
+    or a ConnectorX URI (for CONNECTORX_DUMP and ARROW_DIRECT).
     Also initializes Oracle Instant Client when configured.
     """
     src_driver = cast(
@@ -121,7 +121,7 @@ def load_source_connection(cfg: Any, transfer_mode: str):
                 else None
             ),
         )
-    elif transfer_mode == "CONNECTORX_DUMP":
+    elif transfer_mode in {"CONNECTORX_DUMP", "ARROW_DIRECT"}:
         # Use ConnectorX URI
         uri = create_connectorx_uri(
             driver=src_driver,
@@ -0,0 +1,63 @@
+"""Keyset pagination helpers for resumable extraction.
+
+Instead of one long-running cursor over the whole table, rows are read in
+pages of `WHERE key > :last ORDER BY key` with a row limit (rendered by
+SQLAlchemy as LIMIT, TOP or FETCH FIRST depending on the dialect). Every page
+is a short query on its own connection, and the last key of a page is all
+that is needed to continue after a failure. Used by `direct_transfer` and
+the SQLAlchemy path of `download_parquet`.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from sqlalchemy import Table, select
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
+
+logger = logging.getLogger("sql_to_staging.keyset")
+
+
+def resolve_keyset_column(table: Table, configured: str | None) -> str | None:
+    """
+    Resolve the keyset column of table (case-insensitive).
+
+    A configured column must be unique and NOT NULL; rows with a NULL key are
+    never read. Without one (or with "auto") a single-column primary key is
+    used. Returns None when the table has no usable key.
+    """
+    if configured and configured.strip().lower() != "auto":
+        wanted = configured.strip().lower()
+        for col in table.columns:
+            if col.name.lower() == wanted:
+                return col.name
+        raise ValueError(
+            f"Keyset column {configured!r} not found in table {table.name!r}"
+        )
+    pk_cols = list(table.primary_key.columns)
+    if len(pk_cols) == 1:
+        return pk_cols[0].name
+    return None
+
+
+def keyset_page(
+    table: Table,
+    column: str,
+    *,
+    after: Any,
+    limit: int,
+    where: ColumnElement[bool] | None = None,
+) -> Select:
+    """Build the SELECT for the page of at most limit rows following key `after`."""
+    key = table.c[column]
+    stmt = select(table)
+    if where is not None:
+        stmt = stmt.where(where)
+    if after is not None:
+        stmt = stmt.where(key > after)
+    return stmt.order_by(key).limit(limit)
+
+
+__all__ = ["resolve_keyset_column", "keyset_page"]
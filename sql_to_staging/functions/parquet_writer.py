@@ -0,0 +1,146 @@
+"""Row-group parquet files per table (PARQUET_FILE_MAX_MB).
+
+By default every chunk of a dump becomes its own `{table}_partNNNN.parquet`
+file, converted through a polars DataFrame. For big tables that means
+thousands of tiny files. With a maximum file size, the chunks of a table are
+written straight from Arrow as row groups of one `pyarrow.parquet.ParquetWriter`
+instead, and a new file is started once the current one reaches the maximum
+size. The file names keep the `{table}_partNNNN.parquet` pattern; the
+manifest lists the files per table and uploads read them row group by row
+group. Keyset-paginated tables keep one file per page, so a resumed dump
+never continues in an unfinished file.
+
+The schema of a table is pinned from its first batch: later batches are cast
+to it (e.g. Int64 into a Float64 column), and columns that are all-null in the
+first batch are pinned as strings. A batch that cannot be cast fails the dump.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import threading
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from utils.parquet.write_options import ParquetWriteOptions
+
+logger = logging.getLogger("sql_to_staging.parquet_writer")
+
+
+def _pinned_schema(schema: pa.Schema) -> pa.Schema:
+    """Schema of the first batch, with all-null columns widened to strings."""
+    fields = [
+        field.with_type(pa.large_string()) if pa.types.is_null(field.type) else field
+        for field in schema
+    ]
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+class _Slot:
+    """One open file of a table writer; writes to it are serialized."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.writer: pq.ParquetWriter | None = None
+        self.path: str | None = None
+
+
+class TableParquetWriter:
+    """
+    Write the Arrow batches of one table as row groups into
+    `{table}_partNNNN.parquet` files of at most about `max_file_bytes` each.
+
+    With `slots` > 1, that many files are open at the same time so concurrent
+    writers (e.g. the partitions of a ConnectorX read) do not wait for each
+    other; each call picks a slot. A batch becomes one row group unless the
+    options cap the row-group size. Thread-safe; call `close()` once done.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        table: str,
+        *,
+        max_file_bytes: int,
+        slots: int = 1,
+        first_part: int = 0,
+        options: ParquetWriteOptions | None = None,
+    ):
+        if max_file_bytes <= 0:
+            raise ValueError("max_file_bytes must be > 0")
+        self.output_dir = output_dir
+        self.table = table
+        self.max_file_bytes = max_file_bytes
+        self.options = options or ParquetWriteOptions()
+        self.schema: pa.Schema | None = None
+        self.files: list[str] = []
+        self._slots = [_Slot() for _ in range(max(1, slots))]
+        self._parts = itertools.count(first_part)
+        self._lock = threading.Lock()
+
+    def _cast(self, data: pa.Table) -> pa.Table:
+        with self._lock:
+            if self.schema is None:
+                self.schema = _pinned_schema(data.schema)
+        if data.schema.equals(self.schema):
+            return data
+        if data.schema.names != self.schema.names:
+            raise ValueError(
+                f"Batch columns {data.schema.names} of {self.table} differ from the "
+                f"first batch {self.schema.names}"
+            )
+        try:
+            return data.cast(self.schema)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            raise ValueError(
+                f"Batch of {self.table} does not match the schema pinned from its "
+                f"first batch: {e}"
+            ) from e
+
+    def _open(self, slot: _Slot) -> None:
+        with self._lock:
+            part = next(self._parts)
+            path = os.path.join(self.output_dir, f"{self.table}_part{part:04d}.parquet")
+            self.files.append(os.path.basename(path))
+        slot.path = path
+        slot.writer = pq.ParquetWriter(
+            path, self.schema, **self.options.pyarrow_kwargs()
+        )
+
+    def write(self, batch: pa.RecordBatch | pa.Table, slot: int = 0) -> str:
+        """Append `batch` as a row group; return the file it was written to."""
+        data = self._cast(
+            pa.Table.from_batches([batch])
+            if isinstance(batch, pa.RecordBatch)
+            else batch
+        )
+        current = self._slots[slot % len(self._slots)]
+        with current.lock:
+            if current.writer is None:
+                self._open(current)
+            assert current.writer is not None and current.path is not None
+            current.writer.write_table(
+                data,
+                row_group_size=self.options.row_group_size or max(1, data.num_rows),
+            )
+            path = current.path
+            if os.path.getsize(path) >= self.max_file_bytes:
+                current.writer.close()
+                current.writer = None
+                logger.info("   (%s reached the maximum file size)", path)
+        return path
+
+    def close(self) -> list[str]:
+        """Close all open files; return the file names written, in part order."""
+        for slot in self._slots:
+            with slot.lock:
+                if slot.writer is not None:
+                    slot.writer.close()
+                    slot.writer = None
+        return sorted(self.files)
+
+
+__all__ = ["TableParquetWriter"]
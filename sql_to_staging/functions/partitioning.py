@@ -0,0 +1,306 @@
+"""Range partitioning helpers for parallel extraction of a single table.
+
+A numeric or date/datetime key column is split into N contiguous ranges using
+MIN/MAX, so each range can be streamed by its own worker with its own
+connection. Used by `direct_transfer` and the SQLAlchemy path of
+`download_parquet`.
+
+The ConnectorX paths (`download_parquet` with a URI, `arrow_transfer`) leave
+the range splitting to ConnectorX (`partition_on`/`partition_num`), which
+needs an integer column; without a configured column the first integer
+primary key column is looked up in the source catalog.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Mapping
+
+import connectorx as cx
+from sqlalchemy import Table, and_, func, or_, select
+from sqlalchemy import types as satypes
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import ColumnElement
+
+from utils.database.dialects import dialect_of, sql_literal
+
+logger = logging.getLogger("sql_to_staging.partitioning")
+
+# Catalog type names ConnectorX can split into ranges
+_INTEGER_TYPES = {
+    "int",
+    "integer",
+    "bigint",
+    "smallint",
+    "tinyint",
+    "mediumint",
+    "int2",
+    "int4",
+    "int8",
+    "unsigned big int",
+}
+# Exact numerics count as integers with scale 0 (e.g. Oracle NUMBER(10))
+_EXACT_NUMERIC_TYPES = {"number", "numeric", "decimal"}
+
+
+def _is_partitionable_type(t: satypes.TypeEngine) -> bool:
+    return isinstance(
+        t, (satypes.Integer, satypes.Numeric, satypes.Date, satypes.DateTime)
+    )
+
+
+def detect_partition_column(table: Table) -> str | None:
+    """
+    Pick a partition column from the primary key: the first numeric or
+    date/datetime PK column. Returns None when no suitable column exists.
+    """
+    for col in table.primary_key.columns:
+        if _is_partitionable_type(col.type):
+            return col.name
+    return None
+
+
+def resolve_partition_column(table: Table, configured: str | None) -> str | None:
+    """
+    Resolve the configured partition column against the reflected table
+    (case-insensitive). An empty value or "auto" falls back to the primary key.
+    A configured column that cannot be split into ranges (not numeric or
+    date/datetime) is ignored with a warning: the table is read unpartitioned.
+    """
+    if configured and configured.strip().lower() != "auto":
+        wanted = configured.strip().lower()
+        for col in table.columns:
+            if col.name.lower() == wanted:
+                if not _is_partitionable_type(col.type):
+                    logger.warning(
+                        "SRC_PARTITION_COLUMN_%s: column %s is %s, not numeric or "
+                        "date/datetime; reading the table unpartitioned",
+                        table.name,
+                        col.name,
+                        col.type,
+                    )
+                    return None
+                return col.name
+        raise ValueError(
+            f"Partition column {configured!r} not found in table {table.name!r}"
+        )
+    return detect_partition_column(table)
+
+
+def _split_bounds(lo: Any, hi: Any, partitions: int) -> list[Any]:
+    """Return partitions+1 ascending boundaries covering [lo, hi]."""
+    if isinstance(lo, datetime):
+        span = hi - lo
+        bounds = [lo + (span * i) / partitions for i in range(partitions)]
+    elif isinstance(lo, date):
+        # Keep date boundaries on whole days
+        days = (hi - lo).days
+        bounds = [
+            lo + timedelta(days=(days * i) // partitions) for i in range(partitions)
+        ]
+    elif isinstance(lo, (int, Decimal)) and isinstance(hi, (int, Decimal)):
+        span = hi - lo
+        bounds = [lo + (span * i) // partitions for i in range(partitions)]
+    else:
+        lo_f, hi_f = float(lo), float(hi)
+        step = (hi_f - lo_f) / partitions
+        bounds = [lo_f + step * i for i in range(partitions)]
+    bounds.append(hi)
+    # Collapse duplicate boundaries (small ranges split into fewer partitions)
+    deduped: list[Any] = []
+    for b in bounds:
+        if not deduped or b != deduped[-1]:
+            deduped.append(b)
+    return deduped
+
+
+def partition_predicates(
+    engine: Engine,
+    table: Table,
+    column_name: str,
+    partitions: int,
+    *,
+    where: ColumnElement[bool] | None = None,
+) -> list[ColumnElement[bool]]:
+    """
+    Split `column_name` of `table` into at most `partitions` ranges via MIN/MAX.
+
+    Returns one WHERE clause per range. Ranges are half-open except the last
+    one; NULL keys are included in the first range so no row is lost. Returns
+    an empty list when the table is empty.
+    """
+    col = table.c[column_name]
+    stmt = select(func.min(col), func.max(col))
+    if where is not None:
+        stmt = stmt.where(where)
+    with engine.connect() as conn:
+        lo, hi = conn.execute(stmt).one()
+    if lo is None or hi is None:
+        return []
+
+    bounds = _split_bounds(lo, hi, max(1, partitions))
+    if len(bounds) == 1:
+        # MIN == MAX: a single range holds everything
+        return [or_(col == lo, col.is_(None))]
+
+    preds: list[ColumnElement[bool]] = []
+    for i in range(len(bounds) - 1):
+        is_last = i == len(bounds) - 2
+        upper = col <= bounds[i + 1] if is_last else col < bounds[i + 1]
+        pred: ColumnElement[bool] = and_(col >= bounds[i], upper)
+        if i == 0:
+            pred = or_(pred, col.is_(None))
+        preds.append(pred)
+    logger.info(
+        "Partitioned %s on %s into %d range(s) (min=%s, max=%s)",
+        table.name,
+        column_name,
+        len(preds),
+        lo,
+        hi,
+    )
+    return preds
+
+
+def primary_key_query(dialect: str, schema: str | None, table: str) -> str | None:
+    """
+    SQL listing (column, data type, numeric scale) of the primary key of
+    [schema.]table in key order (SQLite: without the scale), or None for
+    unsupported dialects.
+    """
+    if dialect == "oracle":
+        owner = f"UPPER({sql_literal(schema)})" if schema else "USER"
+        return (
+            "SELECT cc.COLUMN_NAME, tc.DATA_TYPE, tc.DATA_SCALE "
+            "FROM ALL_CONSTRAINTS c "
+            "JOIN ALL_CONS_COLUMNS cc ON cc.OWNER = c.OWNER "
+            "AND cc.CONSTRAINT_NAME = c.CONSTRAINT_NAME "
+            "JOIN ALL_TAB_COLUMNS tc ON tc.OWNER = cc.OWNER "
+            "AND tc.TABLE_NAME = cc.TABLE_NAME AND tc.COLUMN_NAME = cc.COLUMN_NAME "
+            f"WHERE c.CONSTRAINT_TYPE = 'P' AND c.OWNER = {owner} "
+            f"AND c.TABLE_NAME IN ({sql_literal(table)}, UPPER({sql_literal(table)})) "
+            "ORDER BY cc.POSITION"
+        )
+    if dialect == "sqlite":
+        return (
+            "SELECT name, type FROM pragma_table_info("
+            f"{sql_literal(table)}) WHERE pk > 0 ORDER BY pk"
+        )
+    current = {
+        "postgresql": "current_schema()",
+        "mssql": "SCHEMA_NAME()",
+        "mysql": "DATABASE()",
+        "mariadb": "DATABASE()",
+    }.get(dialect)
+    if current is None:
+        return None
+    owner = sql_literal(schema) if schema else current
+    return (
+        "SELECT kcu.COLUMN_NAME, c.DATA_TYPE, c.NUMERIC_SCALE "
+        "FROM information_schema.TABLE_CONSTRAINTS tc "
+        "JOIN information_schema.KEY_COLUMN_USAGE kcu "
+        "ON kcu.CONSTRAINT_NAME = tc.CONSTRAINT_NAME "
+        "AND kcu.TABLE_SCHEMA = tc.TABLE_SCHEMA AND kcu.TABLE_NAME = tc.TABLE_NAME "
+        "JOIN information_schema.COLUMNS c ON c.TABLE_SCHEMA = kcu.TABLE_SCHEMA "
+        "AND c.TABLE_NAME = kcu.TABLE_NAME AND c.COLUMN_NAME = kcu.COLUMN_NAME "
+        f"WHERE tc.CONSTRAINT_TYPE = 'PRIMARY KEY' AND tc.TABLE_SCHEMA = {owner} "
+        f"AND tc.TABLE_NAME = {sql_literal(table)} "
+        "ORDER BY kcu.ORDINAL_POSITION"
+    )
+
+
+def _is_integer_type(type_name: Any, scale: Any) -> bool:
+    name = str(type_name or "").lower().split("(")[0].strip()
+    if name in _INTEGER_TYPES:
+        return True
+    return name in _EXACT_NUMERIC_TYPES and scale is not None and int(scale) == 0
+
+
+def detect_connectorx_partition_column(
+    uri: str, schema: str | None, table: str
+) -> str | None:
+    """First integer primary key column of the table read via ConnectorX, or None."""
+    sql = primary_key_query(dialect_of(uri), schema, table)
+    if sql is None:
+        return None
+    try:
+        rows = cx.read_sql(uri, sql, return_type="arrow").to_pylist()
+    except Exception as e:
+        logger.warning("Failed to read the primary key of %s: %s", table, e)
+        return None
+    for row in rows:
+        values = tuple(row.values())
+        scale = values[2] if len(values) > 2 else None
+        if _is_integer_type(values[1], scale):
+            return str(values[0])
+    return None
+
+
+def connectorx_partition_kwargs(
+    uri: str,
+    schema: str | None,
+    table: str,
+    partitions: int,
+    configured: str | None,
+    *,
+    row_limit: int | None = None,
+    is_query: bool = False,
+) -> dict[str, Any]:
+    """
+    partition_on/partition_num for cx.read_sql, or {} when the table is read
+    as a single stream. An empty or "auto" column falls back to the first
+    integer primary key column (custom source queries need an explicit one).
+    """
+    if partitions <= 1:
+        return {}
+    if row_limit and row_limit > 0:
+        logger.info("   (partitioning skipped; ROW_LIMIT is set)")
+        return {}
+    column = (
+        configured.strip()
+        if configured and configured.strip().lower() != "auto"
+        else None
+    )
+    if column is None:
+        if is_query:
+            logger.info(
+                "   (partitioning skipped; custom source queries need an explicit "
+                "partition column)"
+            )
+            return {}
+        column = detect_connectorx_partition_column(uri, schema, table)
+        if column is None:
+            logger.info(
+                "   (partitioning skipped; no integer primary key on %s)", table
+            )
+            return {}
+        logger.info("   (partition column %s taken from the primary key)", column)
+    logger.info("   (ConnectorX partition_on=%s, partition_num=%s)", column, partitions)
+    return {"partition_on": column, "partition_num": partitions}
+
+
+def table_partitions(
+    table_options: Mapping[str, Mapping[str, str]] | None,
+    table_name: str,
+    default_partitions: int,
+) -> tuple[int, str | None]:
+    """Return (partitions, configured column) for a table from its options."""
+    opts = (table_options or {}).get(table_name, {})
+    partitions = default_partitions
+    raw = opts.get("partitions")
+    if raw:
+        partitions = int(raw)
+    return max(1, partitions), opts.get("partition_column")
+
+
+__all__ = [
+    "connectorx_partition_kwargs",
+    "detect_connectorx_partition_column",
+    "detect_partition_column",
+    "primary_key_query",
+    "resolve_partition_column",
+    "partition_predicates",
+    "table_partitions",
+]
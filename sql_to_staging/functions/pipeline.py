@@ -0,0 +1,89 @@
+"""Producer/consumer helper to overlap source fetching with destination writes.
+
+`prefetch` runs an iterable in a background thread and hands its items to the
+caller through a bounded queue, so the next chunk is fetched (and transformed)
+while the caller is still inserting the previous one. Memory stays bounded to
+roughly ``depth + 2`` items.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from typing import Iterable, Iterator, TypeVar
+
+logger = logging.getLogger("sql_to_staging.pipeline")
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+def prefetch(
+    iterable: Iterable[T], depth: int, *, name: str = "prefetch"
+) -> Iterator[T]:
+    """
+    Iterate `iterable` in a producer thread, buffering at most `depth` items.
+
+    - depth <= 0 disables the pipeline and iterates inline.
+    - Exceptions raised by the producer are re-raised in the consumer.
+    - Closing the returned generator (or an exception in the consumer) stops the
+      producer and closes `iterable` from the producer thread, so resources
+      such as a streaming source connection are released by their owner thread.
+
+    Use with contextlib.closing() to guarantee prompt shutdown on errors.
+    """
+    if depth <= 0:
+        yield from iterable
+        return
+
+    buf: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buf.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in iterable:
+                if not _put(item):
+                    break
+        except BaseException as e:  # propagate to consumer
+            _put(_Failure(e))
+        finally:
+            close = getattr(iterable, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    logger.debug("Closing prefetch source failed: %s", e)
+            _put(_DONE)
+
+    producer = threading.Thread(target=_produce, name=name, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buf.get()
+            if item is _DONE:
+                break
+            if isinstance(item, _Failure):
+                raise item.exc
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+__all__ = ["prefetch"]
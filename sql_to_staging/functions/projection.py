@@ -0,0 +1,160 @@
+"""Per-table column projection and source filters (SRC_COLUMNS_<table>, SRC_WHERE_<table>).
+
+Instead of `SELECT *`, a table can be extracted with only the configured
+columns and a WHERE predicate that is pushed down to the source query. The
+projected table replaces the reflected one, so the destination DDL only has
+the selected columns as well.
+
+Columns the extraction itself depends on are always kept: the primary key
+(keyset pagination, partitioning, merges) and any configured keyset,
+partition, watermark or merge key column.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Mapping
+
+import pyarrow as pa
+from sqlalchemy import Column, MetaData, Table, and_, text
+from sqlalchemy.sql.elements import ColumnElement
+
+logger = logging.getLogger("sql_to_staging.projection")
+
+# Per-table options naming columns that must survive a projection
+_KEY_OPTIONS = ("keyset_column", "partition_column", "watermark_column", "merge_key")
+
+
+def table_columns(
+    table_options: Mapping[str, Mapping[str, str]] | None, table: str
+) -> list[str] | None:
+    """Configured column list of a table, or None for all columns."""
+    raw = (table_options or {}).get(table, {}).get("columns")
+    if not raw:
+        return None
+    columns = [c.strip() for c in raw.split(",") if c.strip()]
+    return columns or None
+
+
+def table_where(
+    table_options: Mapping[str, Mapping[str, str]] | None, table: str
+) -> str | None:
+    """Configured source filter (SQL predicate in the source dialect) of a table."""
+    raw = (table_options or {}).get(table, {}).get("where")
+    return raw.strip() if raw and raw.strip() else None
+
+
+def _required_columns(options: Mapping[str, str]) -> list[str]:
+    names: list[str] = []
+    for key in _KEY_OPTIONS:
+        for name in (options.get(key) or "").split(","):
+            if name.strip() and name.strip().lower() != "auto":
+                names.append(name.strip())
+    return names
+
+
+def project_table(
+    table: Table,
+    table_options: Mapping[str, Mapping[str, str]] | None,
+    table_name: str,
+) -> Table:
+    """
+    Copy of the reflected table with only the configured columns (in source
+    order), or the table itself without a column list. Raises ValueError for
+    configured columns that do not exist.
+    """
+    wanted = table_columns(table_options, table_name)
+    if wanted is None:
+        return table
+
+    by_name = {c.name.lower(): c for c in table.columns}
+    missing = [c for c in wanted if c.lower() not in by_name]
+    if missing:
+        raise ValueError(
+            f"SRC_COLUMNS_{table_name}: column(s) {missing} not found in table "
+            f"{table.name!r}"
+        )
+    keep = {c.lower() for c in wanted}
+    required = [c.name.lower() for c in table.primary_key.columns]
+    required += [
+        n.lower()
+        for n in _required_columns((table_options or {}).get(table_name, {}))
+        if n.lower() in by_name
+    ]
+    added = [n for n in dict.fromkeys(required) if n not in keep]
+    if added:
+        logger.info(
+            "   (%s: key column(s) %s added to SRC_COLUMNS)",
+            table_name,
+            [by_name[n].name for n in added],
+        )
+    keep.update(added)
+
+    columns = [
+        Column(c.name, c.type, nullable=c.nullable, primary_key=c.primary_key)
+        for c in table.columns
+        if c.name.lower() in keep
+    ]
+    logger.info(
+        "   (%s: extracting %d of %d columns)",
+        table_name,
+        len(columns),
+        len(table.columns),
+    )
+    return Table(table.name, MetaData(), *columns, schema=table.schema)
+
+
+def combine_where(*predicates: ColumnElement | str | None) -> ColumnElement | None:
+    """AND the given predicates (SQL strings become text clauses); None if empty."""
+    clauses = [
+        text(f"({p})") if isinstance(p, str) else p
+        for p in predicates
+        if p is not None and not (isinstance(p, str) and not p.strip())
+    ]
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else and_(*clauses)
+
+
+def combine_where_sql(*predicates: str | None) -> str | None:
+    """AND literal SQL predicates for ConnectorX queries; None if empty."""
+    parts = [f"({p})" for p in predicates if p and p.strip()]
+    return " AND ".join(parts) if parts else None
+
+
+def connectorx_columns(
+    table_options: Mapping[str, Mapping[str, str]] | None, table: str
+) -> list[str] | None:
+    """
+    Configured columns plus configured key columns for ConnectorX queries (the
+    primary key cannot be reflected there), or None for all columns.
+    """
+    wanted = table_columns(table_options, table)
+    if wanted is None:
+        return None
+    seen = {c.lower() for c in wanted}
+    for name in _required_columns((table_options or {}).get(table, {})):
+        if name.lower() not in seen:
+            seen.add(name.lower())
+            wanted.append(name)
+    return wanted
+
+
+def drop_arrow_column(batch: pa.RecordBatch, name: str) -> pa.RecordBatch:
+    """
+    Batch without column `name` (matched case-insensitively), e.g. a partition
+    column that was only selected to split a ConnectorX query.
+    """
+    keep = [i for i, n in enumerate(batch.schema.names) if n.lower() != name.lower()]
+    return batch.select(keep)
+
+
+__all__ = [
+    "combine_where",
+    "combine_where_sql",
+    "connectorx_columns",
+    "drop_arrow_column",
+    "project_table",
+    "table_columns",
+    "table_where",
+]
@@ -0,0 +1,147 @@
+"""Row counts for progress logging and table scheduling.
+
+By default the row count of a source table is an estimate read from the
+catalog statistics, which costs a single metadata lookup instead of a full
+`SELECT COUNT(*)`:
+
+- Oracle: ALL_TABLES.NUM_ROWS (as of the last DBMS_STATS run)
+- PostgreSQL: pg_class.reltuples (as of the last VACUUM/ANALYZE)
+- SQL Server: sys.dm_db_partition_stats (heap or clustered index rows)
+- MySQL/MariaDB: information_schema.TABLES.TABLE_ROWS (approximate for InnoDB)
+
+Dialects without such statistics (e.g. SQLite) or tables that were never
+analyzed have no estimate. An exact COUNT(*) is only used when asked for
+(EXACT_ROW_COUNT). Works with a SQLAlchemy Engine or a ConnectorX URI.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import connectorx as cx
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from utils.database.dialects import dialect_of, sql_literal
+from utils.database.identifiers import quote_fqn
+
+logger = logging.getLogger("sql_to_staging.row_estimates")
+
+
+def estimate_query(dialect: str, schema: str | None, table: str) -> str | None:
+    """SQL returning the catalog row estimate of [schema.]table, or None if unsupported."""
+    if dialect == "oracle":
+        owner = f"UPPER({sql_literal(schema)})" if schema else "USER"
+        return (
+            "SELECT NUM_ROWS FROM ALL_TABLES "
+            f"WHERE OWNER = {owner} "
+            f"AND TABLE_NAME IN ({sql_literal(table)}, UPPER({sql_literal(table)}))"
+        )
+    if dialect == "postgresql":
+        nsp = sql_literal(schema) if schema else "current_schema()"
+        # reltuples is -1 for tables that were never vacuumed/analyzed
+        return (
+            "SELECT CASE WHEN c.reltuples < 0 THEN NULL "
+            "ELSE CAST(c.reltuples AS BIGINT) END "
+            "FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+            f"WHERE n.nspname = {nsp} AND c.relname = {sql_literal(table)}"
+        )
+    if dialect == "mssql":
+        qualified = quote_fqn("mssql", [schema, table] if schema else [table])
+        return (
+            "SELECT SUM(p.row_count) FROM sys.dm_db_partition_stats p "
+            f"WHERE p.object_id = OBJECT_ID({sql_literal(qualified)}) "
+            "AND p.index_id IN (0, 1)"
+        )
+    if dialect in ("mysql", "mariadb"):
+        db = sql_literal(schema) if schema else "DATABASE()"
+        return (
+            "SELECT TABLE_ROWS FROM information_schema.TABLES "
+            f"WHERE TABLE_SCHEMA = {db} AND TABLE_NAME = {sql_literal(table)}"
+        )
+    return None
+
+
+def _scalar(source: Engine | str, sql: str):
+    if isinstance(source, Engine):
+        with source.connect() as conn:
+            return conn.execute(text(sql)).scalar()
+    result = cx.read_sql(source, sql, return_type="arrow")
+    if result.num_rows == 0:
+        return None
+    return result.column(0)[0].as_py()
+
+
+def estimate_rows(source: Engine | str, schema: str | None, table: str) -> int | None:
+    """Catalog-statistics row estimate, or None when no estimate is available."""
+    sql = estimate_query(dialect_of(source), schema, table)
+    if sql is None:
+        return None
+    try:
+        value = _scalar(source, sql)
+    except Exception as e:
+        logger.warning("Failed to read row estimate for %s: %s", table, e)
+        return None
+    return int(value) if value is not None else None
+
+
+def exact_rows(source: Engine | str, schema: str | None, table: str) -> int | None:
+    """Exact COUNT(*) of the table, or None when it fails."""
+    dialect = dialect_of(source)
+    parts = [schema, table] if schema else [table]
+    try:
+        qname = quote_fqn(source if isinstance(source, Engine) else dialect, parts)
+    except Exception:
+        qname = ".".join(parts)
+    try:
+        value = _scalar(source, f"SELECT COUNT(*) FROM {qname}")
+    except Exception as e:
+        logger.warning("Failed to COUNT(*) for %s: %s", qname, e)
+        return None
+    return int(value) if value is not None else None
+
+
+def source_row_count(
+    source: Engine | str, schema: str | None, table: str, *, exact: bool = False
+) -> int | None:
+    """Exact COUNT(*) when exact is set, else the catalog estimate."""
+    if exact:
+        return exact_rows(source, schema, table)
+    return estimate_rows(source, schema, table)
+
+
+def report_row_count(count: int | None, *, exact: bool, source: Engine | str) -> None:
+    """Log a source row count the way all transfer paths report it."""
+    if count is not None:
+        if exact:
+            logger.info("   (source rows: %s)", f"{count:,}")
+        else:
+            logger.info("   (source rows: ~%s, catalog estimate)", f"{count:,}")
+    elif not exact:
+        logger.info(
+            "   (no row estimate in the %s catalog statistics; "
+            "set EXACT_ROW_COUNT=True for a COUNT(*))",
+            dialect_of(source),
+        )
+
+
+def format_progress(done: int, expected: int | None, elapsed: float) -> str:
+    """', x% of ~N, ETA Ns' suffix for progress logs ('' without an expectation)."""
+    if not expected or expected <= 0:
+        return ""
+    # Estimates can be off; never report 100% or a negative ETA while running
+    pct = min(99.9, 100.0 * done / expected)
+    if done <= 0 or done >= expected or elapsed <= 0:
+        return f", {pct:.1f}% of ~{expected:,}"
+    eta = elapsed * (expected - done) / done
+    return f", {pct:.1f}% of ~{expected:,}, ETA {eta:.0f}s"
+
+
+__all__ = [
+    "estimate_query",
+    "estimate_rows",
+    "exact_rows",
+    "format_progress",
+    "report_row_count",
+    "source_row_count",
+]
@@ -0,0 +1,236 @@
+"""Persistent source-schema cache (SCHEMA_CACHE / `--refresh-schema-cache`).
+
+Reflecting a source table (`Table(..., autoload_with=engine)`) runs several
+data dictionary queries per table, which is slow on large Oracle catalogs.
+The cache keeps the reflected tables in a local file, keyed by the source URL
+(without password), schema and table name. Each entry is stored together with
+a cheap catalog fingerprint that changes whenever the table definition does:
+
+- Oracle: ALL_OBJECTS.LAST_DDL_TIME
+- PostgreSQL: xmin of the pg_class row and of its pg_attribute rows
+- SQL Server: sys.objects.modify_date
+- MySQL/MariaDB: a digest of information_schema.COLUMNS
+- SQLite: the CREATE statement in sqlite_master
+
+A cached table is only reused while its fingerprint matches; dialects without
+a fingerprint are always reflected. With refresh=True every table is reflected
+again (once per run) and its cache entry is replaced.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+from typing import Any
+
+from sqlalchemy import MetaData, Table, text
+from sqlalchemy.engine import Engine
+
+from utils.database.dialects import sql_literal
+from utils.database.identifiers import quote_fqn, quote_ident
+
+logger = logging.getLogger("sql_to_staging.schema_cache")
+
+# Bumped when the cached representation changes; older files are ignored
+_FORMAT_VERSION = 1
+
+
+def fingerprint_query(dialect: str, schema: str | None, table: str) -> str | None:
+    """SQL returning a value that changes with the table's DDL, or None if unsupported."""
+    if dialect == "oracle":
+        owner = f"UPPER({sql_literal(schema)})" if schema else "USER"
+        return (
+            "SELECT TO_CHAR(MAX(LAST_DDL_TIME), 'YYYYMMDDHH24MISS') FROM ALL_OBJECTS "
+            f"WHERE OWNER = {owner} "
+            f"AND OBJECT_NAME IN ({sql_literal(table)}, UPPER({sql_literal(table)})) "
+            "AND OBJECT_TYPE IN ('TABLE', 'VIEW')"
+        )
+    if dialect == "postgresql":
+        nsp = sql_literal(schema) if schema else "current_schema()"
+        # Column changes rewrite pg_attribute rows; ALTER TABLE the pg_class row
+        return (
+            "SELECT c.xmin::text || ':' || (SELECT string_agg(a.xmin::text, ',' "
+            "ORDER BY a.attnum) FROM pg_attribute a WHERE a.attrelid = c.oid) "
+            "FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+            f"WHERE n.nspname = {nsp} AND c.relname = {sql_literal(table)}"
+        )
+    if dialect == "mssql":
+        qualified = quote_fqn("mssql", [schema, table] if schema else [table])
+        return (
+            "SELECT CONVERT(varchar(30), modify_date, 126) FROM sys.objects "
+            f"WHERE object_id = OBJECT_ID({sql_literal(qualified)})"
+        )
+    if dialect in ("mysql", "mariadb"):
+        db = sql_literal(schema) if schema else "DATABASE()"
+        return (
+            "SELECT MD5(GROUP_CONCAT(CONCAT_WS('|', COLUMN_NAME, COLUMN_TYPE, "
+            "IS_NULLABLE, COLUMN_KEY, IFNULL(COLUMN_DEFAULT, '')) "
+            "ORDER BY ORDINAL_POSITION SEPARATOR ';')) FROM information_schema.COLUMNS "
+            f"WHERE TABLE_SCHEMA = {db} AND TABLE_NAME = {sql_literal(table)}"
+        )
+    if dialect == "sqlite":
+        master = (
+            f"{quote_ident('sqlite', schema)}.sqlite_master"
+            if schema
+            else "sqlite_master"
+        )
+        return (
+            f"SELECT sql FROM {master} "
+            f"WHERE type IN ('table', 'view') AND name = {sql_literal(table)}"
+        )
+    return None
+
+
+def catalog_fingerprint(engine: Engine, schema: str | None, table: str) -> str | None:
+    """Current catalog fingerprint of [schema.]table, or None when unavailable."""
+    sql = fingerprint_query(engine.dialect.name.lower(), schema, table)
+    if sql is None:
+        return None
+    try:
+        with engine.connect() as conn:
+            value = conn.execute(text(sql)).scalar()
+    except Exception as e:
+        logger.warning("Failed to read catalog fingerprint for %s: %s", table, e)
+        return None
+    if value is None:
+        return None
+    return hashlib.sha256(str(value).encode("utf-8")).hexdigest()
+
+
+def _source_key(engine: Engine, schema: str | None, table: str) -> str:
+    url = engine.url.render_as_string(hide_password=True)
+    return f"{url}|{schema or ''}|{table}"
+
+
+class SchemaCache:
+    """
+    Thread-safe cache of reflected source tables, persisted to a pickle file.
+
+    `table()` is a drop-in replacement for `Table(name, metadata, schema=...,
+    autoload_with=engine)`. Entries are written back atomically (temp file +
+    rename) after every reflection, so parallel tables share one file.
+    """
+
+    def __init__(self, path: str, *, refresh: bool = False):
+        self.path = path
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, Any]] = self._load()
+        # Keys reflected by this process; with refresh only these are reused
+        self._fresh: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self.path, "rb") as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning("Ignoring unreadable schema cache %s: %s", self.path, e)
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _FORMAT_VERSION:
+            logger.info("Ignoring schema cache %s of another version", self.path)
+            return {}
+        return data.get("tables", {})
+
+    def _save(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump({"version": _FORMAT_VERSION, "tables": self._entries}, f)
+        os.replace(tmp, self.path)
+
+    def table(
+        self,
+        engine: Engine,
+        name: str,
+        *,
+        schema: str | None = None,
+        metadata: MetaData | None = None,
+    ) -> Table:
+        """The reflected table, from the cache while its fingerprint matches."""
+        metadata = metadata if metadata is not None else MetaData()
+        key = _source_key(engine, schema, name)
+        fingerprint = catalog_fingerprint(engine, schema, name)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if self.refresh and key not in self._fresh:
+                entry = None
+        if (
+            fingerprint is not None
+            and entry is not None
+            and entry.get("fingerprint") == fingerprint
+        ):
+            try:
+                cached = pickle.loads(entry["table"])
+                table = cached.to_metadata(metadata)
+                with self._lock:
+                    self.hits += 1
+                logger.debug("Schema cache hit for %s", key)
+                return table
+            except Exception as e:
+                logger.warning("Discarding cached schema of %s: %s", name, e)
+
+        table = Table(name, metadata, schema=schema, autoload_with=engine)
+        with self._lock:
+            self.misses += 1
+        if fingerprint is None:
+            return table
+        try:
+            # Pickle a copy on its own MetaData so no other tables are included
+            payload = pickle.dumps(table.to_metadata(MetaData()))
+        except Exception as e:
+            logger.warning("Could not cache schema of %s: %s", name, e)
+            return table
+        with self._lock:
+            self._entries[key] = {"fingerprint": fingerprint, "table": payload}
+            self._fresh.add(key)
+            try:
+                self._save()
+            except OSError as e:
+                logger.warning("Failed to write schema cache %s: %s", self.path, e)
+        return table
+
+    def log_summary(self) -> None:
+        if self.hits or self.misses:
+            logger.info(
+                "Schema cache: %d table(s) reused, %d reflected (%s)",
+                self.hits,
+                self.misses,
+                self.path,
+            )
+
+
+def reflect_table(
+    engine: Engine,
+    name: str,
+    *,
+    schema: str | None = None,
+    metadata: MetaData | None = None,
+    cache: SchemaCache | None = None,
+) -> Table:
+    """Reflect a source table, through the schema cache when one is given."""
+    if cache is not None:
+        return cache.table(engine, name, schema=schema, metadata=metadata)
+    return Table(
+        name,
+        metadata if metadata is not None else MetaData(),
+        schema=schema,
+        autoload_with=engine,
+    )
+
+
+__all__ = [
+    "SchemaCache",
+    "catalog_fingerprint",
+    "fingerprint_query",
+    "reflect_table",
+]
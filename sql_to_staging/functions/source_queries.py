@@ -0,0 +1,166 @@
+"""Custom source queries as extraction units (SRC_QUERY_<table>).
+
+Heavy joins or aggregations are often far cheaper on the source server than
+after copying the raw tables. A table listed in SRC_TABLES with a
+SRC_QUERY_<table> option is not read from the source table of that name:
+the staging table `<table>` is filled with the result of the configured
+SELECT (or view) instead.
+
+No table is reflected for a query. On the SQLAlchemy path the destination
+columns are typed from the result cursor description (the PEP 249 type
+objects of the driver plus precision, scale and size), falling back to the
+Python type of the first non-null value in the first chunk; the dump paths
+let polars/ConnectorX type the result as usual.
+
+The query is wrapped as a subquery (`SELECT ... FROM (<query>) q`) when a
+ROW_LIMIT, SRC_COLUMNS_<table> or SRC_WHERE_<table> applies, so it must not
+end with ORDER BY on SQL Server. Keyset pagination, SQLAlchemy partitioning,
+watermarks and catalog row estimates do not apply to query tables.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import decimal
+import logging
+from typing import Any, Mapping, Sequence
+
+from sqlalchemy import Column, MetaData, Table
+from sqlalchemy import types as satypes
+
+from sql_to_staging.functions.connectorx_sql import connectorx_select
+
+logger = logging.getLogger("sql_to_staging.source_queries")
+
+# Longest string column created with a length; longer or unknown sizes are Text
+_MAX_STRING_LENGTH = 4000
+
+
+def table_query(
+    table_options: Mapping[str, Mapping[str, str]] | None, table: str
+) -> str | None:
+    """Configured source query of a table (trailing semicolons removed), or None."""
+    raw = (table_options or {}).get(table, {}).get("query")
+    if not raw or not raw.strip():
+        return None
+    return raw.strip().rstrip(";").strip() or None
+
+
+def source_query_sql(
+    scheme: str,
+    query: str,
+    row_limit: int | None,
+    where: str | None = None,
+    columns: Sequence[str] | None = None,
+) -> str:
+    """
+    SQL for a custom source query (SRC_QUERY_<table>): the query itself, or
+    wrapped as a subquery when a row limit, filter or column list applies.
+    """
+    if not (row_limit and row_limit > 0) and not where and not columns:
+        return query
+    return connectorx_select(scheme, f"({query}) q", row_limit, where, columns)
+
+
+def _is_type(dbapi: Any, name: str, type_code: Any) -> bool:
+    type_object = getattr(dbapi, name, None)
+    if type_object is None:
+        return False
+    try:
+        return bool(type_code == type_object)
+    except Exception:
+        return False
+
+
+def _value_type(value: Any) -> satypes.TypeEngine:
+    # bool before int: bool is a subclass of int
+    if isinstance(value, bool):
+        return satypes.Boolean()
+    if isinstance(value, int):
+        return satypes.BigInteger()
+    if isinstance(value, float):
+        return satypes.Float()
+    if isinstance(value, decimal.Decimal):
+        return satypes.Numeric()
+    if isinstance(value, dt.datetime):
+        return satypes.DateTime()
+    if isinstance(value, dt.date):
+        return satypes.Date()
+    if isinstance(value, dt.time):
+        return satypes.Time()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return satypes.LargeBinary()
+    # Strings, unknown objects and all-null columns
+    return satypes.Text()
+
+
+def description_type(
+    entry: Sequence[Any], dbapi: Any, sample: Any = None
+) -> satypes.TypeEngine:
+    """
+    SQLAlchemy type for one cursor.description entry (name, type_code,
+    display_size, internal_size, precision, scale, null_ok), using the
+    driver's PEP 249 type objects where available and the sample value
+    otherwise.
+    """
+    padded = list(entry) + [None] * (7 - len(entry))
+    _, type_code, display_size, internal_size, precision, scale, _ = padded[:7]
+
+    if type_code is not None and dbapi is not None:
+        if _is_type(dbapi, "NUMBER", type_code):
+            if isinstance(sample, float):
+                return satypes.Float()
+            # Oracle reports NUMBER without precision as (0, -127)
+            if precision and scale is not None and 0 <= scale <= precision:
+                return satypes.Numeric(precision=precision, scale=scale)
+            if isinstance(sample, (bool, int, decimal.Decimal)):
+                return _value_type(sample)
+            return satypes.Numeric()
+        if _is_type(dbapi, "STRING", type_code):
+            size = internal_size or display_size
+            if isinstance(size, int) and 0 < size <= _MAX_STRING_LENGTH:
+                return satypes.String(length=size)
+            return satypes.Text()
+        if _is_type(dbapi, "DATETIME", type_code):
+            if isinstance(sample, dt.date) and not isinstance(sample, dt.datetime):
+                return satypes.Date()
+            return satypes.DateTime()
+        if _is_type(dbapi, "BINARY", type_code):
+            return satypes.LargeBinary()
+    return _value_type(sample)
+
+
+def query_table(
+    name: str,
+    description: Sequence[Sequence[Any]],
+    dbapi: Any,
+    sample_rows: Sequence[Mapping[str, Any]] = (),
+) -> Table:
+    """
+    Table (on its own MetaData) describing the result of a source query, for
+    building the destination table with the same rules as reflected tables.
+    """
+    columns: list[Column] = []
+    for entry in description:
+        column_name = entry[0]
+        sample = next(
+            (
+                row[column_name]
+                for row in sample_rows
+                if row.get(column_name) is not None
+            ),
+            None,
+        )
+        null_ok = entry[6] if len(entry) > 6 else None
+        columns.append(
+            Column(
+                column_name,
+                description_type(entry, dbapi, sample),
+                nullable=null_ok is not False,
+            )
+        )
+    logger.info("   (%s: %d column(s) typed from the query result)", name, len(columns))
+    return Table(name, MetaData(), *columns)
+
+
+__all__ = ["description_type", "query_table", "source_query_sql", "table_query"]
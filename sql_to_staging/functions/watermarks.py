@@ -0,0 +1,362 @@
+"""Watermark-based incremental extraction.
+
+For tables with a configured watermark column (e.g. a mutation timestamp or
+an increasing id), only rows above the high-water mark of the previous run
+are read, up to MAX(column) at the start of this run. The high-water mark is
+kept in a small state table in the destination schema and only advanced
+after the table was loaded. The delta is appended or merged (WRITE_MODE
+append/merge); the first run, a changed watermark column or a due periodic
+full refresh reloads the whole table instead.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Mapping, Sequence
+
+import connectorx as cx
+from sqlalchemy import (
+    Column,
+    DateTime,
+    MetaData,
+    String,
+    Table,
+    Text,
+    and_,
+    false,
+    func,
+    or_,
+    select,
+)
+from sqlalchemy import column as sa_column
+from sqlalchemy import types as satypes
+from sqlalchemy.dialects import registry
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import ColumnElement
+
+from sql_to_staging.functions.checkpoints import (
+    CheckpointStore,
+    decode_key,
+    encode_key,
+)
+from sql_to_staging.functions.connectorx_sql import connectorx_target
+from sql_to_staging.functions.schema_cache import SchemaCache, reflect_table
+from utils.database.dialects import (
+    SCHEME_DIALECTS,
+    connectorx_scheme,
+    scheme_dialect,
+)
+from utils.database.identifiers import quote_ident
+
+logger = logging.getLogger("sql_to_staging.watermarks")
+
+# Name of the state table in the destination schema
+STATE_TABLE = "sql_to_staging_watermarks"
+
+
+@dataclass
+class IncrementalPlan:
+    """
+    What to read for one watermark table in this run.
+
+    write_mode is "replace" for a full (re)load, otherwise the delta's write
+    mode ("append" or "merge"). lower is the previous high-water mark (None on
+    a full load) and upper the MAX(column) the new high-water mark becomes.
+    """
+
+    table: str
+    column: str
+    write_mode: str
+    lower: Any = None
+    upper: Any = None
+    merge_keys: list[str] = field(default_factory=list)
+
+    @property
+    def is_full(self) -> bool:
+        return self.write_mode == "replace"
+
+    def predicate(self, col: ColumnElement) -> ColumnElement[bool] | None:
+        """WHERE clause bounding the rows of this run on col."""
+        conds: list[ColumnElement[bool]] = []
+        if self.is_full:
+            # Rows above the new mark are left for the next delta; rows without
+            # a watermark value are only loaded by full refreshes
+            if self.upper is not None:
+                conds.append(or_(col <= self.upper, col.is_(None)))
+        else:
+            if self.lower is not None:
+                # Merge is idempotent, so rows at the old mark are read again
+                # in case more arrived with the same value
+                conds.append(
+                    col >= self.lower
+                    if self.write_mode == "merge"
+                    else col > self.lower
+                )
+            # Without an upper bound the source has no watermark values at all
+            conds.append(col <= self.upper if self.upper is not None else false())
+        return and_(*conds) if conds else None
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["lower"] = encode_key(self.lower)
+        data["upper"] = encode_key(self.upper)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "IncrementalPlan":
+        values = dict(data)
+        values["lower"] = decode_key(values.get("lower"))
+        values["upper"] = decode_key(values.get("upper"))
+        return cls(**values)
+
+
+@dataclass
+class WatermarkState:
+    column: str
+    value: Any
+    last_full_refresh: datetime | None
+
+
+def resolve_column(table: Table, name: str) -> str:
+    """Find a column of table by name (case-insensitive)."""
+    wanted = name.strip().lower()
+    for col in table.columns:
+        if col.name.lower() == wanted:
+            return col.name
+    raise ValueError(f"Watermark column {name!r} not found in table {table.name!r}")
+
+
+def effective_write_mode(
+    plans: Mapping[str, IncrementalPlan] | None, table: str, write_mode: str
+) -> str:
+    """Per-table write mode: the plan's, or a full reload for merge without a watermark."""
+    plan = (plans or {}).get(table)
+    if plan is not None:
+        return plan.write_mode
+    return "replace" if write_mode == "merge" else write_mode
+
+
+def _literal_type(value: Any) -> satypes.TypeEngine:
+    if isinstance(value, datetime):
+        return satypes.DateTime()
+    if isinstance(value, date):
+        return satypes.Date()
+    if isinstance(value, bool):
+        return satypes.Boolean()
+    if isinstance(value, int):
+        return satypes.BigInteger()
+    if isinstance(value, (float, Decimal)):
+        return satypes.Numeric()
+    return satypes.String()
+
+
+def literal_where(plan: IncrementalPlan, scheme: str) -> str | None:
+    """Render the plan's WHERE clause with literal bounds for a ConnectorX query."""
+    sample = plan.upper if plan.upper is not None else plan.lower
+    col = sa_column(plan.column, _literal_type(sample))
+    pred = plan.predicate(col)
+    if pred is None:
+        return None
+    dialect = registry.load(SCHEME_DIALECTS.get(scheme, "postgresql"))()
+    return str(pred.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+
+class WatermarkStore:
+    """High-water marks per table in a small state table in the destination."""
+
+    def __init__(
+        self, engine: Engine, schema: str | None = None, table_name: str = STATE_TABLE
+    ):
+        self.engine = engine
+        self.table = Table(
+            table_name,
+            MetaData(),
+            Column("table_name", String(255), primary_key=True),
+            Column("watermark_column", String(255)),
+            Column("watermark_value", Text),
+            Column("last_full_refresh", DateTime),
+            Column("updated_at", DateTime),
+            schema=schema,
+        )
+
+    def ensure(self) -> None:
+        with self.engine.begin() as conn:
+            self.table.create(bind=conn, checkfirst=True)
+
+    def get(self, table: str) -> WatermarkState | None:
+        t = self.table
+        with self.engine.connect() as conn:
+            row = conn.execute(select(t).where(t.c.table_name == table)).first()
+        if row is None:
+            return None
+        raw = row.watermark_value
+        return WatermarkState(
+            column=row.watermark_column,
+            value=decode_key(json.loads(raw)) if raw is not None else None,
+            last_full_refresh=row.last_full_refresh,
+        )
+
+    def save(self, plan: IncrementalPlan) -> None:
+        """Advance the table's high-water mark after a successful load."""
+        previous = self.get(plan.table)
+        value = plan.upper
+        if value is None and previous is not None and not plan.is_full:
+            # Nothing new in the source; keep the previous mark
+            value = previous.value
+        now = datetime.now()
+        last_full = now if plan.is_full else (previous and previous.last_full_refresh)
+        t = self.table
+        with self.engine.begin() as conn:
+            conn.execute(t.delete().where(t.c.table_name == plan.table))
+            conn.execute(
+                t.insert().values(
+                    table_name=plan.table,
+                    watermark_column=plan.column,
+                    watermark_value=(
+                        json.dumps(encode_key(value)) if value is not None else None
+                    ),
+                    last_full_refresh=last_full,
+                    updated_at=now,
+                )
+            )
+        logger.info(
+            "High-water mark of %s set to %s=%r", plan.table, plan.column, value
+        )
+
+
+def _full_refresh_reason(
+    state: WatermarkState | None, column: str, refresh_days: int, now: datetime
+) -> str | None:
+    if state is None or state.value is None:
+        return "no previous high-water mark"
+    if state.column.lower() != column.lower():
+        return f"watermark column changed from {state.column}"
+    if refresh_days > 0 and (
+        state.last_full_refresh is None
+        or now - state.last_full_refresh >= timedelta(days=refresh_days)
+    ):
+        return f"periodic full refresh ({refresh_days} day(s))"
+    return None
+
+
+def plan_incremental(
+    source: Engine | str,
+    tables: Sequence[str],
+    store: WatermarkStore,
+    *,
+    source_schema: str | None = None,
+    table_options: Mapping[str, Mapping[str, str]] | None = None,
+    write_mode: str = "append",
+    full_refresh_days: int = 0,
+    checkpoints: CheckpointStore | None = None,
+    schema_cache: SchemaCache | None = None,
+) -> dict[str, IncrementalPlan]:
+    """
+    Plan the incremental load of every table with a "watermark_column" option.
+
+    Only applies with write_mode append or merge; returns {} otherwise. The
+    source is a SQLAlchemy Engine or a ConnectorX URI (merge keys must then be
+    configured as "merge_key", as the primary key cannot be reflected). When a
+    resumed checkpoint holds the plans of the failed run they are reused, so
+    reused extracts and the stored high-water mark stay consistent.
+    """
+    configured = {
+        t: (table_options or {}).get(t, {})
+        for t in tables
+        if (table_options or {}).get(t, {}).get("watermark_column")
+    }
+    for table in [t for t, opts in configured.items() if opts.get("query")]:
+        logger.info(
+            "SRC_WATERMARK_COLUMN_%s ignored; %s is a custom source query",
+            table,
+            table,
+        )
+        del configured[table]
+    if not configured:
+        return {}
+    if write_mode not in {"append", "merge"}:
+        logger.info(
+            "Watermark columns ignored with WRITE_MODE=%s; loading full tables",
+            write_mode,
+        )
+        return {}
+
+    saved = (checkpoints.get_meta("incremental") if checkpoints else None) or {}
+    if saved:
+        logger.info("Reusing incremental plans of the resumed run")
+
+    store.ensure()
+    now = datetime.now()
+    plans: dict[str, IncrementalPlan] = {}
+    for table, opts in configured.items():
+        if table in saved:
+            plans[table] = IncrementalPlan.from_dict(saved[table])
+            continue
+
+        column = opts["watermark_column"].strip()
+        keys = [k.strip() for k in opts.get("merge_key", "").split(",") if k.strip()]
+        if isinstance(source, Engine):
+            src_table = reflect_table(
+                source, table, schema=source_schema, cache=schema_cache
+            )
+            column = resolve_column(src_table, column)
+            if not keys:
+                keys = [c.name for c in src_table.primary_key.columns]
+            with source.connect() as conn:
+                upper = conn.execute(select(func.max(src_table.c[column]))).scalar()
+        else:
+            scheme = connectorx_scheme(source)
+            target = connectorx_target(scheme, source_schema, table)
+            quoted = quote_ident(scheme_dialect(scheme), column)
+            result = cx.read_sql(
+                source, f"SELECT MAX({quoted}) FROM {target}", return_type="arrow"
+            )
+            upper = result.column(0)[0].as_py()
+
+        if write_mode == "merge" and not keys:
+            raise ValueError(
+                f"WRITE_MODE=merge needs a key for table {table!r}: configure "
+                f"SRC_MERGE_KEY_{table} or give the source table a primary key"
+            )
+
+        state = store.get(table)
+        refresh_days = int(opts.get("full_refresh_days") or full_refresh_days or 0)
+        reason = _full_refresh_reason(state, column, refresh_days, now)
+        plan = IncrementalPlan(
+            table=table,
+            column=column,
+            write_mode="replace" if reason else write_mode,
+            lower=None if reason or state is None else state.value,
+            upper=upper,
+            merge_keys=[k.lower() for k in keys],
+        )
+        if reason:
+            logger.info("Incremental %s: full load (%s)", table, reason)
+        else:
+            logger.info(
+                "Incremental %s: %s delta on %s from %r up to %r",
+                table,
+                write_mode,
+                column,
+                plan.lower,
+                plan.upper,
+            )
+        plans[table] = plan
+
+    if checkpoints is not None:
+        checkpoints.set_meta("incremental", {t: p.to_dict() for t, p in plans.items()})
+    return plans
+
+
+__all__ = [
+    "IncrementalPlan",
+    "WatermarkStore",
+    "effective_write_mode",
+    "literal_where",
+    "plan_incremental",
+    "resolve_column",
+]
@@ -1,14 +1,73 @@
 import logging
-from typing import cast
+import os
+from contextlib import nullcontext
+from typing import Any, cast
 
 from dotenv import load_dotenv
 
 from utils.config.cli_ini_config import load_single_ini_config
 from utils.config.get_config_value import get_config_value
 from utils.config.env_loader import find_dotenv_path
+from sql_to_staging.functions.change_detection import (
+    ChangeDetection,
+    FingerprintStore,
+    detect_changes,
+)
+from sql_to_staging.functions.checkpoints import CheckpointStore
 from sql_to_staging.functions.engine_loaders import load_source_connection
+from sql_to_staging.functions.schema_cache import SchemaCache
+from sql_to_staging.functions.watermarks import (
+    WatermarkStore,
+    effective_write_mode,
+    plan_incremental,
+)
 from utils.database.destination_engine import load_destination_engine
+from utils.database.ensure_db import ensure_database_and_schema
+from utils.logging.metrics import TransferMetrics
 from utils.logging.setup_logging import setup_logging
+from utils.parquet.write_options import parquet_write_options_from_config
+
+
+# Optional per-table settings, configured as <PREFIX>_<table> in [settings]
+# (e.g. SRC_PARTITION_COLUMN_szukhis = id)
+_TABLE_OPTION_KEYS = {
+    "partition_column": "SRC_PARTITION_COLUMN",
+    "partitions": "SRC_PARTITIONS",
+    "keyset_column": "SRC_KEYSET_COLUMN",
+    "watermark_column": "SRC_WATERMARK_COLUMN",
+    "merge_key": "SRC_MERGE_KEY",
+    "full_refresh_days": "FULL_REFRESH_DAYS",
+    "columns": "SRC_COLUMNS",
+    "where": "SRC_WHERE",
+    "query": "SRC_QUERY",
+    "change_column": "SRC_CHANGE_COLUMN",
+}
+
+
+def _collect_table_options(cfg: Any, tables: list[str]) -> dict[str, dict[str, str]]:
+    per_table: dict[str, dict[str, str]] = {}
+    for table in tables:
+        opts: dict[str, str] = {}
+        for opt_name, prefix in _TABLE_OPTION_KEYS.items():
+            # Use silent_if_missing=True and print_value=False to avoid log spam
+            # for these optional per-table keys
+            value = cast(
+                str | None,
+                get_config_value(
+                    f"{prefix}_{table}",
+                    section="settings",
+                    cfg_parser=cfg,
+                    cast_type=str,
+                    allow_none_if_cast_fails=True,
+                    silent_if_missing=True,
+                    print_value=False,
+                ),
+            )
+            if value is not None and value.strip():
+                opts[opt_name] = value.strip()
+        if opts:
+            per_table[table] = opts
+    return per_table
 
 
 def main() -> None:
@@ -24,7 +83,16 @@ def main() -> None:
     # User can provide --config argument pointing to a single INI with sections
     #   [database-source], [database-destination], [settings], [logging]
     # INI takes priority over environment variables
-    args, cfg = load_single_ini_config(prog_desc="Run source to staging data migration")
+    args, cfg = load_single_ini_config(
+        prog_desc="Run source to staging data migration",
+        flags=[
+            ("--resume", "Continue a failed run from its checkpoint file"),
+            (
+                "--refresh-schema-cache",
+                "Reflect all source tables again and replace their cached schema",
+            ),
+        ],
+    )
 
     # Configure logging (console + optional file via INI/env)
     setup_logging(app_name="sql_to_staging", cfg_parsers=[cfg])
@@ -42,7 +110,12 @@ def main() -> None:
     )
     transfer_mode = transfer_mode_raw.upper()
 
-    valid_modes = {"SQLALCHEMY_DIRECT", "CONNECTORX_DUMP", "SQLALCHEMY_DUMP"}
+    valid_modes = {
+        "SQLALCHEMY_DIRECT",
+        "ARROW_DIRECT",
+        "CONNECTORX_DUMP",
+        "SQLALCHEMY_DUMP",
+    }
     if transfer_mode not in valid_modes:
         raise ValueError(
             f"TRANSFER_MODE must be one of {sorted(valid_modes)}; got {transfer_mode!r}"
@@ -76,38 +149,290 @@ def main() -> None:
         allow_none_if_cast_fails=True,
     )
 
-    if transfer_mode == "SQLALCHEMY_DIRECT":
-        # Direct SQLAlchemy-to-SQLAlchemy chunked copy
-        from sql_to_staging.functions.direct_transfer import direct_transfer
+    # Optional intra-table parallelism: number of key ranges read concurrently
+    partitions = get_config_value(
+        "SRC_PARTITIONS",
+        section="settings",
+        cfg_parser=cfg,
+        default=1,
+        cast_type=int,
+    )
+    table_options = _collect_table_options(cfg, tables)
 
-        # Configure destination write mode (replace | truncate | append)
-        write_mode = cast(
-            str,
-            get_config_value(
-                "WRITE_MODE",
-                section="settings",
-                cfg_parser=cfg,
-                default="replace",
+    # Row counts come from catalog statistics; EXACT_ROW_COUNT opts in to COUNT(*)
+    exact_row_count = get_config_value(
+        "EXACT_ROW_COUNT",
+        section="settings",
+        cfg_parser=cfg,
+        default=False,
+        cast_type=bool,
+    )
+
+    # Optional memory budget: chunk sizes are adapted per table (0 = SRC_CHUNK_SIZE)
+    memory_budget_mb = get_config_value(
+        "MEMORY_BUDGET_MB",
+        section="settings",
+        cfg_parser=cfg,
+        default=0,
+        cast_type=int,
+    )
+
+    # Optional keyset pagination (WHERE key > :last ORDER BY key) for all tables
+    keyset = get_config_value(
+        "KEYSET_PAGINATION",
+        section="settings",
+        cfg_parser=cfg,
+        default=False,
+        cast_type=bool,
+    )
+
+    # Per-table progress of this run; --resume (or RESUME=True) continues it.
+    # Only kept for keyset pagination or a resumable run, so ordinary runs do
+    # not write a checkpoint file
+    resume = bool(getattr(args, "resume", False)) or get_config_value(
+        "RESUME",
+        section="settings",
+        cfg_parser=cfg,
+        default=False,
+        cast_type=bool,
+    )
+    checkpoints: CheckpointStore | None = None
+    if (
+        resume
+        or keyset
+        or any("keyset_column" in opts for opts in table_options.values())
+    ):
+        checkpoints = CheckpointStore.open(
+            cast(
+                str,
+                get_config_value(
+                    "CHECKPOINT_FILE",
+                    section="settings",
+                    cfg_parser=cfg,
+                    default="data/.ggmpilot_checkpoint.json",
+                ),
             ),
-        ).lower()
-        if write_mode not in {"replace", "truncate", "append"}:
-            raise ValueError(
-                "WRITE_MODE must be one of ['replace','truncate','append']; got "
-                f"{write_mode!r}"
+            scope=f"{transfer_mode}:{','.join(tables)}",
+            resume=resume,
+        )
+
+    # Optional persistent cache of reflected source tables (SQLAlchemy sources);
+    # entries are reused until the table's catalog fingerprint changes
+    schema_cache: SchemaCache | None = None
+    refresh_schema_cache = bool(getattr(args, "refresh_schema_cache", False))
+    if not isinstance(source_connection, str) and (
+        refresh_schema_cache
+        or get_config_value(
+            "SCHEMA_CACHE",
+            section="settings",
+            cfg_parser=cfg,
+            default=False,
+            cast_type=bool,
+        )
+    ):
+        schema_cache = SchemaCache(
+            cast(
+                str,
+                get_config_value(
+                    "SCHEMA_CACHE_FILE",
+                    section="settings",
+                    cfg_parser=cfg,
+                    default="data/.ggmpilot_schema_cache.pkl",
+                ),
+            ),
+            refresh=refresh_schema_cache,
+        )
+
+    # Native bulk load path (e.g. PostgreSQL COPY) when the destination supports it
+    bulk_load = get_config_value(
+        "BULK_LOAD",
+        section="settings",
+        cfg_parser=cfg,
+        default=True,
+        cast_type=bool,
+    )
+    # Staging tables without WAL/redo: UNLOGGED (PostgreSQL), NOLOGGING (Oracle)
+    # and, unless MSSQL_TABLOCK says otherwise, TABLOCK loads on SQL Server
+    minimal_logging = get_config_value(
+        "MINIMAL_LOGGING",
+        section="settings",
+        cfg_parser=cfg,
+        default=False,
+        cast_type=bool,
+    )
+    bulk_load_options = {
+        # SQL Server: INSERT ... WITH (TABLOCK) for minimally logged heap loads
+        "tablock": get_config_value(
+            "MSSQL_TABLOCK",
+            section="settings",
+            cfg_parser=cfg,
+            default=minimal_logging,
+            cast_type=bool,
+        ),
+        # Oracle: /*+ APPEND_VALUES */ direct-path inserts (replace/truncate only)
+        "direct_path": get_config_value(
+            "ORACLE_DIRECT_PATH",
+            section="settings",
+            cfg_parser=cfg,
+            default=False,
+            cast_type=bool,
+        ),
+        # MySQL/MariaDB: LOAD DATA LOCAL INFILE needs the client opt-in as well
+        "local_infile": get_config_value(
+            "DST_MYSQL_LOCAL_INFILE",
+            section="database-destination",
+            cfg_parser=cfg,
+            default=False,
+            cast_type=bool,
+        ),
+        # Oracle: skip and log rejected rows instead of failing the batch
+        "batch_errors": get_config_value(
+            "ORACLE_BATCH_ERRORS",
+            section="settings",
+            cfg_parser=cfg,
+            default=False,
+            cast_type=bool,
+        ),
+    }
+
+    # Configure destination write mode (replace | truncate | append | merge)
+    write_mode = cast(
+        str,
+        get_config_value(
+            "WRITE_MODE",
+            section="settings",
+            cfg_parser=cfg,
+            default="replace",
+        ),
+    ).lower()
+    if write_mode not in {"replace", "truncate", "append", "merge"}:
+        raise ValueError(
+            "WRITE_MODE must be one of ['replace','truncate','append','merge']; got "
+            f"{write_mode!r}"
+        )
+    if write_mode == "merge" and transfer_mode == "ARROW_DIRECT":
+        raise ValueError("WRITE_MODE=merge is not supported with ARROW_DIRECT")
+    # Without cleanup, uploaded files stay on disk and a dump would wait for
+    # space that never frees up
+    spill_max_gb = get_config_value(
+        "SPILL_MAX_GB", section="settings", cfg_parser=cfg, default=0, cast_type=float
+    )
+    if (spill_max_gb or 0) > 0 and not get_config_value(
+        "CLEANUP_PARQUET_FILES",
+        section="settings",
+        cfg_parser=cfg,
+        default=True,
+        cast_type=bool,
+    ):
+        raise ValueError("SPILL_MAX_GB requires CLEANUP_PARQUET_FILES = True")
+
+    # Replace tables through <table>__load_<runid> + swap instead of drop + load
+    shadow_load = get_config_value(
+        "SHADOW_LOAD",
+        section="settings",
+        cfg_parser=cfg,
+        default=False,
+        cast_type=bool,
+    )
+
+    # Optional admin database override (for managed Postgres/MSSQL where default admin DB isn't accessible)
+    admin_db_override = cast(
+        str | None,
+        get_config_value(
+            "DST_ADMIN_DB",
+            section="database-destination",
+            cfg_parser=cfg,
+        ),
+    )
+
+    # Incremental extraction for tables with SRC_WATERMARK_COLUMN_<table>; the
+    # high-water marks live in a state table in the destination schema
+    incremental: dict = {}
+    watermarks: WatermarkStore | None = None
+    if any("watermark_column" in opts for opts in table_options.values()):
+        if transfer_mode == "ARROW_DIRECT":
+            log.warning(
+                "SRC_WATERMARK_COLUMN_* is ignored with ARROW_DIRECT; loading full tables"
+            )
+        else:
+            dst_schema = cast(
+                str | None,
+                get_config_value(
+                    "DST_SCHEMA", section="database-destination", cfg_parser=cfg
+                ),
+            )
+            ensure_database_and_schema(
+                dest_engine, dst_schema, admin_database=admin_db_override
+            )
+            watermarks = WatermarkStore(dest_engine, schema=dst_schema)
+            incremental = plan_incremental(
+                source_connection,
+                tables,
+                watermarks,
+                source_schema=cast(
+                    str | None,
+                    get_config_value(
+                        "SRC_SCHEMA", section="database-source", cfg_parser=cfg
+                    ),
+                ),
+                table_options=table_options,
+                write_mode=write_mode,
+                full_refresh_days=get_config_value(
+                    "FULL_REFRESH_DAYS",
+                    section="settings",
+                    cfg_parser=cfg,
+                    default=0,
+                    cast_type=int,
+                ),
+                checkpoints=checkpoints,
+                schema_cache=schema_cache,
             )
 
-        # Optional admin database override (for managed Postgres/MSSQL where default admin DB isn't accessible)
-        admin_db_override = cast(
+    # Skip tables whose source fingerprint did not change since they were last
+    # loaded; the fingerprints live in a state table in the destination schema
+    changes: ChangeDetection | None = None
+    if get_config_value(
+        "CHANGE_DETECTION",
+        section="settings",
+        cfg_parser=cfg,
+        default=False,
+        cast_type=bool,
+    ):
+        dst_schema = cast(
             str | None,
             get_config_value(
-                "DST_ADMIN_DB",
-                section="database-destination",
-                cfg_parser=cfg,
+                "DST_SCHEMA", section="database-destination", cfg_parser=cfg
             ),
         )
+        ensure_database_and_schema(
+            dest_engine, dst_schema, admin_database=admin_db_override
+        )
+        changes = detect_changes(
+            source_connection,
+            tables,
+            FingerprintStore(dest_engine, schema=dst_schema),
+            source_schema=cast(
+                str | None,
+                get_config_value(
+                    "SRC_SCHEMA", section="database-source", cfg_parser=cfg
+                ),
+            ),
+            table_options=table_options,
+            row_limit=row_limit,
+        )
+    unchanged = changes.unchanged if changes is not None else []
+    on_table_loaded = changes.save if changes is not None else None
 
-        direct_transfer(
-            source_engine=source_connection,  # type: ignore[arg-type]
+    # Per-table phase timings (fetch/transform/insert, read/write), written as
+    # a JSON run report when METRICS_REPORT is set
+    metrics = TransferMetrics()
+
+    if transfer_mode == "ARROW_DIRECT":
+        # ConnectorX Arrow batches straight into the destination bulk loader
+        from sql_to_staging.functions.arrow_transfer import arrow_transfer
+
+        arrow_transfer(
+            source_uri=source_connection,  # type: ignore[arg-type]
             dest_engine=dest_engine,
             tables=tables,
             source_schema=cast(
@@ -139,7 +464,7 @@ def main() -> None:
                 default=True,
                 cast_type=bool,
             ),
-            # Optional retry/backoff tuning for direct transfer inserts
+            exact_row_count=exact_row_count,
             max_retries=get_config_value(
                 "DIRECT_MAX_RETRIES",
                 section="settings",
@@ -162,21 +487,38 @@ def main() -> None:
                 cast_type=float,
             ),
             admin_database=admin_db_override,
+            partitions=partitions,
+            table_options=table_options,
+            bulk_load=bulk_load,
+            bulk_load_options=bulk_load_options,
+            checkpoints=checkpoints,
+            memory_budget_mb=memory_budget_mb or None,
+            shadow_load=shadow_load,
+            minimal_logging=minimal_logging,
+            unchanged_tables=unchanged,
+            on_table_loaded=on_table_loaded,
+            metrics=metrics,
         )
-    else:
-        # Step 1/2: Dump tables from source to parquet files
-        from sql_to_staging.functions.download_parquet import download_parquet
+    elif transfer_mode == "SQLALCHEMY_DIRECT":
+        # Direct SQLAlchemy-to-SQLAlchemy chunked copy
+        from sql_to_staging.functions.direct_transfer import direct_transfer
 
-        manifest_path = download_parquet(
-            source_connection,
-            schema=cast(
+        direct_transfer(
+            source_engine=source_connection,  # type: ignore[arg-type]
+            dest_engine=dest_engine,
+            tables=tables,
+            source_schema=cast(
                 str | None,
                 get_config_value(
                     "SRC_SCHEMA", section="database-source", cfg_parser=cfg
                 ),
             ),
-            tables=tables,
-            output_dir="data",
+            dest_schema=cast(
+                str | None,
+                get_config_value(
+                    "DST_SCHEMA", section="database-destination", cfg_parser=cfg
+                ),
+            ),
             chunk_size=get_config_value(
                 "SRC_CHUNK_SIZE",
                 section="settings",
@@ -184,6 +526,8 @@ def main() -> None:
                 default=100_000,
                 cast_type=int,
             ),
+            lowercase_columns=True,
+            write_mode=write_mode,
             row_limit=row_limit,
             log_row_count=get_config_value(
                 "LOG_ROW_COUNT",
@@ -192,54 +536,222 @@ def main() -> None:
                 default=True,
                 cast_type=bool,
             ),
-        )
-
-        # Step 2/2: Upload parquet files into destination database
-        from utils.parquet.upload_parquet import upload_parquet
-
-        # Configure destination write mode for parquet upload as well
-        write_mode = cast(
-            str,
-            get_config_value(
-                "WRITE_MODE",
+            exact_row_count=exact_row_count,
+            # Optional retry/backoff tuning for direct transfer inserts
+            max_retries=get_config_value(
+                "DIRECT_MAX_RETRIES",
                 section="settings",
                 cfg_parser=cfg,
-                default="replace",
+                default=3,
+                cast_type=int,
             ),
-        ).lower()
-        if write_mode not in {"replace", "truncate", "append"}:
-            raise ValueError(
-                "WRITE_MODE must be one of ['replace','truncate','append']; got "
-                f"{write_mode!r}"
-            )
-
-        # Optional admin database override (for managed Postgres/MSSQL where default admin DB isn't accessible)
-        admin_db_override = cast(
-            str | None,
-            get_config_value(
-                "DST_ADMIN_DB",
-                section="database-destination",
+            backoff_base_seconds=get_config_value(
+                "DIRECT_BACKOFF_BASE_SECONDS",
+                section="settings",
                 cfg_parser=cfg,
+                default=0.5,
+                cast_type=float,
             ),
-        )
-
-        upload_parquet(
-            dest_engine,
-            schema=get_config_value(
-                "DST_SCHEMA", section="database-destination", cfg_parser=cfg
-            ),
-            input_dir="data",
-            cleanup=get_config_value(
-                "CLEANUP_PARQUET_FILES",
+            backoff_max_seconds=get_config_value(
+                "DIRECT_BACKOFF_MAX_SECONDS",
                 section="settings",
                 cfg_parser=cfg,
-                default=True,
-                cast_type=bool,
+                default=8.0,
+                cast_type=float,
             ),
-            manifest_path=manifest_path,
-            write_mode=write_mode,
             admin_database=admin_db_override,
+            # Number of tables copied concurrently (1 = sequential)
+            workers=get_config_value(
+                "TRANSFER_WORKERS",
+                section="settings",
+                cfg_parser=cfg,
+                default=1,
+                cast_type=int,
+            ),
+            partitions=partitions,
+            table_options=table_options,
+            # Chunks fetched ahead while the previous chunk is being inserted
+            pipeline_depth=get_config_value(
+                "DIRECT_PIPELINE_DEPTH",
+                section="settings",
+                cfg_parser=cfg,
+                default=2,
+                cast_type=int,
+            ),
+            bulk_load=bulk_load,
+            bulk_load_options=bulk_load_options,
+            keyset=keyset,
+            checkpoints=checkpoints,
+            incremental=incremental,
+            watermarks=watermarks,
+            memory_budget_mb=memory_budget_mb or None,
+            schema_cache=schema_cache,
+            shadow_load=shadow_load,
+            minimal_logging=minimal_logging,
+            unchanged_tables=unchanged,
+            on_table_loaded=on_table_loaded,
+            metrics=metrics,
+        )
+    else:
+        # Dump tables from source to parquet files and upload them into the
+        # destination database: after the dump, or (PIPELINED_UPLOAD) per table
+        # as soon as its files are complete, while the next table is dumped
+        from sql_to_staging.functions.download_parquet import download_parquet
+        from utils.parquet.upload_parquet import upload_parquet
+        from utils.parquet.spill import SpillManager
+        from utils.parquet.upload_pipeline import UploadPipeline
+
+        dump_tables = [t for t in tables if t not in unchanged]
+        cleanup = get_config_value(
+            "CLEANUP_PARQUET_FILES",
+            section="settings",
+            cfg_parser=cfg,
+            default=True,
+            cast_type=bool,
         )
+        dest_schema = get_config_value(
+            "DST_SCHEMA", section="database-destination", cfg_parser=cfg
+        )
+
+        def _advance_watermark(table: str) -> None:
+            if watermarks is not None and table in incremental:
+                watermarks.save(incremental[table])
+            if on_table_loaded is not None:
+                on_table_loaded(table)
+            # A resumed run skips the table instead of dumping it again
+            if checkpoints is not None:
+                checkpoints.mark_uploaded(table)
+
+        def _upload(**files: Any) -> None:
+            upload_parquet(
+                dest_engine,
+                schema=dest_schema,
+                input_dir="data",
+                cleanup=cleanup,
+                write_mode=write_mode,
+                admin_database=admin_db_override,
+                bulk_load=bulk_load,
+                bulk_load_options=bulk_load_options,
+                table_write_modes={
+                    t: effective_write_mode(incremental, t, write_mode)
+                    for t in dump_tables
+                },
+                merge_keys={t: plan.merge_keys for t, plan in incremental.items()},
+                on_table_loaded=_advance_watermark,
+                shadow_load=shadow_load,
+                minimal_logging=minimal_logging,
+                metrics=metrics,
+                **files,
+            )
+
+        # Disk budget for the data directory; only uploads can free it up
+        spill = (
+            SpillManager("data", int(spill_max_gb * 1024**3))
+            if spill_max_gb and spill_max_gb > 0
+            else None
+        )
+        pipelined = get_config_value(
+            "PIPELINED_UPLOAD",
+            section="settings",
+            cfg_parser=cfg,
+            default=False,
+            cast_type=bool,
+        )
+        if spill is not None and not pipelined:
+            log.info("SPILL_MAX_GB is set; uploading each table once it is dumped")
+            pipelined = True
+        pipeline = (
+            UploadPipeline(
+                lambda table, files: _upload(table_files={table: files}),
+                # Finished tables waiting for the uploader before the dump blocks
+                queue_size=get_config_value(
+                    "PIPELINED_UPLOAD_QUEUE",
+                    section="settings",
+                    cfg_parser=cfg,
+                    default=1,
+                    cast_type=int,
+                ),
+                on_done=spill.released if spill is not None else None,
+            )
+            if pipelined
+            else None
+        )
+
+        with pipeline if pipeline is not None else nullcontext():
+            manifest_path = download_parquet(
+                source_connection,
+                schema=cast(
+                    str | None,
+                    get_config_value(
+                        "SRC_SCHEMA", section="database-source", cfg_parser=cfg
+                    ),
+                ),
+                tables=dump_tables,
+                output_dir="data",
+                chunk_size=get_config_value(
+                    "SRC_CHUNK_SIZE",
+                    section="settings",
+                    cfg_parser=cfg,
+                    default=100_000,
+                    cast_type=int,
+                ),
+                row_limit=row_limit,
+                log_row_count=get_config_value(
+                    "LOG_ROW_COUNT",
+                    section="settings",
+                    cfg_parser=cfg,
+                    default=True,
+                    cast_type=bool,
+                ),
+                exact_row_count=exact_row_count,
+                partitions=partitions,
+                table_options=table_options,
+                keyset=keyset,
+                checkpoints=checkpoints,
+                incremental=incremental,
+                memory_budget_mb=memory_budget_mb or None,
+                schema_cache=schema_cache,
+                metrics=metrics,
+                # One parquet file per table with a row group per chunk (0 = file per chunk)
+                max_file_mb=get_config_value(
+                    "PARQUET_FILE_MAX_MB",
+                    section="settings",
+                    cfg_parser=cfg,
+                    default=0,
+                    cast_type=int,
+                )
+                or None,
+                parquet_options=parquet_write_options_from_config(cfg),
+                on_table_dumped=pipeline.submit if pipeline is not None else None,
+                spill=spill,
+            )
+
+        if pipeline is None:
+            _upload(manifest_path=manifest_path)
+        elif cleanup:
+            # Every table was uploaded (and its files deleted) by the pipeline
+            os.remove(manifest_path)
+        if spill is not None:
+            spill.log_summary()
+            metrics.run["spill"] = spill.report()
+
+        log.info(
+            "Run summary: %d table(s) dumped and uploaded, %d unchanged",
+            len(dump_tables),
+            len(unchanged),
+        )
+        for table in unchanged:
+            log.info("   SKIPPED %s: unchanged since the previous run", table)
+
+    metrics_report = get_config_value(
+        "METRICS_REPORT", section="settings", cfg_parser=cfg, default=""
+    )
+    if metrics_report:
+        metrics.write_report(str(metrics_report))
+
+    # Everything landed in staging; a later --resume starts from scratch
+    if checkpoints is not None:
+        checkpoints.clear()
 
 
 if __name__ == "__main__":  # pragma: no cover - CLI entrypoint
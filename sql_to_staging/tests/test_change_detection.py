@@ -0,0 +1,89 @@
+# Tests for skipping unchanged tables (CHANGE_DETECTION / SRC_CHANGE_COLUMN_<table>)
+# Focuses on source fingerprints, the fingerprint state table and skipped tables in the summary
+# This ensures unchanged tables are not copied again while changed or missing ones always are
+
+import logging
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from sql_to_staging.functions.change_detection import (
+    FingerprintStore,
+    detect_changes,
+    fingerprint_query,
+)
+from sql_to_staging.functions.direct_transfer import direct_transfer
+
+_OPTIONS = {"codes": {"change_column": "changed"}}
+
+
+def _mk_sqlite_engine(tmp_path: Path, name: str):
+    return create_engine(f"sqlite+pysqlite:///{tmp_path / f'{name}.sqlite'}")
+
+
+def _seed(engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE codes (id INTEGER PRIMARY KEY, changed INT)"))
+        conn.execute(text("INSERT INTO codes VALUES (1, 1), (2, 2)"))
+        conn.execute(text("CREATE TABLE other (id INTEGER PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO other VALUES (1)"))
+
+
+def _run(src, dst):
+    changes = detect_changes(
+        src, ["codes", "other"], FingerprintStore(dst), table_options=_OPTIONS
+    )
+    results = direct_transfer(
+        src,
+        dst,
+        ["codes", "other"],
+        table_options=_OPTIONS,
+        unchanged_tables=changes.unchanged,
+        on_table_loaded=changes.save,
+    )
+    return changes, {r.table: r for r in results}
+
+
+def test_fingerprint_queries_per_dialect():
+    assert "md5(t::text)" in fingerprint_query("postgresql", "s.t")
+    assert "BINARY_CHECKSUM(*)" in fingerprint_query("mssql", "dbo.t")
+    assert fingerprint_query("oracle", "T", columns=["A", "B"]) == (
+        'SELECT COUNT(*), SUM(ORA_HASH("A" || \'|\' || "B")) FROM T'
+    )
+    assert "CRC32(CONCAT_WS('|', a, ISNULL(a)))" in fingerprint_query(
+        "mysql", "t", columns=["a"]
+    )
+    assert fingerprint_query("sqlite", "t") is None
+    assert (
+        fingerprint_query("sqlite", "t", change_column="changed")
+        == "SELECT COUNT(*), MAX(changed) FROM t"
+    )
+
+
+@pytest.mark.sa_direct
+def test_unchanged_table_is_skipped_until_source_changes(tmp_path: Path, caplog):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    _seed(src)
+
+    first, results = _run(src, dst)
+    assert first.unchanged == [] and results["codes"].rows == 2
+
+    with caplog.at_level(logging.INFO, logger="sql_to_staging.direct_transfer"):
+        second, results = _run(src, dst)
+    # Without a change column SQLite has no fingerprint: "other" is always copied
+    assert second.unchanged == ["codes"]
+    assert results["codes"].skipped and results["other"].rows == 1
+    assert "SKIPPED codes: unchanged since the previous run" in caplog.text
+
+    with src.begin() as conn:
+        conn.execute(text("INSERT INTO codes VALUES (3, 3)"))
+    third, results = _run(src, dst)
+    assert third.unchanged == [] and results["codes"].rows == 3
+
+    # A dropped staging table is copied again even when the source is unchanged
+    with dst.begin() as conn:
+        conn.execute(text("DROP TABLE codes"))
+    fourth, _ = _run(src, dst)
+    assert fourth.unchanged == []
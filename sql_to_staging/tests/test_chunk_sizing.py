@@ -0,0 +1,101 @@
+# Tests for memory-budgeted adaptive chunk sizing (MEMORY_BUDGET_MB)
+# Focuses on per-table sizes from column types, refinement from measured batches and RSS backpressure
+# This ensures wide tables get small chunks, narrow tables large ones and memory pressure shrinks batches
+
+import logging
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, Text, create_engine, text
+
+import sql_to_staging.functions.chunk_sizing as cs
+from sql_to_staging.functions.chunk_sizing import (
+    MAX_CHUNK_ROWS,
+    MIN_CHUNK_ROWS,
+    ChunkSizer,
+    measure_batch_bytes,
+)
+from sql_to_staging.functions.direct_transfer import direct_transfer
+
+
+def _table(name: str, *cols: Column) -> Table:
+    return Table(name, MetaData(), Column("id", Integer, primary_key=True), *cols)
+
+
+def test_chunk_size_follows_row_width(monkeypatch):
+    monkeypatch.setattr(cs, "current_rss_bytes", lambda: None)
+    narrow = ChunkSizer.for_table(2048, _table("narrow"), label="narrow")
+    wide = ChunkSizer.for_table(
+        512, _table("wide", *[Column(f"c{i}", Text) for i in range(20)]), label="wide"
+    )
+
+    assert narrow.next_size() == MAX_CHUNK_ROWS
+    assert MIN_CHUNK_ROWS < wide.next_size() < 5_000
+    # More chunks in flight means smaller chunks each
+    shared = ChunkSizer.for_table(
+        512,
+        _table("wide", *[Column(f"c{i}", Text) for i in range(20)]),
+        label="wide",
+        in_flight=4,
+    )
+    assert shared.next_size() < wide.next_size()
+
+
+def test_observed_batches_refine_estimate(monkeypatch):
+    monkeypatch.setattr(cs, "current_rss_bytes", lambda: None)
+    sizer = ChunkSizer(64, 10_000, label="t")
+    initial = sizer.next_size()
+
+    batch = [{"id": i, "name": "x"} for i in range(500)]
+    sizer.observe(len(batch), measure_batch_bytes(batch))
+
+    assert sizer.row_bytes < 1_000
+    assert sizer.next_size() > initial
+
+
+def test_rss_backpressure_shrinks_and_recovers(monkeypatch):
+    rss = {"bytes": 0}
+    monkeypatch.setattr(cs, "current_rss_bytes", lambda: rss["bytes"])
+    sizer = ChunkSizer(100, 1_000, label="t")
+    target = sizer.next_size()
+
+    rss["bytes"] = 95 * 1024 * 1024  # above 90% of the budget
+    assert sizer.next_size() == target // 2
+    assert sizer.next_size() == target // 4
+
+    rss["bytes"] = 10 * 1024 * 1024
+    assert sizer.next_size() == target // 2
+    assert sizer.next_size() == target
+
+
+def test_fixed_size_warns_that_there_is_no_backpressure(monkeypatch, caplog):
+    monkeypatch.setattr(cs, "current_rss_bytes", lambda: None)
+    sizer = ChunkSizer(100, 1_000, label="t")
+
+    with caplog.at_level(logging.WARNING):
+        size = sizer.fixed_size("ConnectorX")
+
+    assert size == sizer.chunk_size
+    assert "ConnectorX reads fixed batches" in caplog.text
+    assert "no backpressure" in caplog.text
+
+
+@pytest.mark.sa_direct
+def test_direct_transfer_with_memory_budget(tmp_path: Path, caplog, monkeypatch):
+    monkeypatch.setattr(cs, "current_rss_bytes", lambda: None)
+    src = create_engine(f"sqlite+pysqlite:///{tmp_path / 'src.sqlite'}")
+    dst = create_engine(f"sqlite+pysqlite:///{tmp_path / 'dst.sqlite'}")
+    with src.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, body TEXT)"))
+        conn.execute(
+            text("INSERT INTO items (id, body) VALUES (:i, :b)"),
+            [{"i": i, "b": "x" * 100} for i in range(1, 2_501)],
+        )
+
+    with caplog.at_level(logging.INFO):
+        direct_transfer(src, dst, ["items"], memory_budget_mb=1, pipeline_depth=0)
+
+    with dst.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 2_500
+    assert "items: chunk size 1,000 rows" in caplog.text
+    assert "inserted 1000 rows" in caplog.text
@@ -0,0 +1,114 @@
+# Tests for per-table column projection and source filters (SRC_COLUMNS_<table>, SRC_WHERE_<table>)
+# Focuses on pushing columns and WHERE predicates into direct transfer and Parquet dumps
+# This ensures staging tables only hold the selected columns and rows while keys are always kept
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from sql_to_staging.functions.direct_transfer import direct_transfer
+from sql_to_staging.functions.connectorx_sql import connectorx_select
+from sql_to_staging.functions.download_parquet import download_parquet
+from sql_to_staging.functions.projection import connectorx_columns, project_table
+from sql_to_staging.functions.schema_cache import reflect_table
+
+_OPTIONS = {"items": {"columns": "name, STATUS", "where": "status = 'A'"}}
+
+
+def _mk_sqlite_engine(tmp_path: Path, name: str):
+    return create_engine(f"sqlite+pysqlite:///{tmp_path / f'{name}.sqlite'}")
+
+
+def _seed(engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, "
+                "status TEXT, notes TEXT, changed INT)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO items VALUES (1, 'a', 'A', 'x', 1), (2, 'b', 'B', 'y', 2), "
+                "(3, 'c', 'A', 'z', 3)"
+            )
+        )
+
+
+def test_projection_keeps_key_columns_and_rejects_unknown(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    _seed(src)
+    table = reflect_table(src, "items")
+
+    options = {"items": {"columns": "name", "watermark_column": "changed"}}
+    projected = project_table(table, options, "items")
+    assert [c.name for c in projected.columns] == ["id", "name", "changed"]
+    assert [c.name for c in projected.primary_key.columns] == ["id"]
+    assert projected.c.name.type.__class__ is table.c.name.type.__class__
+    assert project_table(table, {}, "items") is table
+
+    with pytest.raises(ValueError, match="missing"):
+        project_table(table, {"items": {"columns": "name, missing"}}, "items")
+
+
+def test_connectorx_select_with_columns():
+    columns = connectorx_columns(
+        {"t": {"columns": "a, b", "partition_column": "id"}}, "t"
+    )
+    assert columns == ["a", "b", "id"]
+    assert (
+        connectorx_select("mssql", "dbo.t", 5, where="(a > 1)", columns=columns)
+        == "SELECT TOP (5) a, b, id FROM dbo.t WHERE (a > 1)"
+    )
+    assert connectorx_select("postgresql", "t", None) == "SELECT * FROM t"
+
+
+@pytest.mark.sa_direct
+def test_direct_transfer_projects_and_filters(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    _seed(src)
+
+    direct_transfer(src, dst, ["items"], table_options=_OPTIONS)
+
+    assert [c["name"] for c in inspect(dst).get_columns("items")] == [
+        "id",
+        "name",
+        "status",
+    ]
+    with dst.connect() as conn:
+        rows = conn.execute(text("SELECT id, name FROM items ORDER BY id")).all()
+    assert rows == [(1, "a"), (3, "c")]
+
+
+@pytest.mark.sa_dump
+def test_sqlalchemy_dump_projects_and_filters(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    _seed(src)
+    out = tmp_path / "out"
+
+    download_parquet(src, ["items"], output_dir=str(out), table_options=_OPTIONS)
+
+    df = pl.read_parquet(next(out.glob("items_part*.parquet")))
+    assert df.columns == ["id", "name", "status"]
+    assert df["id"].to_list() == [1, 3]
+
+
+@pytest.mark.cx_dump
+def test_connectorx_dump_drops_the_detected_partition_column(tmp_path: Path):
+    _seed(_mk_sqlite_engine(tmp_path, "src"))
+    out = tmp_path / "out"
+
+    download_parquet(
+        f"sqlite://{tmp_path / 'src.sqlite'}",
+        ["items"],
+        output_dir=str(out),
+        partitions=2,
+        table_options={"items": {"columns": "name"}},
+    )
+
+    df = pl.concat(pl.read_parquet(f) for f in sorted(out.glob("items_part*.parquet")))
+    assert df.columns == ["name"]
+    assert sorted(df["name"].to_list()) == ["a", "b", "c"]
@@ -0,0 +1,252 @@
+# Tests for watermark-based incremental extraction (SRC_WATERMARK_COLUMN_<table>)
+# Focuses on full-then-delta runs with WRITE_MODE merge/append, high-water mark state and periodic full refreshes
+# This ensures only changed rows are read and merged deltas never duplicate or lose rows
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from sql_to_staging.functions.direct_transfer import direct_transfer
+from sql_to_staging.functions.connectorx_sql import connectorx_select
+from sql_to_staging.functions.download_parquet import download_parquet
+from sql_to_staging.functions.watermarks import (
+    IncrementalPlan,
+    WatermarkStore,
+    effective_write_mode,
+    literal_where,
+    plan_incremental,
+)
+from utils.parquet.upload_parquet import upload_parquet
+
+_OPTIONS = {"items": {"watermark_column": "VERSION"}}
+
+
+def _mk_sqlite_engine(tmp_path: Path, name: str):
+    db = tmp_path / f"{name}.sqlite"
+    return create_engine(f"sqlite+pysqlite:///{db}")
+
+
+def _seed_items(engine, n: int) -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            text("CREATE TABLE items (ID INTEGER PRIMARY KEY, name TEXT, VERSION INT)")
+        )
+        for i in range(1, n + 1):
+            conn.execute(
+                text("INSERT INTO items (ID, name, VERSION) VALUES (:i, :n, :i)"),
+                {"i": i, "n": f"n{i}"},
+            )
+
+
+def _change_items(engine) -> None:
+    # One updated row and one new row, both above the high-water mark of 5
+    with engine.begin() as conn:
+        conn.execute(
+            text("UPDATE items SET name = 'changed', VERSION = 6 WHERE ID = 2")
+        )
+        conn.execute(text("INSERT INTO items (ID, name, VERSION) VALUES (6, 'n6', 7)"))
+
+
+def _dest_rows(engine) -> list[tuple]:
+    with engine.connect() as conn:
+        return [
+            tuple(r)
+            for r in conn.execute(text("SELECT id, name FROM items ORDER BY id"))
+        ]
+
+
+@pytest.mark.sa_direct
+def test_direct_transfer_merge_full_then_delta(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    _seed_items(src, 5)
+    store = WatermarkStore(dst)
+
+    plans = plan_incremental(
+        src, ["items"], store, table_options=_OPTIONS, write_mode="merge"
+    )
+    assert plans["items"].is_full and plans["items"].merge_keys == ["id"]
+    direct_transfer(
+        src,
+        dst,
+        ["items"],
+        write_mode="merge",
+        incremental=plans,
+        watermarks=store,
+    )
+    assert len(_dest_rows(dst)) == 5
+    assert store.get("items").value == 5
+
+    _change_items(src)
+    plans = plan_incremental(
+        src, ["items"], store, table_options=_OPTIONS, write_mode="merge"
+    )
+    plan = plans["items"]
+    assert (plan.write_mode, plan.lower, plan.upper) == ("merge", 5, 7)
+    direct_transfer(
+        src,
+        dst,
+        ["items"],
+        write_mode="merge",
+        incremental=plans,
+        watermarks=store,
+    )
+
+    rows = _dest_rows(dst)
+    assert len(rows) == 6 and (2, "changed") in rows and (6, "n6") in rows
+    assert not inspect(dst).has_table("items__delta")
+    assert store.get("items").value == 7
+
+
+@pytest.mark.sa_dump
+def test_dump_and_upload_append_delta(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    _seed_items(src, 5)
+    store = WatermarkStore(dst)
+    out = tmp_path / "out"
+
+    def _run() -> None:
+        plans = plan_incremental(
+            src, ["items"], store, table_options=_OPTIONS, write_mode="append"
+        )
+        manifest = download_parquet(
+            src, ["items"], output_dir=str(out), incremental=plans
+        )
+        upload_parquet(
+            dst,
+            input_dir=str(out),
+            manifest_path=manifest,
+            write_mode="append",
+            table_write_modes={"items": effective_write_mode(plans, "items", "append")},
+            on_table_loaded=lambda t: store.save(plans[t]),
+        )
+
+    _run()
+    with dst.begin() as conn:
+        conn.execute(text("INSERT INTO items (id, name, version) VALUES (99, 'x', 1)"))
+    # Nothing changed in the source: the delta is empty and the mark stays
+    _run()
+    assert len(_dest_rows(dst)) == 6
+    assert store.get("items").value == 5
+
+    with src.begin() as conn:
+        conn.execute(text("INSERT INTO items (ID, name, VERSION) VALUES (6, 'n6', 6)"))
+    _run()
+    # The first (full) run replaced the table; later runs only appended id 6
+    assert [r[0] for r in _dest_rows(dst)] == [1, 2, 3, 4, 5, 6, 99]
+    assert store.get("items").value == 6
+
+
+@pytest.mark.sa_dump
+def test_upload_merge_delta_by_key(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    _seed_items(src, 5)
+    store = WatermarkStore(dst)
+    out = tmp_path / "out"
+    loaded: list[str] = []
+
+    def _run() -> None:
+        plans = plan_incremental(
+            src, ["items"], store, table_options=_OPTIONS, write_mode="merge"
+        )
+        manifest = download_parquet(
+            src, ["items"], output_dir=str(out), incremental=plans
+        )
+
+        def _loaded(table: str) -> None:
+            loaded.append(table)
+            store.save(plans[table])
+
+        upload_parquet(
+            dst,
+            input_dir=str(out),
+            manifest_path=manifest,
+            write_mode="merge",
+            table_write_modes={"items": plans["items"].write_mode},
+            merge_keys={"items": plans["items"].merge_keys},
+            on_table_loaded=_loaded,
+        )
+
+    _run()
+    _change_items(src)
+    _run()
+
+    rows = _dest_rows(dst)
+    assert len(rows) == 6 and (2, "changed") in rows
+    assert loaded == ["items", "items"]
+    assert not inspect(dst).has_table("items__delta")
+
+
+def test_periodic_full_refresh_and_changed_column(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    _seed_items(src, 3)
+    store = WatermarkStore(dst)
+    store.ensure()
+    store.save(IncrementalPlan("items", "VERSION", "replace", upper=3))
+
+    def _plan(**kwargs) -> IncrementalPlan:
+        return plan_incremental(src, ["items"], store, write_mode="append", **kwargs)[
+            "items"
+        ]
+
+    assert _plan(table_options=_OPTIONS).write_mode == "append"
+    # Last full refresh is older than the configured interval
+    with dst.begin() as conn:
+        conn.execute(
+            store.table.update().values(
+                last_full_refresh=datetime.now() - timedelta(days=8)
+            )
+        )
+    assert _plan(table_options=_OPTIONS, full_refresh_days=7).is_full
+    per_table = {"items": {**_OPTIONS["items"], "full_refresh_days": "30"}}
+    assert not _plan(table_options=per_table, full_refresh_days=7).is_full
+    # Another watermark column invalidates the stored mark
+    assert _plan(table_options={"items": {"watermark_column": "id"}}).is_full
+
+
+def test_literal_where_renders_bounds_per_dialect():
+    plan = IncrementalPlan(
+        "items",
+        "changed_at",
+        "append",
+        lower=datetime(2024, 1, 1),
+        upper=datetime(2024, 2, 1, 12, 30),
+    )
+    where = literal_where(plan, "postgresql")
+    assert where is not None and "changed_at > '2024-01-01" in where
+    assert "changed_at <= '2024-02-01 12:30:00" in where
+
+    mssql = connectorx_select(
+        "mssql", "dbo.items", 10, where=literal_where(plan, "mssql")
+    )
+    assert mssql.startswith("SELECT TOP (10) * FROM dbo.items WHERE changed_at > ")
+    oracle = connectorx_select("oracle", "ITEMS", 10, where="x = 1")
+    assert oracle == "SELECT * FROM ITEMS WHERE x = 1 FETCH FIRST 10 ROWS ONLY"
+    # A source without any watermark values yields an empty delta
+    empty = IncrementalPlan("items", "version", "append", lower=5, upper=None)
+    assert "false" in literal_where(empty, "postgresql").lower()
+
+
+@pytest.mark.cx_dump
+def test_plan_quotes_the_watermark_column_on_connectorx_sources(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    with src.begin() as conn:
+        conn.execute(text('CREATE TABLE items (ID INTEGER PRIMARY KEY, "order" INT)'))
+        conn.execute(text('INSERT INTO items (ID, "order") VALUES (1, 4), (2, 9)'))
+    store = WatermarkStore(dst)
+    store.ensure()
+
+    plans = plan_incremental(
+        f"sqlite://{tmp_path / 'src.sqlite'}",
+        ["items"],
+        store,
+        table_options={"items": {"watermark_column": "order", "merge_key": "ID"}},
+    )
+
+    assert plans["items"].upper == 9
@@ -0,0 +1,279 @@
+# Tests for keyset-paginated extraction with chunk checkpoints and --resume
+# Focuses on checkpoint persistence, continuing after the last committed key and skipping finished tables
+# This ensures a failed run can be resumed without reloading whole tables or duplicating rows
+
+import json
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import polars as pl
+import pytest
+from sqlalchemy import create_engine, text
+
+import sql_to_staging.functions.direct_transfer as dt
+import sql_to_staging.functions.download_parquet as dp
+from sql_to_staging.functions.checkpoints import CheckpointStore, decode_key, encode_key
+from sql_to_staging.functions.direct_transfer import direct_transfer
+from sql_to_staging.functions.download_parquet import download_parquet
+from utils.bulk_load import BulkLoader
+
+
+def _mk_sqlite_engine(tmp_path: Path, name: str):
+    db = tmp_path / f"{name}.sqlite"
+    return create_engine(f"sqlite+pysqlite:///{db}")
+
+
+def _seed_items(engine, n: int) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (ID INTEGER PRIMARY KEY, name TEXT)"))
+        for i in range(1, n + 1):
+            conn.execute(
+                text("INSERT INTO items (ID, name) VALUES (:i, :n)"),
+                {"i": i, "n": f"n{i}"},
+            )
+
+
+def _fail_on_call(monkeypatch, target: str, original, fail_at: int) -> None:
+    calls = {"n": 0}
+
+    def wrapper(*args, **kwargs):
+        calls["n"] += 1
+        if calls["n"] == fail_at:
+            raise RuntimeError("simulated network blip")
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(target, wrapper)
+
+
+def test_checkpoint_store_roundtrip_and_scope(tmp_path: Path):
+    path = str(tmp_path / "cp" / "checkpoint.json")
+    for value in (5, "abc", Decimal("1.50"), datetime(2024, 1, 2, 3, 4, 5)):
+        assert decode_key(json.loads(json.dumps(encode_key(value)))) == value
+
+    store = CheckpointStore.open(path, scope="A", resume=False)
+    store.update("t1", keyset_column="id", last_key=encode_key(10), rows=10)
+    store.mark_done("t2", rows=3)
+
+    resumed = CheckpointStore.open(path, scope="A", resume=True)
+    assert resumed.get("t1") == {"keyset_column": "id", "last_key": 10, "rows": 10}
+    assert resumed.is_done("t2") and not resumed.is_done("t1")
+    # Another scope, or no resume, starts from scratch
+    assert CheckpointStore.open(path, scope="B", resume=True).get("t1") is None
+    fresh = CheckpointStore.open(path, scope="A", resume=False)
+    assert fresh.get("t1") is None and not Path(path).exists()
+
+
+@pytest.mark.sa_direct
+def test_direct_transfer_keyset_resume_after_failure(tmp_path: Path, monkeypatch):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    _seed_items(src, 23)
+    path = str(tmp_path / "checkpoint.json")
+
+    # The third chunk fails: two chunks (10 rows) are committed and checkpointed
+    _fail_on_call(
+        monkeypatch,
+        "sql_to_staging.functions.direct_transfer._insert_with_retry",
+        dt._insert_with_retry,
+        fail_at=3,
+    )
+    store = CheckpointStore.open(path, scope="s", resume=False)
+    with pytest.raises(RuntimeError, match="simulated"):
+        direct_transfer(
+            src, dst, ["items"], chunk_size=5, keyset=True, checkpoints=store
+        )
+    monkeypatch.undo()
+    state = CheckpointStore.open(path, scope="s", resume=True).get("items")
+    assert state == {"keyset_column": "ID", "last_key": 10, "rows": 10}
+
+    # A chunk that was committed but not checkpointed must not be duplicated
+    with dst.begin() as conn:
+        conn.execute(text("INSERT INTO items (id, name) VALUES (11, 'orphan')"))
+
+    results = direct_transfer(
+        src,
+        dst,
+        ["items"],
+        chunk_size=5,
+        write_mode="replace",
+        keyset=True,
+        checkpoints=CheckpointStore.open(path, scope="s", resume=True),
+    )
+    assert results[0].rows == 23
+    with dst.connect() as conn:
+        rows = conn.execute(text("SELECT id, name FROM items ORDER BY id")).all()
+    assert [r[0] for r in rows] == list(range(1, 24))
+    assert rows[10][1] == "n11"
+
+    # Finished tables are skipped on the next resume
+    resumed = CheckpointStore.open(path, scope="s", resume=True)
+    assert resumed.is_done("items")
+    with dst.begin() as conn:
+        conn.execute(text("DELETE FROM items"))
+    results = direct_transfer(src, dst, ["items"], keyset=True, checkpoints=resumed)
+    assert results[0].rows == 23
+    with dst.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 0
+
+
+@pytest.mark.sa_direct
+def test_direct_transfer_keyset_resume_refuses_append(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    _seed_items(src, 5)
+    # Rows of an earlier append run, above the checkpointed key
+    with dst.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER, name TEXT)"))
+        conn.execute(text("INSERT INTO items VALUES (4, 'old'), (5, 'old')"))
+    path = str(tmp_path / "checkpoint.json")
+    store = CheckpointStore.open(path, scope="s", resume=False)
+    store.update("items", keyset_column="ID", last_key=encode_key(2), rows=2)
+
+    with pytest.raises(ValueError, match="WRITE_MODE=append"):
+        direct_transfer(
+            src,
+            dst,
+            ["items"],
+            chunk_size=2,
+            write_mode="append",
+            keyset=True,
+            checkpoints=CheckpointStore.open(path, scope="s", resume=True),
+        )
+    with dst.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 2
+
+
+@pytest.mark.sa_direct
+def test_direct_transfer_keyset_resume_at_row_limit_reads_nothing(
+    tmp_path: Path, monkeypatch
+):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    _seed_items(src, 23)
+    path = str(tmp_path / "checkpoint.json")
+
+    # Both limited chunks are committed and checkpointed, then the run fails
+    def _fail(*args, **kwargs):
+        raise RuntimeError("simulated crash before the table was marked done")
+
+    monkeypatch.setattr(CheckpointStore, "mark_done", _fail)
+    with pytest.raises(RuntimeError, match="simulated"):
+        direct_transfer(
+            src,
+            dst,
+            ["items"],
+            chunk_size=5,
+            row_limit=10,
+            keyset=True,
+            checkpoints=CheckpointStore.open(path, scope="s", resume=False),
+        )
+    monkeypatch.undo()
+    state = CheckpointStore.open(path, scope="s", resume=True).get("items")
+    assert state == {"keyset_column": "ID", "last_key": 10, "rows": 10}
+
+    pages = {"n": 0}
+    original = dt.keyset_page
+
+    def _count_pages(*args, **kwargs):
+        pages["n"] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(
+        "sql_to_staging.functions.direct_transfer.keyset_page", _count_pages
+    )
+    results = direct_transfer(
+        src,
+        dst,
+        ["items"],
+        chunk_size=5,
+        row_limit=10,
+        keyset=True,
+        checkpoints=CheckpointStore.open(path, scope="s", resume=True),
+    )
+    assert pages["n"] == 0
+    assert results[0].rows == 10
+    with dst.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 10
+
+
+@pytest.mark.sa_direct
+def test_direct_transfer_counts_rows_written_by_the_loader(tmp_path: Path, monkeypatch):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    _seed_items(src, 12)
+    path = str(tmp_path / "checkpoint.json")
+
+    class _RejectingLoader(BulkLoader):
+        """Inserts odd IDs only, like a loader with Oracle batch errors."""
+
+        name = "rejecting"
+
+        def load_rows(self, conn, table, rows):
+            kept = [r for r in rows if r["id"] % 2]
+            conn.execute(table.insert(), kept)
+            return len(kept)
+
+    monkeypatch.setattr(
+        "sql_to_staging.functions.direct_transfer.get_bulk_loader",
+        lambda engine, options: _RejectingLoader(),
+    )
+    checkpoints = CheckpointStore.open(path, scope="s", resume=False)
+    monkeypatch.setattr(CheckpointStore, "mark_done", lambda *a, **k: None)
+    results = direct_transfer(
+        src, dst, ["items"], chunk_size=5, keyset=True, checkpoints=checkpoints
+    )
+
+    assert results[0].rows == 6
+    state = CheckpointStore.open(path, scope="s", resume=True).get("items")
+    assert state == {"keyset_column": "ID", "last_key": 12, "rows": 6}
+    with dst.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 6
+
+
+@pytest.mark.sa_dump
+def test_download_parquet_keyset_resume_continues_part_files(
+    tmp_path: Path, monkeypatch
+):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    _seed_items(src, 12)
+    out_dir = tmp_path / "out"
+    path = str(tmp_path / "checkpoint.json")
+
+    _fail_on_call(
+        monkeypatch,
+        "sql_to_staging.functions.download_parquet.keyset_page",
+        dp.keyset_page,
+        fail_at=3,
+    )
+    with pytest.raises(RuntimeError, match="simulated"):
+        download_parquet(
+            src,
+            ["items"],
+            output_dir=str(out_dir),
+            chunk_size=5,
+            keyset=True,
+            checkpoints=CheckpointStore.open(path, scope="s", resume=False),
+        )
+    monkeypatch.undo()
+    # Rows already written must not be read again
+    with src.begin() as conn:
+        conn.execute(text("DELETE FROM items WHERE ID <= 10"))
+
+    manifest_path = download_parquet(
+        src,
+        ["items"],
+        output_dir=str(out_dir),
+        chunk_size=5,
+        table_options={"items": {"keyset_column": "id"}},
+        checkpoints=CheckpointStore.open(path, scope="s", resume=True),
+    )
+    with open(manifest_path, encoding="utf-8") as f:
+        files = json.load(f)["files"]
+    assert files == [
+        "items_part0000.parquet",
+        "items_part0001.parquet",
+        "items_part0002.parquet",
+    ]
+    ids = pl.concat([pl.read_parquet(out_dir / f) for f in files])["ID"].to_list()
+    assert ids == list(range(1, 13))
@@ -0,0 +1,108 @@
+# Tests for row-group parquet files per table (PARQUET_FILE_MAX_MB)
+# Focuses on file rollover, the schema pinned from the first batch and the manifest/upload of such files
+# This ensures big tables are dumped into few files without changing what ends up in staging
+
+import json
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from sqlalchemy import create_engine, text
+
+from sql_to_staging.functions.download_parquet import download_parquet
+from sql_to_staging.functions.parquet_writer import TableParquetWriter
+from utils.parquet.upload_parquet import group_parquet_files, upload_parquet
+from utils.parquet.write_options import ParquetWriteOptions
+
+
+def _mk_sqlite_engine(tmp_path: Path, name: str):
+    return create_engine(f"sqlite+pysqlite:///{tmp_path / f'{name}.sqlite'}")
+
+
+def test_writer_rolls_over_and_pins_the_first_schema(tmp_path: Path):
+    writer = TableParquetWriter(str(tmp_path), "t", max_file_bytes=2_000)
+    writer.write(
+        pa.record_batch(
+            [pa.array([0.5] * 50), pa.array([None] * 50)], names=["amount", "note"]
+        )
+    )
+    for i in range(9):
+        writer.write(
+            pa.record_batch(
+                [pa.array(range(50)), pa.array([f"n{i}"] * 50)],
+                names=["amount", "note"],
+            )
+        )
+    files = writer.close()
+
+    assert len(files) > 1
+    assert files == sorted(files) and files[0] == "t_part0000.parquet"
+    row_groups = 0
+    for name in files:
+        parquet_file = pq.ParquetFile(tmp_path / name)
+        assert parquet_file.schema_arrow.types == [pa.float64(), pa.large_string()]
+        row_groups += parquet_file.num_row_groups
+    assert row_groups == 10
+
+    with pytest.raises(ValueError, match="differ from the first batch"):
+        writer.write(pa.record_batch([pa.array([1])], names=["other"]))
+
+
+@pytest.mark.sa_dump
+def test_row_group_dump_roundtrips_through_manifest_and_upload(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    with src.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(
+            text("INSERT INTO items VALUES (:id, :name)"),
+            [{"id": i, "name": None if i < 10 else f"item {i}"} for i in range(35)],
+        )
+    out_dir = tmp_path / "out"
+
+    manifest_path = download_parquet(
+        src, ["items"], output_dir=str(out_dir), chunk_size=10, max_file_mb=64
+    )
+
+    manifest = json.loads(Path(manifest_path).read_text(encoding="utf-8"))
+    assert manifest["files"] == ["items_part0000.parquet"]
+    assert manifest["tables"] == {"items": ["items_part0000.parquet"]}
+    assert pq.ParquetFile(out_dir / "items_part0000.parquet").num_row_groups == 4
+
+    upload_parquet(dst, input_dir=str(out_dir), manifest_path=manifest_path)
+    with dst.connect() as conn:
+        rows = conn.execute(text("SELECT id, name FROM items ORDER BY id")).all()
+    assert len(rows) == 35
+    assert rows[0] == (0, None) and rows[-1] == (34, "item 34")
+
+
+def test_table_writer_uses_the_options(tmp_path: Path):
+    writer = TableParquetWriter(
+        str(tmp_path),
+        "t",
+        max_file_bytes=1024 * 1024,
+        options=ParquetWriteOptions(compression="gzip", row_group_size=30),
+    )
+    writer.write(pa.record_batch([pa.array(range(100))], names=["id"]))
+    (name,) = writer.close()
+
+    meta = pq.ParquetFile(tmp_path / name).metadata
+    assert meta.num_row_groups == 4
+    assert meta.row_group(0).column(0).compression == "GZIP"
+
+
+def test_group_parquet_files_uses_manifest_tables(tmp_path: Path):
+    for name in ("orders_part0000.parquet", "orders_part0001.parquet"):
+        pq.write_table(pa.table({"id": [1]}), tmp_path / name)
+
+    grouped = group_parquet_files(
+        str(tmp_path),
+        only_files=["orders_part0000.parquet", "orders_part0001.parquet"],
+        table_files={"orders_part": ["orders_part0001.parquet"]},
+    )
+
+    assert grouped == {
+        "orders": ["orders_part0000.parquet"],
+        "orders_part": ["orders_part0001.parquet"],
+    }
@@ -0,0 +1,71 @@
+# Tests for the producer/consumer prefetch pipeline used by direct_transfer
+# Focuses on ordering, bounded buffering and error propagation in both directions
+# This ensures overlapping fetch/insert never loses chunks or leaks the producer
+
+import threading
+import time
+from contextlib import closing
+
+import pytest
+
+from sql_to_staging.functions.pipeline import prefetch
+
+
+def test_prefetch_preserves_order_and_items():
+    assert list(prefetch(range(50), 3)) == list(range(50))
+
+
+def test_prefetch_depth_zero_runs_inline():
+    producer_threads = set()
+
+    def gen():
+        for i in range(3):
+            producer_threads.add(threading.get_ident())
+            yield i
+
+    assert list(prefetch(gen(), 0)) == [0, 1, 2]
+    assert producer_threads == {threading.get_ident()}
+
+
+def test_prefetch_buffer_is_bounded():
+    produced = []
+
+    def gen():
+        for i in range(20):
+            produced.append(i)
+            yield i
+
+    with closing(prefetch(gen(), 2)) as it:
+        assert next(it) == 0
+        time.sleep(0.3)
+        # One item consumed, at most `depth` buffered and one pending in put()
+        assert len(produced) <= 4
+
+
+def test_prefetch_reraises_producer_errors():
+    def gen():
+        yield 1
+        raise ValueError("source broke")
+
+    it = prefetch(gen(), 2)
+    assert next(it) == 1
+    with pytest.raises(ValueError, match="source broke"):
+        next(it)
+
+
+def test_prefetch_consumer_error_stops_and_closes_source():
+    state = {"closed": False}
+
+    def gen():
+        try:
+            for i in range(1000):
+                yield i
+        finally:
+            state["closed"] = True
+
+    with pytest.raises(RuntimeError):
+        with closing(prefetch(gen(), 2)) as it:
+            for item in it:
+                if item == 3:
+                    raise RuntimeError("insert failed")
+    assert state["closed"] is True
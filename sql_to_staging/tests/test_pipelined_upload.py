@@ -0,0 +1,173 @@
+# Tests for the streaming dump-to-upload pipeline (PIPELINED_UPLOAD)
+# Focuses on the bounded queue (backpressure), error propagation and uploading tables as they are dumped
+# This ensures the destination loads while the dump continues and dumped files do not pile up on disk
+
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from sql_to_staging.functions.download_parquet import download_parquet
+from utils.parquet.upload_parquet import upload_parquet
+from utils.parquet.upload_pipeline import UploadPipeline
+
+
+def _mk_sqlite_engine(tmp_path: Path, name: str):
+    return create_engine(f"sqlite+pysqlite:///{tmp_path / f'{name}.sqlite'}")
+
+
+def test_submit_blocks_while_the_queue_is_full():
+    release = threading.Event()
+    uploaded: list[str] = []
+
+    def _upload(table: str, files: list[str]) -> None:
+        release.wait(5)
+        uploaded.append(table)
+
+    pipeline = UploadPipeline(_upload, queue_size=1)
+    pipeline.submit("a", ["a.parquet"])  # taken by the worker
+    pipeline.submit("b", ["b.parquet"])  # waits in the queue
+    blocked = threading.Thread(target=pipeline.submit, args=("c", ["c.parquet"]))
+    blocked.start()
+    blocked.join(0.2)
+    assert blocked.is_alive()
+
+    release.set()
+    blocked.join(5)
+    pipeline.close()
+    assert uploaded == ["a", "b", "c"]
+
+
+def test_failed_upload_skips_the_rest_and_is_raised():
+    uploaded: list[str] = []
+
+    def _upload(table: str, files: list[str]) -> None:
+        if table == "a":
+            raise RuntimeError("destination down")
+        uploaded.append(table)
+
+    pipeline = UploadPipeline(_upload, queue_size=4)
+    pipeline.submit("a", ["a.parquet"])
+    pipeline.submit("b", ["b.parquet"])
+    pipeline.submit("empty", [])
+    with pytest.raises(RuntimeError, match="destination down"):
+        pipeline.close()
+    assert uploaded == []
+
+
+@pytest.mark.sa_dump
+def test_tables_are_uploaded_and_deleted_as_they_are_dumped(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    with src.begin() as conn:
+        for table in ("t1", "t2", "t3"):
+            conn.execute(text(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY)"))
+            conn.execute(
+                text(f"INSERT INTO {table} VALUES (:id)"),
+                [{"id": i} for i in range(25)],
+            )
+    out_dir = tmp_path / "out"
+    dumped: list[str] = []
+
+    def _upload(table: str, files: list[str]) -> None:
+        assert all((out_dir / f).exists() for f in files)
+        upload_parquet(dst, input_dir=str(out_dir), table_files={table: files})
+
+    with UploadPipeline(_upload, queue_size=1) as pipeline:
+
+        def _on_dumped(table: str, files: list[str]) -> None:
+            dumped.append(table)
+            pipeline.submit(table, files)
+
+        manifest = download_parquet(
+            src,
+            ["t1", "t2", "t3"],
+            output_dir=str(out_dir),
+            chunk_size=10,
+            on_table_dumped=_on_dumped,
+        )
+
+    assert dumped == ["t1", "t2", "t3"]
+    assert os.listdir(out_dir) == [os.path.basename(manifest)]
+    with dst.connect() as conn:
+        for table in ("t1", "t2", "t3"):
+            assert conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar() == 25
+
+
+def _run_main(cfg_path: Path, cwd: Path, *extra: str) -> subprocess.CompletedProcess:
+    env = os.environ.copy()
+    env.update(
+        {
+            "PYTHONPATH": str(Path(__file__).resolve().parents[2]),
+            "DST_SCHEMA": "",
+            "WRITE_MODE": "",
+            "CLEANUP_PARQUET_FILES": "",
+            "PIPELINED_UPLOAD": "",
+            "RESUME": "",
+        }
+    )
+    return subprocess.run(
+        [sys.executable, "-m", "sql_to_staging.main", "--config", str(cfg_path)]
+        + list(extra),
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def test_resume_skips_tables_uploaded_before_the_failure(tmp_path: Path):
+    src_db = tmp_path / "src.db"
+    dst_db = tmp_path / "dst.db"
+    src = create_engine(f"sqlite+pysqlite:///{src_db}")
+    with src.begin() as conn:
+        for table in ("t1", "t2"):
+            conn.execute(text(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY)"))
+            conn.execute(
+                text(f"INSERT INTO {table} VALUES (:id)"),
+                [{"id": i} for i in range(25)],
+            )
+    cfg_path = tmp_path / "sql_to_staging.ini"
+    cfg_path.write_text(
+        f"""
+[database-source]
+SRC_DRIVER=sqlite
+SRC_DB={src_db.as_posix()}
+
+[database-destination]
+DST_DRIVER=sqlite
+DST_DB={dst_db.as_posix()}
+
+[settings]
+TRANSFER_MODE=SQLALCHEMY_DUMP
+SRC_TABLES=t1,t2,t3
+ASK_PASSWORD_IN_CLI=False
+WRITE_MODE=append
+PIPELINED_UPLOAD=True
+# Keep a checkpoint so the failed run can be resumed
+RESUME=True
+""".strip()
+    )
+
+    # t3 does not exist yet: the dump fails after t1 and t2 were dumped
+    first = _run_main(cfg_path, tmp_path)
+    assert first.returncode != 0
+    with src.begin() as conn:
+        conn.execute(text("CREATE TABLE t3 (id INTEGER PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO t3 VALUES (1)"))
+
+    resumed = _run_main(cfg_path, tmp_path, "--resume")
+    assert resumed.returncode == 0, resumed.stderr
+
+    # Uploaded tables (their files already cleaned up) are not appended twice
+    with create_engine(f"sqlite+pysqlite:///{dst_db}").connect() as conn:
+        counts = {
+            t: conn.execute(text(f"SELECT COUNT(*) FROM {t}")).scalar()
+            for t in ("t1", "t2", "t3")
+        }
+    assert counts == {"t1": 25, "t2": 25, "t3": 1}
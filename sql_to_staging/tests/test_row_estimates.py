@@ -0,0 +1,78 @@
+# Tests for catalog-statistics row estimates (LOG_ROW_COUNT / EXACT_ROW_COUNT)
+# Focuses on the per-dialect estimate queries, the COUNT(*) opt-in and progress/ETA formatting
+# This ensures row counts no longer require a full table scan unless explicitly asked for
+
+import logging
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from sql_to_staging.functions.direct_transfer import direct_transfer
+from sql_to_staging.functions.row_estimates import (
+    estimate_query,
+    format_progress,
+    source_row_count,
+)
+
+
+def _mk_sqlite_engine(tmp_path: Path, name: str):
+    return create_engine(f"sqlite+pysqlite:///{tmp_path / f'{name}.sqlite'}")
+
+
+def _seed(engine, n: int) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(
+            text("INSERT INTO items (id, name) VALUES (:i, :n)"),
+            [{"i": i, "n": f"n{i}"} for i in range(1, n + 1)],
+        )
+
+
+def test_estimate_query_reads_catalog_statistics():
+    oracle = estimate_query("oracle", "hr", "emp")
+    assert "ALL_TABLES" in oracle and "OWNER = UPPER('hr')" in oracle
+    assert "OWNER = USER" in estimate_query("oracle", None, "emp")
+    assert "pg_class" in estimate_query("postgresql", "public", "emp")
+    assert "current_schema()" in estimate_query("postgresql", None, "emp")
+    mssql = estimate_query("mssql", "dbo", "emp")
+    assert "dm_db_partition_stats" in mssql and "OBJECT_ID('dbo.emp')" in mssql
+    assert "TABLE_ROWS" in estimate_query("mysql", None, "emp")
+    # Quotes in names are escaped in the literals
+    assert "'o''brien'" in estimate_query("mysql", "db", "o'brien")
+    assert estimate_query("sqlite", None, "emp") is None
+
+
+def test_format_progress():
+    assert format_progress(10, None, 1.0) == ""
+    assert format_progress(250, 1_000, 5.0) == ", 25.0% of ~1,000, ETA 15s"
+    # An estimate that is too low never reports completion while running
+    assert format_progress(1_200, 1_000, 5.0) == ", 99.9% of ~1,000"
+
+
+def test_sqlite_has_no_estimate_but_exact_count(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    _seed(src, 7)
+    assert source_row_count(src, None, "items") is None
+    assert source_row_count(src, None, "items", exact=True) == 7
+
+
+@pytest.mark.sa_direct
+def test_direct_transfer_logs_progress_with_exact_count(tmp_path: Path, caplog):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    _seed(src, 20)
+
+    with caplog.at_level(logging.INFO):
+        direct_transfer(
+            src,
+            dst,
+            ["items"],
+            chunk_size=10,
+            log_row_count=True,
+            exact_row_count=True,
+            pipeline_depth=0,
+        )
+
+    assert "(source rows: 20)" in caplog.text
+    assert "50.0% of ~20" in caplog.text
@@ -0,0 +1,81 @@
+# Tests for the persistent source-schema cache (SCHEMA_CACHE / --refresh-schema-cache)
+# Focuses on reuse across runs, invalidation by the catalog fingerprint and forced refreshes
+# This ensures cached table definitions never hide a changed source table
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import MetaData, create_engine, text
+
+from sql_to_staging.functions.direct_transfer import direct_transfer
+from sql_to_staging.functions.schema_cache import SchemaCache, fingerprint_query
+
+
+def _mk_sqlite_engine(tmp_path: Path, name: str):
+    return create_engine(f"sqlite+pysqlite:///{tmp_path / f'{name}.sqlite'}")
+
+
+def _seed(engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("INSERT INTO items (id, name) VALUES (1, 'a'), (2, 'b')"))
+
+
+def test_cached_table_reused_until_ddl_changes(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    _seed(src)
+    path = str(tmp_path / "cache" / "schema.pkl")
+
+    first = SchemaCache(path)
+    assert [c.name for c in first.table(src, "items").columns] == ["id", "name"]
+    assert (first.hits, first.misses) == (0, 1)
+
+    # A new run (new process) reads the definition from the file
+    second = SchemaCache(path)
+    meta = MetaData()
+    table = second.table(src, "items", metadata=meta)
+    assert (second.hits, second.misses) == (1, 0)
+    assert table.metadata is meta and [c.name for c in table.primary_key] == ["id"]
+
+    with src.begin() as conn:
+        conn.execute(text("ALTER TABLE items ADD COLUMN price NUMERIC(10, 2)"))
+    third = SchemaCache(path)
+    assert "price" in third.table(src, "items").columns
+    assert (third.hits, third.misses) == (0, 1)
+
+
+def test_refresh_reflects_once_per_run(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    _seed(src)
+    path = str(tmp_path / "schema.pkl")
+    SchemaCache(path).table(src, "items")
+
+    refreshed = SchemaCache(path, refresh=True)
+    refreshed.table(src, "items")
+    refreshed.table(src, "items")
+    assert (refreshed.hits, refreshed.misses) == (1, 1)
+
+
+def test_fingerprint_queries_per_dialect():
+    assert "LAST_DDL_TIME" in fingerprint_query("oracle", "hr", "emp")
+    assert "pg_attribute" in fingerprint_query("postgresql", None, "emp")
+    assert "modify_date" in fingerprint_query("mssql", "dbo", "emp")
+    assert "information_schema.COLUMNS" in fingerprint_query("mysql", None, "emp")
+    assert "sqlite_master" in fingerprint_query("sqlite", None, "emp")
+    assert fingerprint_query("duckdb", None, "emp") is None
+
+
+@pytest.mark.sa_direct
+def test_direct_transfer_uses_schema_cache(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    _seed(src)
+    path = str(tmp_path / "schema.pkl")
+
+    direct_transfer(src, dst, ["items"], schema_cache=SchemaCache(path))
+    cache = SchemaCache(path)
+    direct_transfer(src, dst, ["items"], schema_cache=cache)
+
+    assert cache.hits == 1
+    with dst.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 2
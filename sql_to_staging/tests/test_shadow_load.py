@@ -0,0 +1,71 @@
+# Tests for shadow-table loads in replace mode (SHADOW_LOAD)
+# Focuses on direct transfer and Parquet upload loading into <table>__load_<runid> before the swap
+# This ensures a failed load leaves the previous staging table intact and stale shadows are cleaned up
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+import sql_to_staging.functions.direct_transfer as dt
+from sql_to_staging.functions.direct_transfer import direct_transfer
+from sql_to_staging.functions.download_parquet import download_parquet
+from utils.parquet.upload_parquet import upload_parquet
+
+
+def _mk_sqlite_engine(tmp_path: Path, name: str):
+    return create_engine(f"sqlite+pysqlite:///{tmp_path / f'{name}.sqlite'}")
+
+
+def _seed(engine, n: int) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS items"))
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(
+            text("INSERT INTO items (id, name) VALUES (:i, :n)"),
+            [{"i": i, "n": f"n{i}"} for i in range(1, n + 1)],
+        )
+
+
+def _count(engine) -> int:
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT COUNT(*) FROM items")).scalar_one()
+
+
+@pytest.mark.sa_direct
+def test_direct_shadow_load_keeps_old_table_until_swap(tmp_path: Path, monkeypatch):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    _seed(src, 3)
+    direct_transfer(src, dst, ["items"], shadow_load=True)
+    assert inspect(dst).get_table_names() == ["items"] and _count(dst) == 3
+
+    _seed(src, 5)
+
+    def _fail(*args, **kwargs):
+        raise RuntimeError("connection lost")
+
+    with monkeypatch.context() as m:
+        m.setattr(dt, "_stream_copy", _fail)
+        with pytest.raises(RuntimeError):
+            direct_transfer(src, dst, ["items"], shadow_load=True)
+    # The failed load only touched its shadow table
+    assert _count(dst) == 3
+    assert any(n.startswith("items__load_") for n in inspect(dst).get_table_names())
+
+    direct_transfer(src, dst, ["items"], shadow_load=True)
+    assert inspect(dst).get_table_names() == ["items"] and _count(dst) == 5
+
+
+@pytest.mark.sa_dump
+def test_upload_shadow_load_swaps_table(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    _seed(dst, 2)
+    _seed(src, 4)
+    out = tmp_path / "out"
+
+    manifest = download_parquet(src, ["items"], output_dir=str(out), chunk_size=3)
+    upload_parquet(dst, input_dir=str(out), manifest_path=manifest, shadow_load=True)
+
+    assert inspect(dst).get_table_names() == ["items"] and _count(dst) == 4
@@ -0,0 +1,140 @@
+# Tests for the disk budget of the parquet spill directory (SPILL_MAX_GB)
+# Focuses on backpressure until finished tables are uploaded, not waiting on the table being dumped and the peak usage
+# This ensures a dump cannot fill the disk of the ETL machine with the whole source dataset
+
+import logging
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from sql_to_staging.functions.download_parquet import download_parquet
+from utils.parquet.spill import SpillManager
+from utils.parquet.upload_parquet import upload_parquet
+from utils.parquet.upload_pipeline import UploadPipeline
+
+
+def _mk_sqlite_engine(tmp_path: Path, name: str):
+    return create_engine(f"sqlite+pysqlite:///{tmp_path / f'{name}.sqlite'}")
+
+
+def _file(path: Path, size: int) -> str:
+    path.write_bytes(b"x" * size)
+    return str(path)
+
+
+def test_written_blocks_until_finished_tables_are_released(tmp_path: Path):
+    spill = SpillManager(str(tmp_path), max_bytes=100)
+    first = _file(tmp_path / "a_part0000.parquet", 80)
+    spill.written("a", first)
+    spill.finished("a")
+
+    second = _file(tmp_path / "b_part0000.parquet", 40)
+    blocked = threading.Thread(target=spill.written, args=("b", second))
+    blocked.start()
+    blocked.join(0.2)
+    assert blocked.is_alive()
+
+    os.remove(first)  # the upload deletes the files of "a"
+    spill.released("a")
+    blocked.join(5)
+    assert not blocked.is_alive()
+    assert spill.used_bytes == 40
+    assert spill.peak_bytes == 120
+
+
+def test_table_exceeding_the_budget_alone_continues_with_a_warning(
+    tmp_path: Path, caplog
+):
+    spill = SpillManager(str(tmp_path), max_bytes=100)
+    with caplog.at_level(logging.WARNING):
+        spill.written("big", _file(tmp_path / "big_part0000.parquet", 150))
+        spill.written("big", _file(tmp_path / "big_part0001.parquet", 150))
+
+    assert spill.peak_bytes == 300
+    warnings = [r for r in caplog.records if "SPILL_MAX_GB" in r.getMessage()]
+    assert len(warnings) == 1
+
+
+@pytest.mark.sa_dump
+def test_dump_with_budget_keeps_the_spill_directory_small(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    tables = [f"t{i}" for i in range(4)]
+    with src.begin() as conn:
+        for table in tables:
+            conn.execute(text(f"CREATE TABLE {table} (id INTEGER, name TEXT)"))
+            conn.execute(
+                text(f"INSERT INTO {table} VALUES (:id, :name)"),
+                [{"id": i, "name": f"row {i} of {table}"} for i in range(200)],
+            )
+    out_dir = tmp_path / "out"
+    sizes: dict[str, int] = {}
+
+    def _upload(table: str, files: list[str]) -> None:
+        sizes[table] = sum(os.path.getsize(out_dir / f) for f in files)
+        upload_parquet(dst, input_dir=str(out_dir), table_files={table: files})
+
+    spill = SpillManager(str(out_dir), max_bytes=1)
+    with UploadPipeline(_upload, queue_size=4, on_done=spill.released) as pipeline:
+        download_parquet(
+            src,
+            tables,
+            output_dir=str(out_dir),
+            chunk_size=50,
+            on_table_dumped=pipeline.submit,
+            spill=spill,
+        )
+
+    # With a budget of one byte, at most one finished and one running table coexist
+    assert 0 < spill.peak_bytes <= 2 * max(sizes.values())
+    assert spill.peak_bytes < sum(sizes.values())
+    assert spill.used_bytes == 0
+    assert spill.report()["peak_bytes"] == spill.peak_bytes
+    with dst.connect() as conn:
+        for table in tables:
+            assert conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar() == 200
+
+
+def test_main_rejects_a_budget_without_cleanup(tmp_path: Path):
+    src_db = tmp_path / "src.db"
+    dst_db = tmp_path / "dst.db"
+    with create_engine(f"sqlite+pysqlite:///{src_db}").begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+    cfg_path = tmp_path / "sql_to_staging.ini"
+    cfg_path.write_text(
+        f"""
+[database-source]
+SRC_DRIVER=sqlite
+SRC_DB={src_db.as_posix()}
+
+[database-destination]
+DST_DRIVER=sqlite
+DST_DB={dst_db.as_posix()}
+
+[settings]
+TRANSFER_MODE=SQLALCHEMY_DUMP
+SRC_TABLES=items
+ASK_PASSWORD_IN_CLI=False
+SPILL_MAX_GB=1
+CLEANUP_PARQUET_FILES=False
+""".strip()
+    )
+    env = os.environ.copy()
+    env.update({"DST_SCHEMA": "", "SPILL_MAX_GB": "", "CLEANUP_PARQUET_FILES": ""})
+
+    proc = subprocess.run(
+        [sys.executable, "-m", "sql_to_staging.main", "--config", str(cfg_path)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert proc.returncode != 0
+    assert "SPILL_MAX_GB requires CLEANUP_PARQUET_FILES" in proc.stderr
+    assert not dst_db.exists()
@@ -0,0 +1,95 @@
+# Tests for per-table throughput metrics and the JSON run report (METRICS_REPORT)
+# Focuses on the fetch/transform/insert phases of direct transfers and fetch/write, read/write for parquet
+# This ensures slow tables can be attributed to the source, Python or the destination
+
+import json
+import logging
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from sql_to_staging.functions.direct_transfer import direct_transfer
+from sql_to_staging.functions.download_parquet import download_parquet
+from utils.logging.metrics import TransferMetrics, timed_iter
+from utils.parquet.upload_parquet import upload_parquet
+
+
+def _mk_sqlite_engine(tmp_path: Path, name: str):
+    return create_engine(f"sqlite+pysqlite:///{tmp_path / f'{name}.sqlite'}")
+
+
+def _seed(engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(
+            text("INSERT INTO items VALUES (:id, :name)"),
+            [{"id": i, "name": f"item {i}"} for i in range(25)],
+        )
+
+
+def test_timed_iter_times_each_item_and_closes_the_source():
+    closed = []
+
+    def _gen():
+        try:
+            yield from (1, 2, 3)
+        finally:
+            closed.append(True)
+
+    tm = TransferMetrics().table("stage", "t")
+    it = timed_iter(_gen(), tm, "fetch")
+    assert next(it) == 1
+    it.close()
+    assert closed == [True]
+    assert tm.phases["fetch"] >= 0
+
+
+@pytest.mark.sa_direct
+def test_direct_transfer_reports_phases(tmp_path: Path, caplog):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    _seed(src)
+
+    metrics = TransferMetrics()
+    with caplog.at_level(logging.INFO):
+        direct_transfer(src, dst, ["items"], chunk_size=10, metrics=metrics)
+
+    (tm,) = metrics.tables
+    assert (tm.stage, tm.table, tm.rows, tm.chunks) == (
+        "direct_transfer",
+        "items",
+        25,
+        3,
+    )
+    assert set(tm.phases) == {"fetch", "transform", "insert"}
+    assert tm.bytes > 0
+    assert any("rows/s" in r.getMessage() for r in caplog.records)
+
+    report_path = tmp_path / "reports" / "metrics.json"
+    metrics.write_report(str(report_path))
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    (entry,) = report["tables"]
+    assert entry["rows"] == 25
+    assert set(entry["phases"]) == {"fetch", "transform", "insert"}
+    assert entry["rows_per_second"] > 0
+
+
+@pytest.mark.sa_dump
+def test_parquet_dump_and_upload_report_phases(tmp_path: Path):
+    src = _mk_sqlite_engine(tmp_path, "src")
+    dst = _mk_sqlite_engine(tmp_path, "dst")
+    _seed(src)
+    out_dir = tmp_path / "parquet"
+
+    metrics = TransferMetrics()
+    manifest = download_parquet(
+        src, ["items"], output_dir=str(out_dir), chunk_size=10, metrics=metrics
+    )
+    upload_parquet(dst, input_dir=str(out_dir), manifest_path=manifest, metrics=metrics)
+
+    by_stage = {m.stage: m for m in metrics.tables}
+    assert set(by_stage) == {"download_parquet", "upload_parquet"}
+    assert set(by_stage["download_parquet"].phases) == {"fetch", "write"}
+    assert set(by_stage["upload_parquet"].phases) == {"read", "write"}
+    assert by_stage["download_parquet"].rows == by_stage["upload_parquet"].rows == 25
@@ -1,11 +1,32 @@
 from __future__ import annotations
 
-from typing import Iterable, List
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterable, Iterator, List
 
 from sqlalchemy import MetaData, inspect
 from sqlalchemy.sql.schema import Table
 from utils.config.get_config_value import get_config_value
 
+# Object whose reflect_tables/get_table/col replace the helpers below while set
+# (see use_helpers); None uses the real implementations
+_helpers: ContextVar[Any] = ContextVar("case_helpers", default=None)
+
+
+@contextmanager
+def use_helpers(helpers: Any) -> Iterator[None]:
+    """
+    Route `reflect_tables`, `get_table` and `col` to the methods of `helpers`
+    within this context (e.g. the recorder of staging_requirements); None
+    restores the real helpers. Modules that imported the helpers by name are
+    covered as well, as the helpers themselves dispatch.
+    """
+    token = _helpers.set(helpers)
+    try:
+        yield
+    finally:
+        _helpers.reset(token)
+
 
 def _unique_preserve_order(items: Iterable[str]) -> List[str]:
     seen = set()
@@ -118,6 +139,9 @@ def reflect_tables(engine, schema: str | None, base_names: Iterable[str]) -> Met
 
     Returns a populated MetaData instance.
     """
+    helpers = _helpers.get()
+    if helpers is not None:
+        return helpers.reflect_tables(engine, schema, base_names)
     metadata = MetaData()
     mode = _get_source_name_matching_mode()
 
@@ -179,6 +203,9 @@ def get_table(
     Return a Table from metadata for a base name, trying both exact and UPPER variants,
     then falling back to case-insensitive match within the given schema.
     """
+    helpers = _helpers.get()
+    if helpers is not None:
+        return helpers.get_table(metadata, schema, base_name, required_cols)
     # Try exact and UPPER variants
     candidates: List[Table] = []
     mode = _get_source_name_matching_mode()
@@ -228,6 +255,9 @@ def col(table: Table, name: str):
     Fetch a column from a Table with case-insensitive matching on the column key.
     Prefers an exact case-insensitive match; falls back to dict-style access if present.
     """
+    helpers = _helpers.get()
+    if helpers is not None:
+        return helpers.col(table, name)
     mode = _get_source_name_matching_mode()
     # Note: STAGING_COLUMN_NAME_CASE influences candidate ordering via
     # _apply_column_case_preference; we don't need the raw value here.
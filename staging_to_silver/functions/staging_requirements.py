@@ -0,0 +1,129 @@
+"""
+Derive the staging tables and columns the enabled mappings consume.
+
+The query builders declare what they read through the case helpers:
+`reflect_tables(engine, schema, base_tables)`, `get_table(..., required_cols=...)`
+and `col(table, name)`. Running every builder with those helpers routed to
+recording stubs (`case_helpers.use_helpers`) yields the exact set of staging
+tables and columns, without a connection to the staging database:
+
+- `reflect_tables` returns an empty recording MetaData
+- `get_table` returns a Table with only the required columns (untyped)
+- `col` adds and records a column the table does not have yet
+
+Columns used through `table.c.<name>` must therefore be listed in the
+`required_cols` of `get_table`, which the builders in this repository do.
+
+The result is written as sql_to_staging settings: `SRC_TABLES` plus one
+`SRC_COLUMNS_<table>` per table (see `format_staging_settings`).
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Callable, Dict, Iterable, List, Mapping
+
+from sqlalchemy import Column, MetaData, Table
+from sqlalchemy.types import NullType
+
+from staging_to_silver.functions import case_helpers
+
+log = logging.getLogger("staging_to_silver")
+
+
+class _Recorder:
+    """Collects base table names and column names in first-use order (lowercase)."""
+
+    def __init__(self) -> None:
+        self.tables: Dict[str, Dict[str, None]] = {}
+        # Recording tables -> base name they were created for
+        self._origin: Dict[int, str] = {}
+
+    def _columns(self, base_name: str) -> Dict[str, None]:
+        return self.tables.setdefault(base_name.lower(), {})
+
+    def reflect_tables(
+        self, engine, schema: str | None, base_names: Iterable[str]
+    ) -> MetaData:
+        for name in base_names:
+            self._columns(name)
+        return MetaData()
+
+    def get_table(
+        self,
+        metadata: MetaData,
+        schema: str | None,
+        base_name: str,
+        required_cols: Iterable[str] | None = None,
+    ) -> Table:
+        key = f"{schema + '.' if schema else ''}{base_name}"
+        table = metadata.tables.get(key)
+        if table is None:
+            table = Table(base_name, metadata, schema=schema)
+            self._origin[id(table)] = base_name.lower()
+        columns = self._columns(base_name)
+        for name in required_cols or ():
+            self._add(table, name)
+            columns.setdefault(name.lower())
+        return table
+
+    def col(self, table, name: str):
+        base_name = self._origin.get(id(table))
+        if base_name is None:
+            # Not a recording table (alias, subquery, CTE): plain lookup
+            with case_helpers.use_helpers(None):
+                return case_helpers.col(table, name)
+        self._columns(base_name).setdefault(name.lower())
+        return self._add(table, name)
+
+    @staticmethod
+    def _add(table: Table, name: str):
+        for c in table.c:
+            if c.name.lower() == name.lower():
+                return c
+        column = Column(name, NullType())
+        table.append_column(column)
+        return column
+
+
+def collect_staging_requirements(
+    queries: Mapping[str, Callable], engine, source_schema: str | None = None
+) -> Dict[str, List[str]]:
+    """
+    Run the query builders against recording stubs and return
+    {staging table: [columns]} (lowercase, in order of first use).
+
+    The engine is only used for its dialect (dialect-specific helpers); no
+    statements are executed. Builders that fail are logged; what they recorded
+    before failing is kept.
+    """
+    recorder = _Recorder()
+    with case_helpers.use_helpers(recorder):
+        for name, query_fn in queries.items():
+            try:
+                query_fn(engine, source_schema=source_schema)
+            except Exception as e:
+                log.warning(
+                    "Could not derive staging requirements of mapping %s "
+                    "(tables/columns recorded so far are kept): %s",
+                    name,
+                    e,
+                )
+    return {table: list(columns) for table, columns in recorder.tables.items()}
+
+
+def format_staging_settings(requirements: Mapping[str, List[str]]) -> str:
+    """
+    sql_to_staging settings for the requirements: `SRC_TABLES` and a
+    `SRC_COLUMNS_<table>` line per table (tables without recorded columns are
+    extracted completely).
+    """
+    tables = sorted(requirements)
+    lines = [f"SRC_TABLES = {', '.join(tables)}"]
+    for table in tables:
+        if requirements[table]:
+            lines.append(f"SRC_COLUMNS_{table} = {', '.join(requirements[table])}")
+    return "\n".join(lines) + "\n"
+
+
+__all__ = ["collect_staging_requirements", "format_staging_settings"]
@@ -16,6 +16,10 @@ from utils.logging.setup_logging import setup_logging
 from staging_to_silver.functions.init_sql import run_init_sql
 from staging_to_silver.functions.queries_setup import prepare_queries
 from staging_to_silver.functions.schema_qualifier import qualify_schema
+from staging_to_silver.functions.staging_requirements import (
+    collect_staging_requirements,
+    format_staging_settings,
+)
 from staging_to_silver.functions.guards import (
     should_defer_constraints,
     validate_upsert_supported,
@@ -32,7 +36,16 @@ def main() -> None:
             "Loaded environment variables from %s", env_path
         )
 
-    args, cfg = load_single_ini_config()
+    args, cfg = load_single_ini_config(
+        prog_desc="Run staging to silver mappings",
+        flags=[
+            (
+                "--print-staging-requirements",
+                "Print the SRC_TABLES/SRC_COLUMNS settings for sql_to_staging "
+                "that the enabled mappings need, then exit",
+            ),
+        ],
+    )
 
     # Configure logging and keep console output
     setup_logging(app_name="staging_to_silver", cfg_parsers=[cfg])
@@ -43,6 +56,16 @@ def main() -> None:
 
     # Note: staging location comes from [database-destination] → DST_DB/DST_SCHEMA.
 
+    # ─── Optional: only report which staging tables/columns the mappings read ─────
+    if getattr(args, "print_staging_requirements", False):
+        requirements = collect_staging_requirements(prepare_queries(cfg), engine)
+        log.info(
+            "Enabled mappings read %d staging table(s); settings for sql_to_staging:",
+            len(requirements),
+        )
+        print(format_staging_settings(requirements), end="")
+        return
+
     # ─── Read staging/target schema from config ────────────────────────────────────
 
     # Staging lives in the connected destination DB (unless overridden per‑backend)
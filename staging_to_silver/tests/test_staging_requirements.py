@@ -0,0 +1,52 @@
+# Tests for deriving the staging tables/columns consumed by the mappings
+# Focuses on running query builders against the recording case-helper stubs
+# This ensures sql_to_staging can be configured with exactly the data silver needs
+
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, select
+
+from staging_to_silver.functions.case_helpers import col, get_table, reflect_tables
+from staging_to_silver.functions.query_loader import load_queries
+from staging_to_silver.functions.staging_requirements import (
+    collect_staging_requirements,
+    format_staging_settings,
+)
+
+
+def build_custom(engine, source_schema=None):
+    metadata = reflect_tables(engine, source_schema, ["Orders", "customers"])
+    orders = get_table(metadata, source_schema, "Orders", required_cols=["ID"])
+    customers = get_table(
+        metadata, source_schema, "customers", required_cols=["id", "name"]
+    )
+    buyer = customers.alias("buyer")
+    return select(col(orders, "id"), col(orders, "total"), buyer.c.name).select_from(
+        orders.join(buyer, col(orders, "customer_id") == buyer.c.id)
+    )
+
+
+def test_requirements_of_builtin_mapping():
+    queries = load_queries(
+        package="staging_to_silver.queries.cssd",
+        table_name_case="upper",
+        column_name_case="upper",
+    )
+    engine = create_engine("sqlite://")
+    reqs = collect_staging_requirements({"BESCHIKKING": queries["BESCHIKKING"]}, engine)
+    assert reqs == {"wvbesl": ["besluitnr", "clientnr"]}
+    # The real helpers are used again afterwards
+    table = Table("t", MetaData(), Column("ID", Integer))
+    assert col(table, "id") is table.c.ID
+
+
+def test_requirements_record_col_calls_and_format():
+    reqs = collect_staging_requirements({"X": build_custom}, create_engine("sqlite://"))
+    # Columns of an alias (buyer.c.*) come from required_cols
+    assert reqs == {
+        "orders": ["id", "total", "customer_id"],
+        "customers": ["id", "name"],
+    }
+    assert format_staging_settings({**reqs, "lookup": []}) == (
+        "SRC_TABLES = customers, lookup, orders\n"
+        "SRC_COLUMNS_customers = id, name\n"
+        "SRC_COLUMNS_orders = id, total, customer_id\n"
+    )
@@ -0,0 +1,108 @@
+"""
+Fake DBAPI connection for unit tests of the native bulk loaders.
+
+The loaders in utils.bulk_load only touch ``conn.dialect`` and a raw cursor
+from ``conn.connection.driver_connection.cursor()``. `FakeConnection` offers
+just that: every cursor call is recorded in ``conn.calls`` as a `Call`, so a
+test can assert the driver-specific statements and binds without a database.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence
+
+from sqlalchemy import Column, MetaData, Table
+
+
+@dataclass
+class Call:
+    """One recorded cursor call."""
+
+    method: str
+    args: tuple
+    kwargs: dict = field(default_factory=dict)
+
+
+class FakeCursor:
+    """DBAPI cursor that records its calls on the owning `FakeConnection`."""
+
+    def __init__(self, conn: "FakeConnection"):
+        self._conn = conn
+        self.fast_executemany = False  # pyodbc
+        self.rowcount = -1
+        self.closed = False
+
+    def _record(self, method: str, *args: Any, **kwargs: Any) -> None:
+        self._conn.calls.append(Call(method, args, kwargs))
+
+    def copy_expert(self, sql: str, buf) -> None:  # psycopg2
+        # Read while the buffer is still open; recorded as decoded text
+        data = buf.read()
+        self._record(
+            "copy_expert", sql, data.decode() if isinstance(data, bytes) else data
+        )
+
+    def setinputsizes(self, *sizes: Any) -> None:
+        self._record("setinputsizes", *sizes)
+
+    def executemany(self, sql: str, params: Sequence, **kwargs: Any) -> None:
+        self._record("executemany", sql, params, **kwargs)
+        self.rowcount = len(params)
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        self._record("execute", sql, params)
+        if self._conn.on_execute is not None:
+            self._conn.on_execute(self, sql, params)
+
+    def fetchall(self) -> list:
+        return []
+
+    def getbatcherrors(self) -> list:  # python-oracledb
+        return list(self._conn.batch_errors)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeConnection:
+    """
+    Just enough of a SQLAlchemy Connection for the bulk loaders.
+
+    - `dialect`: the SQLAlchemy dialect the loader renders SQL for.
+    - `batch_errors`: returned by ``cursor.getbatcherrors()``.
+    - `on_execute(cursor, sql, params)`: runs after each ``cursor.execute``,
+      e.g. to inspect a LOAD DATA file before the loader deletes it.
+    """
+
+    def __init__(
+        self,
+        dialect,
+        *,
+        batch_errors: Sequence = (),
+        on_execute: Callable[[FakeCursor, str, Any], None] | None = None,
+    ):
+        self.dialect = dialect
+        self.batch_errors = batch_errors
+        self.on_execute = on_execute
+        self.calls: list[Call] = []
+        self.cursors: list[FakeCursor] = []
+        self.connection = self  # raw DBAPI connection of the SQLAlchemy Connection
+        self.driver_connection = self
+
+    def cursor(self) -> FakeCursor:
+        cur = FakeCursor(self)
+        self.cursors.append(cur)
+        return cur
+
+    def called(self, method: str) -> list[Call]:
+        """Recorded calls of one cursor method, in order."""
+        return [c for c in self.calls if c.method == method]
+
+
+def items_table(*columns: Column, schema: str | None = "stg") -> Table:
+    """Destination table ``items`` with the given columns."""
+    return Table("items", MetaData(), *columns, schema=schema)
+
+
+__all__ = ["Call", "FakeConnection", "FakeCursor", "items_table"]
@@ -0,0 +1,11 @@
+"""Dialect-specific bulk loaders for staging tables.
+
+Both `sql_to_staging.functions.direct_transfer` (row batches) and
+`utils.parquet.upload_parquet` (Arrow data) use `get_bulk_loader` to pick a
+faster native load path for the destination; when it returns None they keep
+using plain SQLAlchemy/polars inserts.
+"""
+
+from utils.bulk_load.base import BulkLoader, get_bulk_loader
+
+__all__ = ["BulkLoader", "get_bulk_loader"]
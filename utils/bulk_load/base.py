@@ -0,0 +1,114 @@
+"""Bulk loader interface and registry."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Mapping, Sequence
+
+import pyarrow as pa
+from sqlalchemy import Table
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+
+logger = logging.getLogger("utils.bulk_load")
+
+
+class BulkLoader:
+    """
+    Base class for native bulk load paths.
+
+    Loaders write into an existing destination table inside the caller's
+    transaction (`conn` comes from `engine.begin()`), so retry and write-mode
+    handling stay with the caller. Column values are matched by name against
+    `table.columns`; names are expected to be normalized (lowercased) already.
+    """
+
+    name = "base"
+
+    def load_rows(
+        self, conn: Connection, table: Table, rows: Sequence[Mapping[str, Any]]
+    ) -> int:
+        """Load a batch of dict rows; return the number of rows written."""
+        raise NotImplementedError
+
+    def load_arrow(
+        self, conn: Connection, table: Table, data: pa.Table | pa.RecordBatch
+    ) -> int:
+        """Load Arrow data; return the number of rows written."""
+        raise NotImplementedError
+
+
+def column_names(table: Table, available: Sequence[str] | None = None) -> list[str]:
+    """Destination column names in table order, optionally limited to `available`."""
+    names = [c.name for c in table.columns]
+    if available is None:
+        return names
+    present = set(available)
+    return [n for n in names if n in present]
+
+
+def raw_cursor(conn: Connection):
+    """Return a DBAPI cursor on the connection's current transaction."""
+    return conn.connection.driver_connection.cursor()  # type: ignore[union-attr]
+
+
+def wrap_dbapi_error(conn: Connection, statement: str, err: Exception) -> Exception:
+    """
+    Wrap a raw driver exception as SQLAlchemy DBAPIError so callers can apply the
+    same transient-error classification as for regular SQLAlchemy inserts.
+    """
+    dbapi = getattr(conn.dialect, "loaded_dbapi", None) or getattr(
+        conn.dialect, "dbapi", None
+    )
+    base_err = getattr(dbapi, "Error", None)
+    if base_err is not None and isinstance(err, base_err):
+        return DBAPIError.instance(statement, None, err, base_err)
+    return err
+
+
+LoaderFactory = Callable[[Engine, Mapping[str, Any]], "BulkLoader | None"]
+
+# dialect name -> factory(engine, options) returning a loader or None when unsupported
+_REGISTRY: dict[str, LoaderFactory] = {}
+
+
+def register_bulk_loader(dialect: str, factory: LoaderFactory) -> None:
+    _REGISTRY[dialect] = factory
+
+
+def get_bulk_loader(
+    engine: Engine, options: Mapping[str, Any] | None = None
+) -> BulkLoader | None:
+    """
+    Return the bulk loader for the engine's dialect/driver, or None when no
+    native path is available (callers then fall back to regular inserts).
+
+    `options` are passed to the dialect's factory (e.g. {"tablock": True} for
+    SQL Server); unknown keys are ignored. Callers add "write_mode" so loaders
+    can restrict table-level optimizations to freshly emptied tables.
+    """
+    # Import loader modules lazily so their registrations run on first use
+    from utils.bulk_load import mssql, mysql, oracle, postgres  # noqa: F401
+
+    dname = engine.dialect.name.lower()
+    factory = _REGISTRY.get(dname)
+    if factory is None:
+        return None
+    try:
+        loader = factory(engine, options or {})
+    except Exception as e:
+        logger.warning("Bulk loader for %s unavailable: %s", dname, e)
+        return None
+    if loader is not None:
+        logger.info("Using %s bulk loader for %s destination", loader.name, dname)
+    return loader
+
+
+__all__ = [
+    "BulkLoader",
+    "column_names",
+    "get_bulk_loader",
+    "raw_cursor",
+    "register_bulk_loader",
+    "wrap_dbapi_error",
+]
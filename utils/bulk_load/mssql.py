@@ -0,0 +1,162 @@
+"""SQL Server bulk loader using pyodbc fast_executemany with typed input sizes."""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, Sequence
+
+import pyarrow as pa
+from sqlalchemy import Table
+from sqlalchemy import types as satypes
+from sqlalchemy.engine import Connection, Engine
+
+from utils.bulk_load.base import (
+    BulkLoader,
+    column_names,
+    raw_cursor,
+    register_bulk_loader,
+    wrap_dbapi_error,
+)
+from utils.database.identifiers import quote_fqn, quote_ident
+
+# ODBC SQL type codes (sql.h/sqlext.h); identical to the pyodbc.SQL_* constants,
+# kept here so input sizes can be derived without importing the driver
+SQL_BIGINT = -5
+SQL_BIT = -7
+SQL_DECIMAL = 3
+SQL_DOUBLE = 8
+SQL_INTEGER = 4
+SQL_SMALLINT = 5
+SQL_TYPE_DATE = 91
+SQL_TYPE_TIMESTAMP = 93
+SQL_VARBINARY = -3
+SQL_WVARCHAR = -9
+
+InputSize = tuple[int, int, int]
+
+
+def _datetime_digits(t: satypes.TypeEngine) -> int:
+    precision = getattr(t, "precision", None)
+    if precision is not None:
+        return int(precision)
+    # Plain DATETIME keeps milliseconds; DATETIME2 defaults to 7 digits
+    return 7 if type(t).__name__.upper() == "DATETIME2" else 3
+
+
+def _bounded_length(t: satypes.TypeEngine, limit: int) -> int:
+    # 0 binds as (MAX); reflected lengths may also be the string "max"
+    length = getattr(t, "length", None)
+    if isinstance(length, int) and 0 < length <= limit:
+        return length
+    return 0
+
+
+def input_size_for(t: satypes.TypeEngine) -> InputSize | None:
+    """
+    Map a destination column type to a pyodbc `setinputsizes` entry
+    (sql_type, column_size, decimal_digits). Returns None to let the driver
+    infer the binding for types without a stable mapping.
+    """
+    if isinstance(t, satypes.Boolean):
+        return (SQL_BIT, 0, 0)
+    if isinstance(t, satypes.BigInteger):
+        return (SQL_BIGINT, 0, 0)
+    if isinstance(t, satypes.SmallInteger):
+        return (SQL_SMALLINT, 0, 0)
+    if isinstance(t, satypes.Integer):
+        return (SQL_INTEGER, 0, 0)
+    if isinstance(t, satypes.Float):
+        return (SQL_DOUBLE, 0, 0)
+    if isinstance(t, satypes.Numeric):
+        precision = getattr(t, "precision", None) or 38
+        scale = getattr(t, "scale", None) or 0
+        return (SQL_DECIMAL, int(precision), int(scale))
+    if isinstance(t, satypes.DateTime):
+        if getattr(t, "timezone", False) or type(t).__name__ == "DATETIMEOFFSET":
+            # Offset-aware values need the driver's own binding
+            return None
+        digits = _datetime_digits(t)
+        # Column size of a timestamp literal: 'yyyy-mm-dd hh:mm:ss' + '.' + digits
+        return (SQL_TYPE_TIMESTAMP, 20 + digits if digits else 19, digits)
+    if isinstance(t, satypes.Date):
+        return (SQL_TYPE_DATE, 10, 0)
+    if isinstance(t, satypes.String):
+        return (SQL_WVARCHAR, _bounded_length(t, 4000), 0)
+    if isinstance(t, (satypes.LargeBinary, satypes.BINARY, satypes.VARBINARY)):
+        return (SQL_VARBINARY, _bounded_length(t, 8000), 0)
+    return None
+
+
+class MssqlFastExecutemanyLoader(BulkLoader):
+    """
+    Load batches with a parameterized INSERT executed through a raw pyodbc
+    cursor with `fast_executemany=True`, so a batch is sent as parameter
+    arrays instead of one round trip per row. Input sizes are derived from the
+    destination column types.
+
+    With `tablock` the INSERT carries `WITH (TABLOCK)`, which allows minimally
+    logged inserts into heap staging tables (SIMPLE/BULK_LOGGED recovery). It
+    takes an exclusive table lock, so concurrent writers to the same table are
+    serialized.
+    """
+
+    name = "mssql-fast-executemany"
+
+    def __init__(self, tablock: bool = False):
+        self.tablock = tablock
+
+    def _insert_sql(self, conn: Connection, table: Table, columns: Sequence[str]):
+        target = quote_fqn(conn, [table.schema, table.name])
+        hint = " WITH (TABLOCK)" if self.tablock else ""
+        col_list = ", ".join(quote_ident(conn, c) for c in columns)
+        params = ", ".join("?" for _ in columns)
+        return f"INSERT INTO {target}{hint} ({col_list}) VALUES ({params})"
+
+    def _executemany(
+        self,
+        conn: Connection,
+        table: Table,
+        columns: Sequence[str],
+        params: list[tuple],
+    ) -> int:
+        if not params:
+            return 0
+        sql = self._insert_sql(conn, table, columns)
+        sizes = [input_size_for(table.c[c].type) for c in columns]
+        cur = raw_cursor(conn)
+        try:
+            cur.fast_executemany = True
+            cur.setinputsizes(sizes)
+            cur.executemany(sql, params)
+        except Exception as e:
+            raise wrap_dbapi_error(conn, sql, e) from e
+        finally:
+            cur.close()
+        return len(params)
+
+    def load_rows(
+        self, conn: Connection, table: Table, rows: Sequence[Mapping[str, Any]]
+    ) -> int:
+        columns = column_names(table)
+        params = [tuple(row.get(c) for c in columns) for row in rows]
+        return self._executemany(conn, table, columns, params)
+
+    def load_arrow(
+        self, conn: Connection, table: Table, data: pa.Table | pa.RecordBatch
+    ) -> int:
+        columns = column_names(table, data.column_names)
+        # Convert column-wise; cheaper than to_pylist() building a dict per row
+        values = [data.column(c).to_pylist() for c in columns]
+        return self._executemany(conn, table, columns, list(zip(*values)))
+
+
+def _factory(engine: Engine, options: Mapping[str, Any]) -> BulkLoader | None:
+    # fast_executemany is a pyodbc cursor feature
+    if (engine.dialect.driver or "").lower() != "pyodbc":
+        return None
+    return MssqlFastExecutemanyLoader(tablock=bool(options.get("tablock", False)))
+
+
+register_bulk_loader("mssql", _factory)
+
+
+__all__ = ["MssqlFastExecutemanyLoader", "input_size_for"]
@@ -0,0 +1,194 @@
+"""MySQL/MariaDB bulk loader using LOAD DATA LOCAL INFILE with a temporary CSV file."""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import tempfile
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Mapping, Sequence
+
+import pyarrow as pa
+from sqlalchemy import Table
+from sqlalchemy import types as satypes
+from sqlalchemy.engine import Connection, Engine
+
+from utils.bulk_load.base import (
+    BulkLoader,
+    column_names,
+    raw_cursor,
+    register_bulk_loader,
+    wrap_dbapi_error,
+)
+from utils.database.identifiers import quote_fqn, quote_ident
+
+logger = logging.getLogger("utils.bulk_load.mysql")
+
+# \N is the NULL marker when fields are escaped with a backslash
+NULL_MARKER = "\\N"
+
+_ESCAPES = str.maketrans(
+    {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\x00": "\\0", "\x1a": "\\Z"}
+)
+
+
+def _quote(text: str) -> str:
+    return '"' + text.translate(_ESCAPES) + '"'
+
+
+def _format_timedelta(value: timedelta) -> str:
+    # MySQL TIME literal: [-]HHH:MM:SS[.ffffff]
+    micros = abs(value) // timedelta(microseconds=1)
+    seconds, micros = divmod(micros, 1_000_000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    sign = "-" if value < timedelta(0) else ""
+    return f"{sign}{hours:02d}:{minutes:02d}:{seconds:02d}.{micros:06d}"
+
+
+def _field(value: Any) -> str:
+    """Render one Python value as a LOAD DATA field."""
+    if value is None:
+        return NULL_MARKER
+    if isinstance(value, str):
+        return _quote(value)
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        # MySQL has no NaN/Infinity; store NULL like the pandas insert path does
+        return NULL_MARKER if math.isnan(value) or math.isinf(value) else repr(value)
+    if isinstance(value, Decimal):
+        return NULL_MARKER if not value.is_finite() else str(value)
+    if isinstance(value, datetime):
+        # DATETIME has no time zone; pymysql drops tzinfo the same way
+        return value.replace(tzinfo=None).isoformat(sep=" ")
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return _format_timedelta(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # Binary columns are loaded through UNHEX(@var), see _load_statement
+        return bytes(value).hex()
+    if isinstance(value, (dict, list)):
+        return _quote(json.dumps(value, default=str))
+    return _quote(str(value))
+
+
+def rows_to_lines(params: Sequence[Sequence[Any]]) -> str:
+    """Serialize row tuples as CSV lines in the LOAD DATA format used below."""
+    lines = [",".join([_field(v) for v in row]) for row in params]
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _is_binary(t: satypes.TypeEngine) -> bool:
+    return isinstance(t, (satypes.LargeBinary, satypes.BINARY, satypes.VARBINARY))
+
+
+class MysqlLoadDataLoader(BulkLoader):
+    """
+    Load batches by writing them to a temporary CSV file and issuing
+    `LOAD DATA LOCAL INFILE` (utf8mb4, quoted fields, backslash escapes,
+    \\N for NULL). The file is removed after each batch.
+
+    Requires local_infile on both sides: the client connection (see
+    DST_MYSQL_LOCAL_INFILE) and the server (`local_infile=ON`). Note that with
+    LOCAL, conversion errors and duplicate keys are reported as warnings rather
+    than errors; the first warnings are logged.
+    """
+
+    name = "mysql-load-data"
+
+    def _load_statement(
+        self, conn: Connection, table: Table, columns: Sequence[str]
+    ) -> str:
+        target = quote_fqn(conn, [table.schema, table.name])
+        targets: list[str] = []
+        sets: list[str] = []
+        for i, c in enumerate(columns):
+            qcol = quote_ident(conn, c)
+            if _is_binary(table.c[c].type):
+                targets.append(f"@b{i}")
+                sets.append(f"{qcol} = UNHEX(@b{i})")
+            else:
+                targets.append(qcol)
+        sql = (
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {target} "
+            "CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '\\\\' "
+            "LINES TERMINATED BY '\\n' "
+            f"({', '.join(targets)})"
+        )
+        if sets:
+            sql += " SET " + ", ".join(sets)
+        return sql
+
+    def _load(
+        self,
+        conn: Connection,
+        table: Table,
+        columns: Sequence[str],
+        params: Sequence[Sequence[Any]],
+    ) -> int:
+        if not params:
+            return 0
+        sql = self._load_statement(conn, table, columns)
+        fd, path = tempfile.mkstemp(prefix=f"{table.name}_", suffix=".csv")
+        try:
+            # newline="" keeps \n line endings on Windows as well
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+                f.write(rows_to_lines(params))
+            cur = raw_cursor(conn)
+            try:
+                cur.execute(sql, (path,))
+                loaded = cur.rowcount
+                cur.execute("SHOW WARNINGS LIMIT 5")
+                warnings = cur.fetchall()
+            except Exception as e:
+                raise wrap_dbapi_error(conn, sql, e) from e
+            finally:
+                cur.close()
+        finally:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning("Failed to delete temporary file %s: %s", path, e)
+        for w in warnings:
+            logger.warning("%s: LOAD DATA warning: %s", table.name, w)
+        return loaded if loaded is not None and loaded >= 0 else len(params)
+
+    def load_rows(
+        self, conn: Connection, table: Table, rows: Sequence[Mapping[str, Any]]
+    ) -> int:
+        columns = column_names(table)
+        params = [tuple(row.get(c) for c in columns) for row in rows]
+        return self._load(conn, table, columns, params)
+
+    def load_arrow(
+        self, conn: Connection, table: Table, data: pa.Table | pa.RecordBatch
+    ) -> int:
+        columns = column_names(table, data.column_names)
+        values = [data.column(c).to_pylist() for c in columns]
+        return self._load(conn, table, columns, list(zip(*values)))
+
+
+def _factory(engine: Engine, options: Mapping[str, Any]) -> BulkLoader | None:
+    # The file name is bound client-side with the format paramstyle
+    if (engine.dialect.driver or "").lower() not in {"pymysql", "mysqldb"}:
+        return None
+    # The client must have opted in to LOCAL INFILE when the engine was created
+    if not options.get("local_infile", False):
+        return None
+    return MysqlLoadDataLoader()
+
+
+register_bulk_loader("mysql", _factory)
+register_bulk_loader("mariadb", _factory)
+
+
+__all__ = ["MysqlLoadDataLoader", "rows_to_lines"]
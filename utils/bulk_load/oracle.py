@@ -0,0 +1,170 @@
+"""Oracle bulk loader using python-oracledb array DML (executemany)."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Mapping, Sequence
+
+import pyarrow as pa
+from sqlalchemy import Table
+from sqlalchemy import types as satypes
+from sqlalchemy.engine import Connection, Engine
+
+from utils.bulk_load.base import (
+    BulkLoader,
+    column_names,
+    raw_cursor,
+    register_bulk_loader,
+    wrap_dbapi_error,
+)
+from utils.database.identifiers import quote_fqn, quote_ident
+
+logger = logging.getLogger("utils.bulk_load.oracle")
+
+# Number of rejected rows logged individually when batch errors are enabled
+_MAX_LOGGED_BATCH_ERRORS = 5
+
+
+def input_size_for(t: satypes.TypeEngine) -> Any:
+    """
+    Map a destination column type to a python-oracledb `setinputsizes` entry.
+    Returns None to let the driver infer the binding.
+    """
+    import oracledb
+
+    tname = type(t).__name__.upper()
+    if tname == "BINARY_FLOAT":
+        return oracledb.DB_TYPE_BINARY_FLOAT
+    if tname == "BINARY_DOUBLE" or isinstance(t, satypes.Float):
+        return oracledb.DB_TYPE_BINARY_DOUBLE
+    if isinstance(t, (satypes.Numeric, satypes.Integer, satypes.Boolean)):
+        return oracledb.DB_TYPE_NUMBER
+    if isinstance(t, satypes.DateTime):
+        if getattr(t, "timezone", False):
+            return oracledb.DB_TYPE_TIMESTAMP_TZ
+        # Oracle DATE reflects as a DateTime subclass and also stores a time part
+        return oracledb.DB_TYPE_DATE if tname == "DATE" else oracledb.DB_TYPE_TIMESTAMP
+    if isinstance(t, satypes.Date):
+        return oracledb.DB_TYPE_DATE
+    if isinstance(t, satypes.String):
+        length = getattr(t, "length", None)
+        if isinstance(t, satypes.Text) or not isinstance(length, int):
+            # LONG binds let strings beyond 32K be inserted into CLOB columns
+            return oracledb.DB_TYPE_LONG
+        return length
+    if isinstance(t, satypes.LargeBinary):
+        return oracledb.DB_TYPE_LONG_RAW
+    if isinstance(t, (satypes.BINARY, satypes.VARBINARY)) or tname == "RAW":
+        return oracledb.DB_TYPE_RAW
+    return None
+
+
+def _bind_value(value: Any) -> Any:
+    # Booleans are stored as NUMBER(1); raw binds do not get SQLAlchemy's processor
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+class OracleArrayDmlLoader(BulkLoader):
+    """
+    Load batches with `cursor.executemany()` so python-oracledb sends the whole
+    batch as one array bind instead of one round trip per row. Input sizes are
+    derived from the destination column types.
+
+    - direct_path adds the `/*+ APPEND_VALUES */` hint for direct-path inserts
+      above the high-water mark (minimal undo). Only used for replace/truncate
+      loads into an emptied table; each batch must be committed before the
+      table is touched again, which the callers' per-batch transactions ensure.
+    - batch_errors uses `executemany(..., batcherrors=True)`: rows that fail
+      (e.g. value too large) are skipped and logged instead of failing the
+      whole batch.
+    """
+
+    name = "oracle-array-dml"
+
+    def __init__(self, direct_path: bool = False, batch_errors: bool = False):
+        self.direct_path = direct_path
+        self.batch_errors = batch_errors
+
+    def _insert_sql(self, conn: Connection, table: Table, columns: Sequence[str]):
+        target = quote_fqn(conn, [table.schema, table.name])
+        hint = " /*+ APPEND_VALUES */" if self.direct_path else ""
+        col_list = ", ".join(quote_ident(conn, c) for c in columns)
+        binds = ", ".join(f":{i}" for i in range(1, len(columns) + 1))
+        return f"INSERT{hint} INTO {target} ({col_list}) VALUES ({binds})"
+
+    def _executemany(
+        self,
+        conn: Connection,
+        table: Table,
+        columns: Sequence[str],
+        params: list[tuple],
+    ) -> int:
+        if not params:
+            return 0
+        sql = self._insert_sql(conn, table, columns)
+        cur = raw_cursor(conn)
+        try:
+            cur.setinputsizes(*[input_size_for(table.c[c].type) for c in columns])
+            if self.batch_errors:
+                cur.executemany(sql, params, batcherrors=True)
+                errors = cur.getbatcherrors()
+            else:
+                cur.executemany(sql, params)
+                errors = []
+        except Exception as e:
+            raise wrap_dbapi_error(conn, sql, e) from e
+        finally:
+            cur.close()
+        if errors:
+            logger.warning(
+                "%s: %d of %d row(s) rejected by batch errors",
+                table.name,
+                len(errors),
+                len(params),
+            )
+            for err in errors[:_MAX_LOGGED_BATCH_ERRORS]:
+                logger.warning("   row %s: %s", err.offset, err.message)
+        return len(params) - len(errors)
+
+    def load_rows(
+        self, conn: Connection, table: Table, rows: Sequence[Mapping[str, Any]]
+    ) -> int:
+        columns = column_names(table)
+        params = [tuple(_bind_value(row.get(c)) for c in columns) for row in rows]
+        return self._executemany(conn, table, columns, params)
+
+    def load_arrow(
+        self, conn: Connection, table: Table, data: pa.Table | pa.RecordBatch
+    ) -> int:
+        columns = column_names(table, data.column_names)
+        values = []
+        for c in columns:
+            column = data.column(c)
+            pylist = column.to_pylist()
+            if pa.types.is_boolean(column.type):
+                pylist = [_bind_value(v) for v in pylist]
+            values.append(pylist)
+        return self._executemany(conn, table, columns, list(zip(*values)))
+
+
+def _factory(engine: Engine, options: Mapping[str, Any]) -> BulkLoader | None:
+    if (engine.dialect.driver or "").lower() != "oracledb":
+        return None
+    # Direct-path inserts only make sense when the table was emptied first
+    write_mode = str(options.get("write_mode", "append")).lower()
+    direct_path = bool(options.get("direct_path", False)) and write_mode in {
+        "replace",
+        "truncate",
+    }
+    return OracleArrayDmlLoader(
+        direct_path=direct_path,
+        batch_errors=bool(options.get("batch_errors", False)),
+    )
+
+
+register_bulk_loader("oracle", _factory)
+
+
+__all__ = ["OracleArrayDmlLoader", "input_size_for"]
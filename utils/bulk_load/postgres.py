@@ -0,0 +1,159 @@
+"""PostgreSQL bulk loader using COPY ... FROM STDIN (CSV) via psycopg2."""
+
+from __future__ import annotations
+
+import io
+import json
+import math
+from datetime import date, datetime, time, timedelta
+from typing import Any, Mapping, Sequence
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+from sqlalchemy import Table
+from sqlalchemy.engine import Connection, Engine
+
+from utils.bulk_load.base import (
+    BulkLoader,
+    column_names,
+    raw_cursor,
+    register_bulk_loader,
+    wrap_dbapi_error,
+)
+from utils.database.identifiers import quote_fqn, quote_ident
+
+
+def _quote(text: str) -> str:
+    # Postgres text columns cannot contain NUL bytes; strip them like the
+    # INSERT paths do
+    if "\x00" in text:
+        text = text.replace("\x00", "")
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _csv_value(value: Any) -> str:
+    """Render one Python value as a COPY CSV field (unquoted empty = NULL)."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return _quote(value)
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "NaN"
+        if math.isinf(value):
+            return "Infinity" if value > 0 else "-Infinity"
+        return repr(value)
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return f"{value.total_seconds()} seconds"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\x" + bytes(value).hex()
+    if isinstance(value, (dict, list)):
+        return _quote(json.dumps(value, default=str))
+    return _quote(str(value))
+
+
+def rows_to_csv(rows: Sequence[Mapping[str, Any]], columns: Sequence[str]) -> str:
+    """Serialize dict rows into COPY CSV text for the given column order."""
+    lines = [",".join([_csv_value(row.get(c)) for c in columns]) for row in rows]
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _is_string(t: pa.DataType) -> bool:
+    is_view = getattr(pa.types, "is_string_view", None)
+    return (
+        pa.types.is_string(t)
+        or pa.types.is_large_string(t)
+        or (callable(is_view) and is_view(t))
+    )
+
+
+def _prepare_arrow(data: pa.Table) -> pa.Table:
+    """Strip NUL from string columns and hex-encode binary columns for COPY."""
+    cols = []
+    for field, column in zip(data.schema, data.columns):
+        if pa.types.is_dictionary(field.type):
+            column = column.cast(field.type.value_type)
+            field = pa.field(field.name, field.type.value_type)
+        if _is_string(field.type):
+            column = pc.replace_substring(column.cast(pa.large_string()), "\x00", "")
+        elif pa.types.is_binary(field.type) or pa.types.is_large_binary(field.type):
+            column = pa.array(
+                [None if v is None else "\\x" + v.hex() for v in column.to_pylist()],
+                type=pa.string(),
+            )
+        cols.append(column)
+    return pa.table(cols, names=data.column_names)
+
+
+def _is_csv_writable(data: pa.Table) -> bool:
+    return not any(pa.types.is_nested(f.type) for f in data.schema)
+
+
+class PostgresCopyLoader(BulkLoader):
+    """Load batches with `COPY <table> (<cols>) FROM STDIN WITH (FORMAT csv)`."""
+
+    name = "postgres-copy"
+
+    def _copy(self, conn: Connection, table: Table, columns: Sequence[str], buf):
+        target = quote_fqn(conn, [table.schema, table.name])
+        col_list = ", ".join(quote_ident(conn, c) for c in columns)
+        sql = f"COPY {target} ({col_list}) FROM STDIN WITH (FORMAT csv)"
+        cur = raw_cursor(conn)
+        try:
+            cur.copy_expert(sql, buf)
+        except Exception as e:
+            raise wrap_dbapi_error(conn, sql, e) from e
+        finally:
+            cur.close()
+
+    def load_rows(
+        self, conn: Connection, table: Table, rows: Sequence[Mapping[str, Any]]
+    ) -> int:
+        if not rows:
+            return 0
+        columns = column_names(table)
+        self._copy(conn, table, columns, io.StringIO(rows_to_csv(rows, columns)))
+        return len(rows)
+
+    def load_arrow(
+        self, conn: Connection, table: Table, data: pa.Table | pa.RecordBatch
+    ) -> int:
+        if isinstance(data, pa.RecordBatch):
+            data = pa.Table.from_batches([data])
+        if data.num_rows == 0:
+            return 0
+        columns = column_names(table, data.column_names)
+        data = data.select(columns)
+        if not _is_csv_writable(data):
+            # Nested values have no CSV rendering in Arrow; go through Python
+            return self.load_rows(conn, table, data.to_pylist())
+        buf = io.BytesIO()
+        pacsv.write_csv(
+            _prepare_arrow(data), buf, pacsv.WriteOptions(include_header=False)
+        )
+        buf.seek(0)
+        self._copy(conn, table, columns, buf)
+        return data.num_rows
+
+
+def _factory(engine: Engine, options: Mapping[str, Any]) -> BulkLoader | None:
+    # COPY FROM STDIN is implemented via psycopg2's copy_expert
+    if (engine.dialect.driver or "").lower() != "psycopg2":
+        return None
+    return PostgresCopyLoader()
+
+
+register_bulk_loader("postgresql", _factory)
+
+
+__all__ = ["PostgresCopyLoader", "rows_to_csv"]
@@ -4,7 +4,7 @@ import sys
 import warnings
 import argparse
 import configparser
-from typing import Tuple, Optional
+from typing import Optional, Sequence, Tuple
 
 
 def _ensure_console_logging():
@@ -92,10 +92,14 @@ def load_single_ini_config(
     prog_desc: str = "Run ETL",
     cfg_arg: Tuple[str, str] = ("--config", "-c"),
     allow_notebook_args: bool = True,
+    flags: Sequence[Tuple[str, str]] = (),
 ) -> Tuple[argparse.Namespace, configparser.ConfigParser]:
     """
     Convenience wrapper for scripts that only need one .ini.
 
+    Extra boolean command-line switches can be declared as (option, help)
+    pairs in *flags*, e.g. ("--resume", "..."); they default to False.
+
     Returns (args, cfg). If no path or missing file, returns empty ConfigParser().
     """
     parser = argparse.ArgumentParser(description=prog_desc)
@@ -104,6 +108,8 @@ def load_single_ini_config(
         dest="config",
         help="Path to settings (.ini). Optional; fall back to env if omitted.",
     )
+    for option, help_text in flags:
+        parser.add_argument(option, action="store_true", help=help_text)
 
     if allow_notebook_args and ("ipykernel" in sys.modules or "IPython" in sys.modules):
         args = parser.parse_args([])
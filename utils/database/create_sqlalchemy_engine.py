@@ -17,6 +17,7 @@ def create_sqlalchemy_engine(
     mssql_odbc_driver: str | None = None,
     mssql_trust_server_certificate: bool | None = None,
     oracle_tns_alias: bool | None = None,
+    mysql_local_infile: bool | None = None,
 ) -> Engine:
     """
     Create a SQLAlchemy Engine for Oracle, PostgreSQL, SQL Server, MySQL or MariaDB,
@@ -124,7 +125,9 @@ def create_sqlalchemy_engine(
                 database=database,
                 # optional: uncomment to enforce a charset
                 # query={"charset": "utf8mb4"}
-            )
+            ),
+            # LOAD DATA LOCAL INFILE (bulk load) must be enabled client-side
+            connect_args={"local_infile": True} if mysql_local_infile else {},
         )
 
     else:
@@ -95,6 +95,17 @@ def load_destination_engine(cfg: Any):
             default=False,
             cast_type=bool,
         ),
+        mysql_local_infile=(
+            get_config_value(
+                "DST_MYSQL_LOCAL_INFILE",
+                section="database-destination",
+                cfg_parser=cfg,
+                default=False,
+                cast_type=bool,
+            )
+            if ("mysql" in driver.lower() or "mariadb" in driver.lower())
+            else None
+        ),
         mssql_odbc_driver=(
             cast(
                 str,
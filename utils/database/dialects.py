@@ -0,0 +1,65 @@
+"""
+Dialect names and SQL string literals for raw catalog queries.
+
+Catalog lookups and ConnectorX queries are built as plain SQL for SQLAlchemy
+engines and ConnectorX URIs alike. These helpers resolve both kinds of source
+to one SQLAlchemy dialect name and quote the string values embedded in such
+queries.
+"""
+
+from __future__ import annotations
+
+from typing import Union
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import make_url
+
+# ConnectorX URI schemes -> SQLAlchemy dialect names
+SCHEME_DIALECTS = {
+    "postgres": "postgresql",
+    "postgresql": "postgresql",
+    "redshift": "postgresql",
+    "mysql": "mysql",
+    "mariadb": "mysql",
+    "mssql": "mssql",
+    "sqlserver": "mssql",
+    "oracle": "oracle",
+    "sqlite": "sqlite",
+}
+
+
+def connectorx_scheme(uri: str) -> str:
+    """Return the normalized URI scheme (e.g. postgresql+psycopg2 -> postgresql)."""
+    try:
+        parsed = make_url(uri)
+        scheme = (parsed.drivername or "").lower()
+    except Exception:
+        # Fallback to string parsing if URL parsing fails
+        scheme = uri.split("://", 1)[0].lower()
+    return scheme.split("+", 1)[0]
+
+
+def scheme_dialect(scheme: str) -> str:
+    """SQLAlchemy dialect name for a ConnectorX URI scheme (unknown schemes as-is)."""
+    return SCHEME_DIALECTS.get(scheme, scheme)
+
+
+def dialect_of(source: Union[Engine, str]) -> str:
+    """Dialect name of an engine, or of a ConnectorX URI by its scheme."""
+    if isinstance(source, Engine):
+        return source.dialect.name.lower()
+    return scheme_dialect(connectorx_scheme(source))
+
+
+def sql_literal(value: str) -> str:
+    """Quote a string as a SQL literal (embedded quotes are doubled)."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+__all__ = [
+    "SCHEME_DIALECTS",
+    "connectorx_scheme",
+    "dialect_of",
+    "scheme_dialect",
+    "sql_literal",
+]
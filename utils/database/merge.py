@@ -0,0 +1,75 @@
+"""
+Portable upsert of a staging (delta) table into its target table.
+
+Rows of the target whose key matches a staged row are deleted and all staged
+rows are inserted, in one transaction. DELETE + INSERT ... SELECT is used
+instead of a dialect-specific MERGE/ON CONFLICT so the same code works on
+PostgreSQL, SQL Server, Oracle, MySQL/MariaDB and SQLite.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Sequence
+
+from sqlalchemy import MetaData, Table, and_, exists, select
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("utils.database.merge")
+
+
+def _resolve(table: Table, name: str) -> str:
+    wanted = name.lower()
+    for col in table.columns:
+        if col.name.lower() == wanted:
+            return col.name
+    raise ValueError(f"Merge key {name!r} not found in table {table.name!r}")
+
+
+def merge_from_staging(
+    engine: Engine,
+    *,
+    schema: str | None,
+    target: str,
+    staging: str,
+    key_columns: Sequence[str],
+    drop_staging: bool = True,
+) -> int:
+    """
+    Upsert all rows of `staging` into `target` by `key_columns`; return the
+    number of rows inserted. Only columns present in both tables are copied.
+    The staging table is dropped afterwards unless drop_staging is False.
+    """
+    if not key_columns:
+        raise ValueError(f"merge into {target!r} needs at least one key column")
+
+    meta = MetaData()
+    tgt = Table(target, meta, schema=schema, autoload_with=engine)
+    stg = Table(staging, meta, schema=schema, autoload_with=engine)
+
+    keys = [(_resolve(tgt, k), _resolve(stg, k)) for k in key_columns]
+    staged = {c.name.lower(): c.name for c in stg.columns}
+    columns = [c.name for c in tgt.columns if c.name.lower() in staged]
+
+    match = and_(*[tgt.c[t] == stg.c[s] for t, s in keys])
+    with engine.begin() as conn:
+        deleted = conn.execute(tgt.delete().where(exists().where(match))).rowcount
+        inserted = conn.execute(
+            tgt.insert().from_select(
+                columns, select(*[stg.c[staged[c.lower()]] for c in columns])
+            )
+        ).rowcount
+        if drop_staging:
+            stg.drop(bind=conn)
+
+    logger.info(
+        "Merged %s into %s: %s row(s) replaced, %s row(s) inserted",
+        staging,
+        target,
+        deleted if deleted is not None and deleted >= 0 else "?",
+        inserted if inserted is not None and inserted >= 0 else "?",
+    )
+    return inserted if inserted is not None and inserted >= 0 else 0
+
+
+__all__ = ["merge_from_staging"]
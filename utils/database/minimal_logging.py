@@ -0,0 +1,62 @@
+"""
+Minimally logged staging tables (MINIMAL_LOGGING).
+
+Staging tables are rebuilt on every run, so the redo/WAL written while loading
+them is wasted I/O. With minimal logging, newly created staging tables are:
+
+- PostgreSQL: UNLOGGED (no WAL; the table is emptied after a crash and is not
+  replicated to standbys)
+- Oracle: NOLOGGING (applies to direct-path inserts, see ORACLE_DIRECT_PATH)
+
+SQL Server has no per-table setting: minimal logging there depends on the
+database recovery model (SIMPLE or BULK_LOGGED) plus a TABLOCK hint on the
+load, which the SQL Server bulk loader adds with its "tablock" option. Other
+dialects are left unchanged.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from sqlalchemy import DDL, Table, event, text
+from sqlalchemy.engine import Connection
+
+logger = logging.getLogger("utils.database.minimal_logging")
+
+
+def unlogged_table_kwargs(dialect: str) -> dict[str, Any]:
+    """Extra Table(...) arguments that create the table minimally logged."""
+    if dialect == "postgresql":
+        return {"prefixes": ["UNLOGGED"]}
+    return {}
+
+
+def attach_minimal_logging(table: Table, dialect: str) -> Table:
+    """
+    Register the DDL that minimizes logging for `table` once it is created.
+
+    PostgreSQL is handled by unlogged_table_kwargs (CREATE UNLOGGED TABLE);
+    Oracle gets an ALTER TABLE ... NOLOGGING right after CREATE TABLE.
+    """
+    if dialect == "oracle":
+        event.listen(table, "after_create", DDL("ALTER TABLE %(fullname)s NOLOGGING"))
+    return table
+
+
+def alter_minimal_logging(conn: Connection, dialect: str, qualified: str) -> None:
+    """Switch an existing (empty) table to minimal logging, e.g. one created by polars."""
+    if dialect == "postgresql":
+        conn.execute(text(f"ALTER TABLE {qualified} SET UNLOGGED"))
+    elif dialect == "oracle":
+        conn.execute(text(f"ALTER TABLE {qualified} NOLOGGING"))
+    else:
+        return
+    logger.info("   (%s created with minimal logging)", qualified)
+
+
+__all__ = [
+    "alter_minimal_logging",
+    "attach_minimal_logging",
+    "unlogged_table_kwargs",
+]
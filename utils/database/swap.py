@@ -0,0 +1,139 @@
+"""
+Shadow-table loads: fill `<table>__load_<runid>` and swap it into place.
+
+With write_mode "replace" the staging table would otherwise be dropped and
+recreated before the copy, leaving it empty or partial for readers (and after
+a failed run) until the load completes. Loading into a shadow table keeps the
+previous data available until `swap_table` replaces it at the very end:
+
+- PostgreSQL, SQL Server, SQLite: DROP + rename in one transaction (their DDL
+  is transactional, so readers see either the old or the new table)
+- MySQL/MariaDB: one atomic multi-table `RENAME TABLE`
+- Oracle (and other dialects): DDL commits implicitly, so the old table is
+  renamed aside, the shadow renamed into place and the old table dropped;
+  the window without a table is two dictionary updates long
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+
+from sqlalchemy import MetaData, Table, inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+from utils.database.identifiers import quote_fqn, quote_ident
+
+logger = logging.getLogger("utils.database.swap")
+
+SHADOW_MARKER = "__load_"
+
+
+def new_run_id() -> str:
+    """Short random id for the shadow tables of one run."""
+    return uuid.uuid4().hex[:8]
+
+
+def shadow_table_name(table: str, run_id: str) -> str:
+    return f"{table}{SHADOW_MARKER}{run_id}"
+
+
+def _qualified(engine: Engine, schema: str | None, table: str) -> str:
+    return quote_fqn(engine, [schema, table] if schema else [table])
+
+
+def _rename(
+    conn: Connection, engine: Engine, schema: str | None, old: str, new: str
+) -> None:
+    dialect = engine.dialect.name.lower()
+    if dialect == "mssql":
+        source = _qualified(engine, schema, old).replace("'", "''")
+        new_name = new.replace("'", "''")
+        conn.execute(text(f"EXEC sp_rename '{source}', '{new_name}'"))
+    elif dialect in ("mysql", "mariadb"):
+        conn.execute(
+            text(
+                f"RENAME TABLE {_qualified(engine, schema, old)} "
+                f"TO {_qualified(engine, schema, new)}"
+            )
+        )
+    else:
+        # The new name of ALTER TABLE ... RENAME TO is never schema-qualified
+        conn.execute(
+            text(
+                f"ALTER TABLE {_qualified(engine, schema, old)} "
+                f"RENAME TO {quote_ident(engine, new)}"
+            )
+        )
+
+
+def swap_table(engine: Engine, *, schema: str | None, target: str, shadow: str) -> None:
+    """Replace `target` by the fully loaded `shadow` table."""
+    dialect = engine.dialect.name.lower()
+    exists = inspect(engine).has_table(target, schema=schema)
+
+    if dialect in ("postgresql", "mssql", "sqlite"):
+        with engine.begin() as conn:
+            if exists:
+                Table(target, MetaData(), schema=schema).drop(bind=conn)
+            _rename(conn, engine, schema, shadow, target)
+    elif dialect in ("mysql", "mariadb"):
+        with engine.begin() as conn:
+            if not exists:
+                _rename(conn, engine, schema, shadow, target)
+            else:
+                old = f"{target}__old_{new_run_id()}"
+                conn.execute(
+                    text(
+                        f"RENAME TABLE {_qualified(engine, schema, target)} "
+                        f"TO {_qualified(engine, schema, old)}, "
+                        f"{_qualified(engine, schema, shadow)} "
+                        f"TO {_qualified(engine, schema, target)}"
+                    )
+                )
+                Table(old, MetaData(), schema=schema).drop(bind=conn)
+    else:
+        old = f"{target}__old_{new_run_id()}"
+        with engine.begin() as conn:
+            if exists:
+                _rename(conn, engine, schema, target, old)
+            try:
+                _rename(conn, engine, schema, shadow, target)
+            except Exception:
+                if exists:
+                    _rename(conn, engine, schema, old, target)
+                raise
+            if exists:
+                Table(old, MetaData(), schema=schema).drop(bind=conn)
+
+    logger.info("Swapped %s into place as %s", shadow, target)
+
+
+def drop_shadow_tables(
+    engine: Engine, *, schema: str | None, target: str, keep: str | None = None
+) -> list[str]:
+    """Drop shadow tables of `target` left behind by failed runs (except `keep`)."""
+    prefix = f"{target}{SHADOW_MARKER}".lower()
+    try:
+        names = inspect(engine).get_table_names(schema=schema)
+    except Exception as e:
+        logger.warning("Could not list tables to clean up shadow tables: %s", e)
+        return []
+    stale = [
+        n
+        for n in names
+        if n.lower().startswith(prefix) and (keep is None or n.lower() != keep.lower())
+    ]
+    for name in stale:
+        with engine.begin() as conn:
+            Table(name, MetaData(), schema=schema).drop(bind=conn, checkfirst=True)
+        logger.info("Dropped stale shadow table %s", name)
+    return stale
+
+
+__all__ = [
+    "drop_shadow_tables",
+    "new_run_id",
+    "shadow_table_name",
+    "swap_table",
+]
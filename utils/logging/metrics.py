@@ -0,0 +1,185 @@
+"""
+Per-table throughput metrics and a JSON run report (METRICS_REPORT).
+
+A slow table is either source-bound, Python-bound or destination-bound. Each
+transfer path times the phases of every chunk it moves:
+
+- direct_transfer: fetch (source cursor), transform (dict building, NUL
+  stripping) and insert (destination write)
+- download_parquet: fetch (source read) and write (parquet file)
+- upload_parquet: read (parquet file) and write (destination)
+
+Phase times are summed over all chunks (and over the partitions of a table,
+so with parallel partitions they can exceed the wall time). Rows/s and bytes/s
+are computed against the table's wall time; bytes are the estimated in-memory
+size of the chunks, not the size on the wire.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import Any, ContextManager, Iterable, Iterator, TypeVar
+
+logger = logging.getLogger("utils.logging.metrics")
+
+T = TypeVar("T")
+
+
+def _format_bytes(n: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"  # pragma: no cover - loop always returns
+
+
+class TableMetrics:
+    """Thread-safe phase timings, rows and estimated bytes of one table."""
+
+    def __init__(self, stage: str, table: str):
+        self.stage = stage
+        self.table = table
+        self.rows = 0
+        self.bytes = 0
+        self.chunks = 0
+        self.phases: dict[str, float] = {}
+        self._started = time.perf_counter()
+        self._seconds: float | None = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Add the time spent in the block to phase `name`."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    def add_chunk(self, rows: int, nbytes: int = 0) -> None:
+        """Count one chunk that went through all phases."""
+        with self._lock:
+            self.rows += rows
+            self.bytes += nbytes
+            self.chunks += 1
+
+    def finish(self) -> None:
+        """Freeze the wall time (later calls keep the first value)."""
+        if self._seconds is None:
+            self._seconds = time.perf_counter() - self._started
+
+    @property
+    def seconds(self) -> float:
+        if self._seconds is not None:
+            return self._seconds
+        return time.perf_counter() - self._started
+
+    def to_dict(self) -> dict[str, Any]:
+        seconds = self.seconds
+        return {
+            "stage": self.stage,
+            "table": self.table,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "chunks": self.chunks,
+            "seconds": round(seconds, 3),
+            "phases": {k: round(v, 3) for k, v in self.phases.items()},
+            "rows_per_second": round(self.rows / seconds, 1) if seconds > 0 else None,
+            "bytes_per_second": round(self.bytes / seconds, 1) if seconds > 0 else None,
+        }
+
+    def summary(self) -> str:
+        """One log line: phase breakdown plus rows/s and bytes/s."""
+        seconds = self.seconds
+        total = sum(self.phases.values())
+        phases = ", ".join(
+            f"{name} {value:.1f}s ({value / total:.0%})" if total > 0 else name
+            for name, value in self.phases.items()
+        )
+        rate = (
+            f"{self.rows / seconds:,.0f} rows/s, {_format_bytes(self.bytes / seconds)}/s"
+            if seconds > 0
+            else "n/a"
+        )
+        return f"{phases or 'no chunks'}; {rate}"
+
+
+def timed(metrics: TableMetrics | None, name: str) -> ContextManager[None]:
+    """`metrics.phase(name)`, or a no-op without metrics."""
+    return metrics.phase(name) if metrics is not None else nullcontext()
+
+
+def timed_iter(
+    iterable: Iterable[T], metrics: TableMetrics | None, name: str
+) -> Iterator[T]:
+    """Iterate `iterable`, adding the time spent producing each item to phase `name`."""
+    it = iter(iterable)
+    try:
+        while True:
+            with timed(metrics, name):
+                try:
+                    item = next(it)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        close = getattr(it, "close", None)
+        if close is not None:
+            close()
+
+
+class TransferMetrics:
+    """Collects TableMetrics of one run and writes them as a JSON report."""
+
+    def __init__(self) -> None:
+        self.created_at = datetime.now()
+        # Run-level figures (e.g. the spill directory peak) for the report
+        self.run: dict[str, Any] = {}
+        self._tables: dict[tuple[str, str], TableMetrics] = {}
+        self._lock = threading.Lock()
+
+    def table(self, stage: str, table: str) -> TableMetrics:
+        """Metrics of `table` in `stage` (created on first use)."""
+        with self._lock:
+            key = (stage, table)
+            if key not in self._tables:
+                self._tables[key] = TableMetrics(stage, table)
+            return self._tables[key]
+
+    @property
+    def tables(self) -> list[TableMetrics]:
+        with self._lock:
+            return list(self._tables.values())
+
+    def log_table(self, metrics: TableMetrics) -> None:
+        metrics.finish()
+        logger.info("   %s: %s", metrics.table, metrics.summary())
+
+    def report(self) -> dict[str, Any]:
+        report: dict[str, Any] = {
+            "created_at": self.created_at.isoformat(timespec="seconds"),
+            "tables": [m.to_dict() for m in self.tables],
+        }
+        if self.run:
+            report["run"] = dict(self.run)
+        return report
+
+    def write_report(self, path: str) -> None:
+        """Write the run report as JSON to `path` (directories are created)."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        logger.info("Metrics report written to %s", path)
+
+
+__all__ = ["TableMetrics", "TransferMetrics", "timed", "timed_iter"]
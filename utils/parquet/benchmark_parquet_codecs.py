@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Benchmark the parquet write settings (PARQUET_COMPRESSION and friends) on
+synthetic data shaped like a typical staging table: an integer key, foreign
+keys, low-cardinality codes, dates, amounts, free text with NULLs and flags.
+
+For every codec it writes the same DataFrame with
+utils.parquet.write_options.ParquetWriteOptions and reads it back, and
+reports write and read throughput (in-memory MB per second), the file size
+and the compression ratio. Results depend on the data: use it to choose a
+codec for a disk-constrained machine, not as an absolute measure.
+
+Usage:
+  python -m utils.parquet.benchmark_parquet_codecs --rows 500000
+  python -m utils.parquet.benchmark_parquet_codecs --codecs zstd:1,zstd:9,lz4 --no-dictionary
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Sequence
+
+import polars as pl
+
+from utils.parquet.write_options import ParquetWriteOptions
+
+DEFAULT_CODECS = ("zstd", "zstd:1", "zstd:9", "lz4", "snappy", "gzip", "none")
+
+_STATUSES = ("actief", "beeindigd", "aangevraagd", "afgewezen", "opgeschort")
+_WORDS = (
+    "client",
+    "besluit",
+    "indicatie",
+    "voorziening",
+    "regeling",
+    "toelichting",
+    "aanvraag",
+    "wijziging",
+    "herindicatie",
+    "verlenging",
+)
+
+
+def synthetic_frame(rows: int, seed: int = 123) -> pl.DataFrame:
+    """A reproducible DataFrame with the column mix of a staging table."""
+    rnd = random.Random(seed)
+    start = date(2015, 1, 1)
+    return pl.DataFrame(
+        {
+            "id": range(1, rows + 1),
+            "clientnr": [rnd.randrange(1, max(2, rows // 4)) for _ in range(rows)],
+            "kode_regeling": [f"R{rnd.randrange(40):03d}" for _ in range(rows)],
+            "status": [rnd.choice(_STATUSES) for _ in range(rows)],
+            "dd_begin": [
+                start + timedelta(days=rnd.randrange(3650)) for _ in range(rows)
+            ],
+            "bedrag": [round(rnd.uniform(0, 5_000), 2) for _ in range(rows)],
+            "toelichting": [
+                " ".join(rnd.choices(_WORDS, k=rnd.randrange(3, 12)))
+                if rnd.random() > 0.3
+                else None
+                for _ in range(rows)
+            ],
+            "ind_actief": [rnd.random() > 0.2 for _ in range(rows)],
+        }
+    )
+
+
+def parse_codec(spec: str, **options: Any) -> ParquetWriteOptions:
+    """`zstd` or `zstd:9` (codec with level) as write options."""
+    codec, _, level = spec.partition(":")
+    return ParquetWriteOptions(
+        compression=codec, compression_level=int(level) if level else None, **options
+    )
+
+
+def benchmark_options(
+    df: pl.DataFrame, options: ParquetWriteOptions, directory: str, repeats: int = 1
+) -> dict[str, Any]:
+    """Write and read `df` with `options`; best of `repeats` timings."""
+    path = os.path.join(directory, "benchmark.parquet")
+    mb = df.estimated_size() / 1024 / 1024
+    write_s = read_s = float("inf")
+    for _ in range(max(1, repeats)):
+        started = time.perf_counter()
+        options.write(df, path)
+        write_s = min(write_s, time.perf_counter() - started)
+        started = time.perf_counter()
+        read_back = pl.read_parquet(path)
+        read_s = min(read_s, time.perf_counter() - started)
+    if read_back.height != df.height:
+        raise RuntimeError(f"Read {read_back.height} rows, wrote {df.height}")
+    size = os.path.getsize(path)
+    os.remove(path)
+    return {
+        "compression": options.compression,
+        "compression_level": options.compression_level,
+        "use_dictionary": options.use_dictionary,
+        "statistics": options.statistics,
+        "row_group_size": options.row_group_size,
+        "file_bytes": size,
+        "ratio": round(df.estimated_size() / size, 2) if size else None,
+        "write_seconds": round(write_s, 4),
+        "read_seconds": round(read_s, 4),
+        "write_mb_per_second": round(mb / write_s, 1) if write_s > 0 else None,
+        "read_mb_per_second": round(mb / read_s, 1) if read_s > 0 else None,
+    }
+
+
+def run_benchmark(
+    rows: int = 200_000,
+    *,
+    codecs: Sequence[str] = DEFAULT_CODECS,
+    seed: int = 123,
+    repeats: int = 1,
+    **options: Any,
+) -> list[dict[str, Any]]:
+    """Benchmark every codec spec on the same synthetic DataFrame."""
+    df = synthetic_frame(rows, seed)
+    with tempfile.TemporaryDirectory(prefix="parquet_bench_") as directory:
+        return [
+            {
+                "codec": spec,
+                **benchmark_options(
+                    df, parse_codec(spec, **options), directory, repeats
+                ),
+            }
+            for spec in codecs
+        ]
+
+
+def format_results(results: Sequence[dict[str, Any]]) -> str:
+    """The results as a fixed-width text table."""
+    lines = [
+        f"{'codec':<10} {'file MB':>9} {'ratio':>6} {'write MB/s':>11} {'read MB/s':>10}"
+    ]
+    for r in results:
+        lines.append(
+            f"{r['codec']:<10} {r['file_bytes'] / 1024 / 1024:>9.2f} {r['ratio']:>6} "
+            f"{r['write_mb_per_second']:>11} {r['read_mb_per_second']:>10}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(
+        description="Compare parquet codecs on synthetic staging data"
+    )
+    ap.add_argument("--rows", type=int, default=200_000, help="Rows of synthetic data")
+    ap.add_argument(
+        "--codecs",
+        default=",".join(DEFAULT_CODECS),
+        help="Comma-separated codecs, optionally with level (e.g. zstd:3,lz4,none)",
+    )
+    ap.add_argument(
+        "--row-group-size", type=int, default=None, help="Maximum rows per row group"
+    )
+    ap.add_argument(
+        "--no-dictionary", action="store_true", help="Disable dictionary encoding"
+    )
+    ap.add_argument(
+        "--no-statistics", action="store_true", help="Disable column statistics"
+    )
+    ap.add_argument("--repeats", type=int, default=3, help="Best of N timings")
+    ap.add_argument("--seed", type=int, default=123, help="Random seed")
+    ap.add_argument("--json", type=Path, default=None, help="Also write results here")
+    args = ap.parse_args()
+
+    results = run_benchmark(
+        args.rows,
+        codecs=[c.strip() for c in args.codecs.split(",") if c.strip()],
+        seed=args.seed,
+        repeats=args.repeats,
+        row_group_size=args.row_group_size,
+        use_dictionary=not args.no_dictionary,
+        statistics=not args.no_statistics,
+    )
+    print(format_results(results))
+    if args.json is not None:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Disk budget for the parquet spill directory (SPILL_MAX_GB).
+
+A dump writes its parquet files to the data directory until they are
+uploaded, so without limits the directory grows to the size of the source
+dataset. `SpillManager` keeps track of the files of every table in that
+directory and blocks the dump (backpressure) once they exceed the budget,
+until the uploader has loaded and deleted the files of finished tables
+(see utils.parquet.upload_pipeline, which the dump modes then use).
+
+Only files of finished tables can be reclaimed: when the table being dumped
+exceeds the budget on its own, the dump continues with a warning instead of
+waiting forever. The peak usage of the run is logged at the end and added to
+the metrics report.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Iterable
+
+logger = logging.getLogger("utils.parquet.spill")
+
+
+def _size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _gb(n: float) -> str:
+    if n < 1024**3:
+        return f"{n / 1024**2:.1f} MB"
+    return f"{n / 1024**3:.2f} GB"
+
+
+class SpillManager:
+    """Thread-safe accounting of the dump files on disk with a byte budget."""
+
+    def __init__(self, directory: str, max_bytes: int):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be > 0")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.peak_bytes = 0
+        self.waited_seconds = 0.0
+        self._files: dict[str, dict[str, int]] = {}
+        self._pending: set[str] = set()  # finished tables waiting for upload
+        self._warned: set[str] = set()
+        self._cond = threading.Condition()
+
+    @property
+    def used_bytes(self) -> int:
+        with self._cond:
+            return self._used()
+
+    def _used(self) -> int:
+        return sum(sum(files.values()) for files in self._files.values())
+
+    def _reclaimable(self) -> bool:
+        return any(sum(self._files.get(t, {}).values()) for t in self._pending)
+
+    def written(self, table: str, path: str, *, wait: bool = True) -> None:
+        """
+        Record that `path` (of `table`) was written or grew, then block while
+        the budget is exceeded and finished tables can still be uploaded.
+        """
+        with self._cond:
+            self._files.setdefault(table, {})[path] = _size(path)
+            self.peak_bytes = max(self.peak_bytes, self._used())
+            if not wait or self._used() < self.max_bytes:
+                return
+            if self._reclaimable():
+                logger.info(
+                    "Spill directory at %s of %s; waiting for uploads",
+                    _gb(self._used()),
+                    _gb(self.max_bytes),
+                )
+            started = time.perf_counter()
+            while self._used() >= self.max_bytes and self._reclaimable():
+                self._cond.wait()
+            self.waited_seconds += time.perf_counter() - started
+            if self._used() >= self.max_bytes and table not in self._warned:
+                self._warned.add(table)
+                logger.warning(
+                    "Spill directory at %s exceeds SPILL_MAX_GB (%s) with no "
+                    "finished table left to upload; continuing with %s",
+                    _gb(self._used()),
+                    _gb(self.max_bytes),
+                    table,
+                )
+
+    def track(self, table: str, paths: Iterable[str]) -> None:
+        """Record existing files of `table` (e.g. from a resumed run) without waiting."""
+        for path in paths:
+            self.written(table, path, wait=False)
+
+    def finished(self, table: str) -> None:
+        """`table` is complete and handed over for upload."""
+        with self._cond:
+            self._pending.add(table)
+
+    def released(self, table: str) -> None:
+        """The upload of `table` ended; count only the files that still exist."""
+        with self._cond:
+            self._pending.discard(table)
+            files = self._files.get(table, {})
+            for path in list(files):
+                files[path] = _size(path)
+                if not files[path]:
+                    del files[path]
+            self._cond.notify_all()
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "directory": self.directory,
+            "max_bytes": self.max_bytes,
+            "peak_bytes": self.peak_bytes,
+            "waited_seconds": round(self.waited_seconds, 3),
+        }
+
+    def log_summary(self) -> None:
+        logger.info(
+            "Spill directory %s: peak %s of %s (%.1fs waiting for uploads)",
+            self.directory,
+            _gb(self.peak_bytes),
+            _gb(self.max_bytes),
+            self.waited_seconds,
+        )
+
+
+__all__ = ["SpillManager"]
@@ -0,0 +1,78 @@
+# Tests for the shared parquet write settings (PARQUET_COMPRESSION and friends) and the codec benchmark
+# Verifies that codec, level, row-group size, dictionary encoding and statistics end up in the files
+
+from configparser import ConfigParser
+from pathlib import Path
+
+import polars as pl
+import pyarrow.parquet as pq
+import pytest
+
+from utils.parquet.benchmark_parquet_codecs import format_results, run_benchmark
+from utils.parquet.write_options import (
+    ParquetWriteOptions,
+    parquet_write_options_from_config,
+)
+
+
+def _df(rows: int = 100) -> pl.DataFrame:
+    return pl.DataFrame({"id": range(rows), "code": [f"C{i % 3}" for i in range(rows)]})
+
+
+def test_defaults_match_polars_and_invalid_settings_fail():
+    options = ParquetWriteOptions()
+    assert (options.compression, options.compression_level) == ("zstd", None)
+    assert ParquetWriteOptions(compression="Uncompressed").compression == "none"
+    with pytest.raises(ValueError, match="PARQUET_COMPRESSION must be"):
+        ParquetWriteOptions(compression="brotli2")
+    with pytest.raises(ValueError, match="not valid for lz4"):
+        ParquetWriteOptions(compression="lz4", compression_level=3)
+    with pytest.raises(ValueError, match="not valid for zstd"):
+        ParquetWriteOptions(compression="zstd", compression_level=23)
+
+
+def test_write_applies_codec_row_groups_dictionary_and_statistics(tmp_path: Path):
+    path = tmp_path / "t.parquet"
+    ParquetWriteOptions(
+        compression="lz4", row_group_size=40, use_dictionary=False, statistics=False
+    ).write(_df(), path)
+
+    meta = pq.ParquetFile(path).metadata
+    assert meta.num_row_groups == 3
+    column = meta.row_group(0).column(1)
+    assert column.compression == "LZ4"
+    assert not column.is_stats_set
+    assert not any("DICT" in e for e in column.encodings)
+    assert pl.read_parquet(path).equals(_df())
+
+    ParquetWriteOptions(compression="none").write(_df(), path)
+    column = pq.ParquetFile(path).metadata.row_group(0).column(1)
+    assert column.compression == "UNCOMPRESSED"
+    assert column.is_stats_set
+
+
+def test_options_from_config():
+    cfg = ConfigParser()
+    cfg.read_dict(
+        {
+            "settings": {
+                "PARQUET_COMPRESSION": "zstd",
+                "PARQUET_COMPRESSION_LEVEL": "9",
+                "PARQUET_ROW_GROUP_SIZE": "0",
+                "PARQUET_DICTIONARY": "false",
+            }
+        }
+    )
+
+    assert parquet_write_options_from_config(cfg) == ParquetWriteOptions(
+        compression="zstd", compression_level=9, use_dictionary=False
+    )
+
+
+def test_benchmark_reports_size_and_throughput_per_codec():
+    results = run_benchmark(500, codecs=["zstd:1", "none"])
+
+    assert [r["codec"] for r in results] == ["zstd:1", "none"]
+    assert results[0]["file_bytes"] < results[1]["file_bytes"]
+    assert all(r["write_mb_per_second"] and r["read_mb_per_second"] for r in results)
+    assert "zstd:1" in format_results(results)
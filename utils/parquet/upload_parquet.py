@@ -13,22 +13,34 @@ import logging
 import os
 from pathlib import Path
 import re
-from typing import Any
+import time
+from typing import Any, Callable, Iterator, Mapping, Sequence
 
 import polars as pl
 import pyarrow as pa
 import pyarrow.parquet as pq
-from sqlalchemy import text
+from sqlalchemy import MetaData, Table, text
 from sqlalchemy import types as satypes
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.schema import CreateSchema
 
+from utils.bulk_load import get_bulk_loader
 from utils.database.ensure_db import ensure_database_and_schema
+from utils.database.merge import merge_from_staging
+from utils.database.minimal_logging import alter_minimal_logging
+from utils.database.swap import (
+    drop_shadow_tables,
+    new_run_id,
+    shadow_table_name,
+    swap_table,
+)
 from utils.database.identifiers import (
     mssql_bracket_escape,
+    quote_fqn,
     quote_ident,
     quote_truncate_target,
 )
+from utils.logging.metrics import TransferMetrics, timed, timed_iter
 
 
 logger = logging.getLogger("utils.parquet.upload_parquet")
@@ -64,9 +76,16 @@ def _parse_parquet_base_name(filename: str) -> str:
 
 
 def group_parquet_files(
-    input_dir: str, only_files: list[str] | None = None
+    input_dir: str,
+    only_files: list[str] | None = None,
+    table_files: Mapping[str, Sequence[str]] | None = None,
 ) -> dict[str, list[str]]:
-    """Scan input_dir and group parquet files by logical table base name."""
+    """
+    Scan input_dir and group parquet files by logical table base name.
+
+    With table_files (the "tables" of a manifest), files listed there are
+    grouped under that table instead of the table parsed from their name.
+    """
 
     input_path = Path(input_dir)
     if not input_path.exists():
@@ -78,19 +97,23 @@ def group_parquet_files(
         raise RuntimeError(f"Parquet input path is not a directory: {input_path}")
 
     grouped: dict[str, list[str]] = defaultdict(list)
+    listed: dict[str, str] = {}
+    for table, fnames in (table_files or {}).items():
+        for fname in fnames:
+            listed[fname] = _sanitize_table_name(table)
     if only_files is not None:
         for fname in only_files:
             if not fname.lower().endswith(".parquet"):
                 continue
             path = Path(input_dir, fname)
             if path.is_file():
-                base = _parse_parquet_base_name(fname)
+                base = listed.get(fname) or _parse_parquet_base_name(fname)
                 grouped[base].append(fname)
     else:
         for fname in os.listdir(input_dir):
             path = Path(input_dir, fname)
             if fname.lower().endswith(".parquet") and path.is_file():
-                base = _parse_parquet_base_name(fname)
+                base = listed.get(fname) or _parse_parquet_base_name(fname)
                 grouped[base].append(fname)
 
     for k in list(grouped.keys()):
@@ -152,6 +175,97 @@ def _collect_decimal_metadata(file_paths: list[str]) -> dict[str, tuple[int, int
     return meta
 
 
+def _iter_parquet_frames(paths: list[str]) -> Iterator[pl.DataFrame]:
+    """
+    Read parquet parts as frames: a file per frame, or a row group per frame
+    for files with several row groups (written with PARQUET_FILE_MAX_MB).
+    """
+    for index, path in enumerate(paths):
+        logger.debug("   Processing part %d/%d: %s", index + 1, len(paths), path)
+        parquet_file = pq.ParquetFile(path)
+        try:
+            if parquet_file.num_row_groups <= 1:
+                # glob=False: brackets in file names are not glob patterns
+                yield pl.read_parquet(path, glob=False)
+                continue
+            for group in range(parquet_file.num_row_groups):
+                yield pl.from_arrow(parquet_file.read_row_group(group))  # type: ignore[misc]
+        finally:
+            parquet_file.close()
+
+
+def _strip_nul(df: pl.DataFrame) -> pl.DataFrame:
+    """Remove NUL bytes from string columns (PostgreSQL text cannot store them)."""
+    string_cols: list[str] = []
+    for col_name, dtype in zip(df.columns, df.dtypes):
+        if str(dtype) in ("Utf8", "String"):
+            string_cols.append(col_name)
+    if string_cols:
+        df = df.with_columns(
+            [pl.col(c).str.replace_all("\x00", "").alias(c) for c in string_cols]
+        )
+    return df
+
+
+def _write_database(
+    df: pl.DataFrame,
+    engine: Any,
+    table_name: str,
+    *,
+    schema: str | None,
+    mode: str,
+    engine_options: dict[str, Any] | None,
+) -> None:
+    """Write a frame via polars/SQLAlchemy, retrying without unsupported kwargs."""
+    write_kwargs: dict[str, Any] = dict(
+        table_name=table_name,
+        connection=engine,
+        if_table_exists=mode,
+        engine="sqlalchemy",
+        engine_options=engine_options,
+    )
+    if schema is not None:
+        write_kwargs["schema"] = schema
+
+    try:
+        df.write_database(**write_kwargs)  # type: ignore[arg-type]
+    except TypeError as e:
+        dname = engine.dialect.name.lower()
+        if schema is not None and dname == "postgresql":
+            try:
+                write_kwargs.pop("schema", None)
+                with engine.begin() as conn:
+                    try:
+                        conn.execute(
+                            text("SET search_path TO :schema, public"),
+                            {"schema": schema},
+                        )
+                    except Exception:
+                        conn.execute(
+                            text(
+                                f"SET search_path TO {quote_ident(engine, schema)}, public"
+                            )
+                        )
+                    write_kwargs["connection"] = conn
+                    df.write_database(**write_kwargs)  # type: ignore[arg-type]
+                    return
+            except TypeError:
+                pass
+            except Exception:
+                pass
+
+        for drop_key in ("schema", "dtype"):
+            if drop_key in write_kwargs:
+                write_kwargs.pop(drop_key, None)
+                try:
+                    df.write_database(**write_kwargs)  # type: ignore[arg-type]
+                    break
+                except TypeError:
+                    continue
+        else:
+            raise e
+
+
 def upload_parquet(
     engine: Any,
     schema: str | None = None,
@@ -159,18 +273,63 @@ def upload_parquet(
     cleanup: bool = True,
     manifest_path: str | None = None,
     *,
-    write_mode: str = "replace",  # replace | truncate | append
+    write_mode: str = "replace",  # replace | truncate | append | merge
     admin_database: str | None = None,
     lower_table_names: bool = False,
+    bulk_load: bool = True,
+    bulk_load_options: dict[str, Any] | None = None,
+    table_write_modes: Mapping[str, str] | None = None,
+    merge_keys: Mapping[str, Sequence[str]] | None = None,
+    on_table_loaded: Callable[[str], None] | None = None,
+    shadow_load: bool = False,
+    minimal_logging: bool = False,
+    metrics: TransferMetrics | None = None,
+    table_files: Mapping[str, Sequence[str]] | None = None,
 ):
-    """Upload (possibly chunked) Parquet files into a destination database."""
+    """
+    Upload (possibly chunked) Parquet files into a destination database.
+
+    The files are taken from the manifest at `manifest_path`, or from
+    `table_files` (table -> file names in input_dir, e.g. one table handed
+    over by utils.parquet.upload_pipeline), or else from all files in input_dir.
+
+    With `bulk_load` enabled, parts are loaded through the dialect's native bulk
+    loader (e.g. PostgreSQL COPY, SQL Server fast_executemany) when one is
+    available, configured by `bulk_load_options`; the table itself is
+    still created by polars so DDL and dtype overrides stay identical. On a
+    bulk-load error the upload falls back to regular inserts.
+
+    `table_write_modes` overrides write_mode per table. With "merge", the parts
+    are loaded into `<table>__delta` and merged into the existing table by the
+    table's `merge_keys` (a missing table is simply created). `on_table_loaded`
+    is called with the table name once a table has been uploaded.
 
-    if write_mode.lower() not in {"replace", "truncate", "append"}:
-        raise ValueError("write_mode must be one of: replace|truncate|append")
+    With `shadow_load`, tables in "replace" mode are uploaded into
+    `<table>__load_<runid>` and swapped into place after their last part, so
+    the existing table stays readable during the upload.
+
+    With `minimal_logging`, tables created by the upload are switched to
+    UNLOGGED (PostgreSQL) or NOLOGGING (Oracle) before any rows are written.
+
+    Every part is timed as read (parquet file) and write (destination); a line
+    per table logs the breakdown, and the timings are collected in `metrics`
+    (see utils.logging.metrics).
+    """
+
+    valid_modes = {"replace", "truncate", "append", "merge"}
+    if write_mode.lower() not in valid_modes:
+        raise ValueError("write_mode must be one of: replace|truncate|append|merge")
+    for mode_override in (table_write_modes or {}).values():
+        if mode_override not in valid_modes:
+            raise ValueError("write_mode must be one of: replace|truncate|append|merge")
     write_mode = write_mode.lower()
     dialect = engine.dialect.name.lower()
 
     manifest_files: list[str] | None = None
+    manifest_tables: dict[str, list[str]] | None = None
+    if table_files is not None and not manifest_path:
+        manifest_tables = {t: list(fl) for t, fl in table_files.items()}
+        manifest_files = [f for fl in manifest_tables.values() for f in fl]
     if manifest_path:
         try:
             with open(manifest_path, "r", encoding="utf-8") as f:
@@ -187,6 +346,10 @@ def upload_parquet(
                 f"Manifest {manifest_path} missing 'files' list; aborting to avoid scanning stale directory contents."
             )
         manifest_files = [str(x) for x in files]
+        if isinstance(manifest.get("tables"), dict):
+            manifest_tables = {
+                str(t): [str(x) for x in fl] for t, fl in manifest["tables"].items()
+            }
         if mf_dir and os.path.isabs(mf_dir):
             if os.path.abspath(input_dir) != os.path.abspath(mf_dir):
                 logger.warning(
@@ -197,7 +360,9 @@ def upload_parquet(
 
     ensure_database_and_schema(engine, schema, admin_database=admin_database)
 
-    grouped = group_parquet_files(input_dir, only_files=manifest_files)
+    grouped = group_parquet_files(
+        input_dir, only_files=manifest_files, table_files=manifest_tables
+    )
 
     remaining_files = {fname for flist in grouped.values() for fname in flist}
 
@@ -212,6 +377,14 @@ def upload_parquet(
 
     logger.info("Uploading %d table(s) to database", total_tables)
 
+    loader = (
+        get_bulk_loader(engine, {**(bulk_load_options or {}), "write_mode": write_mode})
+        if bulk_load
+        else None
+    )
+    shadow_run_id = new_run_id() if shadow_load else None
+    metrics = metrics if metrics is not None else TransferMetrics()
+
     try:
         for table_idx, (table_name, files) in enumerate(grouped.items(), start=1):
             logical_table = table_name.lower() if lower_table_names else table_name
@@ -233,9 +406,30 @@ def upload_parquet(
             except Exception:
                 table_exists = False
 
-            if write_mode == "truncate" and table_exists:
-                from sqlalchemy import MetaData, Table
+            table_mode = (table_write_modes or {}).get(table_name, write_mode)
+            load_table = logical_table
+            if table_mode == "merge":
+                if table_exists:
+                    keys = list((merge_keys or {}).get(table_name) or [])
+                    if not keys:
+                        raise ValueError(
+                            f"write_mode merge needs merge keys for table {table_name!r}"
+                        )
+                    # The parts go into a fresh side table that is merged afterwards
+                    load_table = f"{logical_table}__delta"
+                    table_exists = False
+                table_mode = "replace"
+            shadow = (
+                table_mode == "replace"
+                and load_table == logical_table
+                and shadow_run_id is not None
+            )
+            if shadow:
+                load_table = shadow_table_name(logical_table, shadow_run_id)
+                drop_shadow_tables(engine, schema=schema, target=logical_table)
+                logger.info("   (loading into shadow table %s)", load_table)
 
+            if table_mode == "truncate" and table_exists:
                 with engine.begin() as conn:
                     dname = engine.dialect.name.lower()
                     if dname == "sqlite":
@@ -264,26 +458,20 @@ def upload_parquet(
             )
 
             table_rows = 0  # Track rows for this table
-            for idx, fname in enumerate(files):
-                path = os.path.join(input_dir, fname)
-                logger.debug("   Processing part %d/%d: %s", idx + 1, len(files), fname)
-                # Use glob=False to prevent brackets in filenames being treated as glob patterns
-                df = pl.read_parquet(path, glob=False)
+            table_started = time.perf_counter()
+            table_metrics = metrics.table("upload_parquet", logical_table)
+            target: Table | None = None
+            chunks = _iter_parquet_frames(
+                [os.path.join(input_dir, fname) for fname in files]
+            )
+            for idx, df in enumerate(timed_iter(chunks, table_metrics, "read")):
+                table_metrics.add_chunk(len(df), df.estimated_size())
                 table_rows += len(df)
                 df = df.rename({col: col.lower() for col in df.columns})
 
-                if dialect == "postgresql":
-                    string_cols: list[str] = []
-                    for col_name, dtype in zip(df.columns, df.dtypes):
-                        if str(dtype) in ("Utf8", "String"):
-                            string_cols.append(col_name)
-                    if string_cols:
-                        df = df.with_columns(
-                            [
-                                pl.col(c).str.replace_all("\x00", "").alias(c)
-                                for c in string_cols
-                            ]
-                        )
+                if dialect == "postgresql" and loader is None:
+                    # The COPY loader strips NUL itself
+                    df = _strip_nul(df)
 
                 dtype_map: dict[str, Any] = {}
 
@@ -379,9 +567,9 @@ def upload_parquet(
                             pass
 
                 if idx == 0:
-                    if write_mode == "replace":
+                    if table_mode == "replace":
                         mode = "replace"
-                    elif write_mode == "append":
+                    elif table_mode == "append":
                         mode = "append" if table_exists else "replace"
                     else:
                         mode = "append" if table_exists else "replace"
@@ -392,57 +580,99 @@ def upload_parquet(
                     {"dtype": dtype_map} if dtype_map else None
                 )
 
-                write_kwargs: dict[str, Any] = dict(
-                    table_name=logical_table,
-                    connection=engine,
-                    if_table_exists=mode,
-                    engine="sqlalchemy",
-                    engine_options=engine_options,
-                )
-                if schema is not None:
-                    write_kwargs["schema"] = schema
+                if minimal_logging and mode != "append":
+                    # Create the table empty and unlogged before the first rows
+                    _write_database(
+                        df.head(0),
+                        engine,
+                        load_table,
+                        schema=schema,
+                        mode=mode,
+                        engine_options=engine_options,
+                    )
+                    with engine.begin() as conn:
+                        alter_minimal_logging(
+                            conn,
+                            dialect,
+                            quote_fqn(
+                                engine,
+                                [schema, load_table] if schema else [load_table],
+                            ),
+                        )
+                    mode = "append"
 
-                try:
-                    df.write_database(**write_kwargs)  # type: ignore[arg-type]
-                except TypeError as e:
-                    dname = engine.dialect.name.lower()
-                    if schema is not None and dname == "postgresql":
+                with timed(table_metrics, "write"):
+                    if loader is not None:
                         try:
-                            write_kwargs.pop("schema", None)
+                            if mode != "append":
+                                # Let write_database create the table (same DDL and
+                                # dtype overrides as the regular path), then COPY into it
+                                _write_database(
+                                    df.head(0),
+                                    engine,
+                                    load_table,
+                                    schema=schema,
+                                    mode=mode,
+                                    engine_options=engine_options,
+                                )
+                                mode = "append"
+                            if target is None:
+                                target = Table(
+                                    load_table,
+                                    MetaData(),
+                                    schema=schema,
+                                    autoload_with=engine,
+                                )
                             with engine.begin() as conn:
-                                try:
-                                    conn.execute(
-                                        text("SET search_path TO :schema, public"),
-                                        {"schema": schema},
-                                    )
-                                except Exception:
-                                    conn.execute(
-                                        text(
-                                            f"SET search_path TO {quote_ident(engine, schema)}, public"
-                                        )
-                                    )
-                                write_kwargs["connection"] = conn
-                                df.write_database(**write_kwargs)  # type: ignore[arg-type]
-                                continue
-                        except TypeError:
-                            pass
-                        except Exception:
-                            pass
-
-                    for drop_key in ("schema", "dtype"):
-                        if drop_key in write_kwargs:
-                            write_kwargs.pop(drop_key, None)
-                            try:
-                                df.write_database(**write_kwargs)  # type: ignore[arg-type]
-                                break
-                            except TypeError:
-                                continue
-                    else:
-                        raise e
+                                loaded = loader.load_arrow(conn, target, df.to_arrow())
+                            # Rows rejected by Oracle batch errors are not counted
+                            table_rows -= len(df) - loaded
+                            continue
+                        except Exception as e:
+                            logger.warning(
+                                "Bulk load into %s failed (%s); falling back to regular inserts",
+                                full_table,
+                                e,
+                            )
+                            loader = None
+                            if dialect == "postgresql":
+                                df = _strip_nul(df)
+
+                    _write_database(
+                        df,
+                        engine,
+                        load_table,
+                        schema=schema,
+                        mode=mode,
+                        engine_options=engine_options,
+                    )
+
+            if shadow:
+                swap_table(
+                    engine, schema=schema, target=logical_table, shadow=load_table
+                )
+            elif load_table != logical_table:
+                merge_from_staging(
+                    engine,
+                    schema=schema,
+                    target=logical_table,
+                    staging=load_table,
+                    key_columns=keys,
+                )
 
-            logger.info("   -> %s: %s rows uploaded", logical_table, f"{table_rows:,}")
+            # Timing and load path make BULK_LOAD on/off runs comparable
+            logger.info(
+                "   -> %s: %s rows uploaded in %.1fs (%s)",
+                logical_table,
+                f"{table_rows:,}",
+                time.perf_counter() - table_started,
+                loader.name if loader is not None else "insert",
+            )
+            metrics.log_table(table_metrics)
             tables_uploaded += 1
             total_rows_uploaded += table_rows
+            if on_table_loaded is not None:
+                on_table_loaded(table_name)
 
             if cleanup:
                 for fname in files:
@@ -0,0 +1,109 @@
+"""Upload dumped tables while the dump continues (PIPELINED_UPLOAD).
+
+Without a pipeline, a dump mode first writes the parquet files of all tables
+and only then uploads them: the destination is idle during the extraction and
+the data directory grows to the full dataset. `UploadPipeline` hands every
+table to an uploader thread as soon as its files are complete, through a
+bounded queue; the upload deletes the files once the table is loaded (with
+CLEANUP_PARQUET_FILES). When the queue is full the dump waits, so at most
+about ``queue_size + 2`` tables are on disk (queued, uploading and the one
+being dumped) and the total time approaches max(extract, load).
+
+Tables are handed over whole rather than per part: decimal precision is
+unified over all files of a table, and shadow loads and merges complete once
+per table.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from typing import Callable, Sequence
+
+logger = logging.getLogger("utils.parquet.upload_pipeline")
+
+_DONE = object()
+
+
+class UploadPipeline:
+    """
+    Run `upload(table, files)` for each submitted table on a worker thread.
+
+    - `submit` blocks while `queue_size` tables are already waiting.
+    - After a failed upload the remaining tables are skipped; the error is
+      re-raised by the next `submit` or by `close`.
+    - As a context manager, a clean exit waits for all uploads; an exception
+      stops the worker after its current upload without masking the error.
+    - `on_done(table)` runs after every table, uploaded or skipped (e.g. to
+      release its disk budget, see utils.parquet.spill).
+    """
+
+    def __init__(
+        self,
+        upload: Callable[[str, list[str]], None],
+        *,
+        queue_size: int = 1,
+        on_done: Callable[[str], None] | None = None,
+        name: str = "upload-pipeline",
+    ):
+        self._upload = upload
+        self._on_done = on_done
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._error: BaseException | None = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _DONE:
+                return
+            table, files = item
+            try:
+                if self._error is None and not self._stop.is_set():
+                    self._upload(table, files)
+                # else: drain, so a blocked submit() can return
+            except BaseException as e:  # re-raised in the submitting thread
+                logger.error("Pipelined upload of %s failed: %s", table, e)
+                self._error = e
+            finally:
+                if self._on_done is not None:
+                    self._on_done(table)
+
+    def _raise(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def submit(self, table: str, files: Sequence[str]) -> None:
+        """Queue the finished files of `table` for upload (tables without files are skipped)."""
+        self._raise()
+        if not files:
+            return
+        self._queue.put((table, list(files)))
+        logger.debug("Queued %s for upload (%d file(s))", table, len(files))
+
+    def close(self) -> None:
+        """Wait until every queued table has been uploaded."""
+        self._queue.put(_DONE)
+        self._thread.join()
+        self._raise()
+
+    def abort(self) -> None:
+        """Skip the queued tables and wait for the current upload to finish."""
+        self._stop.set()
+        self._queue.put(_DONE)
+        self._thread.join()
+
+    def __enter__(self) -> "UploadPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+__all__ = ["UploadPipeline"]
@@ -0,0 +1,151 @@
+"""Parquet write settings shared by all dump paths.
+
+sql_to_staging and odata_to_staging write their dump files with the same
+settings, read from the [settings] section:
+
+- PARQUET_COMPRESSION: zstd (default), lz4, snappy, gzip or none
+- PARQUET_COMPRESSION_LEVEL: codec level (zstd 1-22, gzip 1-9); 0 = library default
+- PARQUET_ROW_GROUP_SIZE: maximum rows per row group; 0 = library default
+- PARQUET_DICTIONARY: dictionary encoding of columns (default true)
+- PARQUET_STATISTICS: min/max/null-count statistics per column (default true)
+
+The defaults are those of `polars.DataFrame.write_parquet`, so without
+settings the files are written exactly as before. See
+utils/parquet/benchmark_parquet_codecs.py to compare the codecs on your data.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, cast
+
+import polars as pl
+
+from utils.config.get_config_value import get_config_value
+
+# Codecs with their valid compression levels (None: the codec has no levels)
+CODECS: dict[str, range | None] = {
+    "zstd": range(1, 23),
+    "lz4": None,
+    "snappy": None,
+    "gzip": range(1, 10),
+    "none": None,
+}
+
+
+@dataclass(frozen=True)
+class ParquetWriteOptions:
+    """Validated Parquet write settings; `none`/`uncompressed` mean no compression."""
+
+    compression: str = "zstd"
+    compression_level: int | None = None
+    row_group_size: int | None = None
+    use_dictionary: bool = True
+    statistics: bool = True
+
+    def __post_init__(self) -> None:
+        codec = self.compression.lower()
+        if codec == "uncompressed":
+            codec = "none"
+        if codec not in CODECS:
+            raise ValueError(
+                f"PARQUET_COMPRESSION must be one of {sorted(CODECS)}; got {self.compression!r}"
+            )
+        object.__setattr__(self, "compression", codec)
+        levels = CODECS[codec]
+        if self.compression_level is not None and (
+            levels is None or self.compression_level not in levels
+        ):
+            raise ValueError(
+                f"PARQUET_COMPRESSION_LEVEL {self.compression_level} is not valid for {codec}"
+            )
+        if self.row_group_size is not None and self.row_group_size <= 0:
+            raise ValueError("PARQUET_ROW_GROUP_SIZE must be > 0")
+
+    def write(self, df: pl.DataFrame, path: str | Path) -> None:
+        """Write `df` to `path` with these settings."""
+        codec = "uncompressed" if self.compression == "none" else self.compression
+        df.write_parquet(
+            path,
+            compression=codec,  # type: ignore[arg-type]
+            compression_level=self.compression_level,
+            statistics=self.statistics,
+            row_group_size=self.row_group_size,
+            # The native polars writer always dictionary-encodes; pyarrow can opt out
+            use_pyarrow=not self.use_dictionary,
+            pyarrow_options=None if self.use_dictionary else {"use_dictionary": False},
+        )
+
+    def pyarrow_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for `pyarrow.parquet.ParquetWriter`."""
+        return {
+            "compression": None if self.compression == "none" else self.compression,
+            "compression_level": self.compression_level,
+            "use_dictionary": self.use_dictionary,
+            "write_statistics": self.statistics,
+        }
+
+
+def parquet_write_options_from_config(cfg: Any) -> ParquetWriteOptions:
+    """Read the PARQUET_* write settings from the [settings] section."""
+    compression = cast(
+        str,
+        get_config_value(
+            "PARQUET_COMPRESSION",
+            section="settings",
+            cfg_parser=cfg,
+            default="zstd",
+            cast_type=str,
+        ),
+    )
+    level = cast(
+        int,
+        get_config_value(
+            "PARQUET_COMPRESSION_LEVEL",
+            section="settings",
+            cfg_parser=cfg,
+            default=0,
+            cast_type=int,
+        ),
+    )
+    row_group_size = cast(
+        int,
+        get_config_value(
+            "PARQUET_ROW_GROUP_SIZE",
+            section="settings",
+            cfg_parser=cfg,
+            default=0,
+            cast_type=int,
+        ),
+    )
+    use_dictionary = cast(
+        bool,
+        get_config_value(
+            "PARQUET_DICTIONARY",
+            section="settings",
+            cfg_parser=cfg,
+            default=True,
+            cast_type=bool,
+        ),
+    )
+    statistics = cast(
+        bool,
+        get_config_value(
+            "PARQUET_STATISTICS",
+            section="settings",
+            cfg_parser=cfg,
+            default=True,
+            cast_type=bool,
+        ),
+    )
+    return ParquetWriteOptions(
+        compression=str(compression),
+        compression_level=level or None,
+        row_group_size=row_group_size or None,
+        use_dictionary=use_dictionary,
+        statistics=statistics,
+    )
+
+
+__all__ = ["CODECS", "ParquetWriteOptions", "parquet_write_options_from_config"]
@@ -0,0 +1,79 @@
+# Tests for the SQL Server fast_executemany bulk loader
+# Focuses on input sizes derived from column types, TABLOCK hints and cursor configuration
+# This ensures batches are sent as typed parameter arrays instead of row-by-row inserts
+
+import pyarrow as pa
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Integer,
+    Numeric,
+    String,
+    Table,
+    Text,
+)
+from sqlalchemy.dialects import mssql
+
+from tests.fake_dbapi import FakeConnection, items_table
+from utils.bulk_load.mssql import (
+    SQL_BIT,
+    SQL_DECIMAL,
+    SQL_INTEGER,
+    SQL_TYPE_TIMESTAMP,
+    SQL_WVARCHAR,
+    MssqlFastExecutemanyLoader,
+    input_size_for,
+)
+
+
+def _target() -> Table:
+    return items_table(
+        Column("id", Integer),
+        Column("name", String(50)),
+        Column("note", Text),
+        Column("amount", Numeric(18, 4)),
+        Column("active", Boolean),
+        Column("ts", mssql.DATETIME2(precision=6)),
+    )
+
+
+def test_input_sizes_follow_column_types():
+    sizes = [input_size_for(c.type) for c in _target().columns]
+    assert sizes == [
+        (SQL_INTEGER, 0, 0),
+        (SQL_WVARCHAR, 50, 0),
+        (SQL_WVARCHAR, 0, 0),
+        (SQL_DECIMAL, 18, 4),
+        (SQL_BIT, 0, 0),
+        (SQL_TYPE_TIMESTAMP, 26, 6),
+    ]
+    assert input_size_for(DateTime()) == (SQL_TYPE_TIMESTAMP, 23, 3)
+    assert input_size_for(mssql.DATETIMEOFFSET()) is None
+
+
+def test_load_rows_uses_fast_executemany_and_tablock():
+    conn = FakeConnection(mssql.dialect())
+    loader = MssqlFastExecutemanyLoader(tablock=True)
+    n = loader.load_rows(
+        conn,  # type: ignore[arg-type]
+        _target(),
+        [{"id": 1, "name": "a"}, {"id": 2, "name": None, "active": True}],
+    )
+    assert n == 2
+    (sizes,), (sql, params) = [c.args for c in conn.calls]
+    assert conn.cursors[0].fast_executemany is True
+    assert len(sizes) == 6
+    assert sql.startswith("INSERT INTO stg.items WITH (TABLOCK) (id, name, note")
+    assert params[1] == (2, None, None, None, True, None)
+
+
+def test_load_arrow_only_binds_present_columns():
+    conn = FakeConnection(mssql.dialect())
+    data = pa.table({"name": ["x", "y"], "id": [1, 2]})
+    n = MssqlFastExecutemanyLoader().load_arrow(conn, _target(), data)  # type: ignore[arg-type]
+    assert n == 2
+    (sizes,), (sql, params) = [c.args for c in conn.calls]
+    assert "TABLOCK" not in sql
+    assert sizes == [(SQL_INTEGER, 0, 0), (SQL_WVARCHAR, 50, 0)]
+    assert params == [(1, "x"), (2, "y")]
@@ -0,0 +1,125 @@
+# Tests for the Oracle array-DML bulk loader
+# Focuses on setinputsizes mapping, APPEND_VALUES direct-path gating and batch error handling
+# This ensures Oracle staging loads use array binds and only go direct-path into emptied tables
+
+from types import SimpleNamespace
+
+import oracledb
+import pyarrow as pa
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Integer,
+    String,
+    Table,
+    Text,
+    create_engine,
+    text,
+)
+from sqlalchemy.dialects import oracle
+
+from sql_to_staging.functions.direct_transfer import direct_transfer
+from tests.fake_dbapi import FakeConnection, items_table
+from utils.bulk_load import BulkLoader
+from utils.bulk_load.oracle import OracleArrayDmlLoader, _factory, input_size_for
+
+
+def _target() -> Table:
+    return items_table(
+        Column("id", oracle.NUMBER(10, 0)),
+        Column("name", oracle.VARCHAR2(40)),
+        Column("body", oracle.CLOB()),
+        Column("score", oracle.BINARY_DOUBLE()),
+        Column("flag", Boolean),
+        Column("ts", oracle.TIMESTAMP()),
+        schema=None,
+    )
+
+
+def test_input_sizes_follow_column_types():
+    sizes = [input_size_for(c.type) for c in _target().columns]
+    assert sizes == [
+        oracledb.DB_TYPE_NUMBER,
+        40,
+        oracledb.DB_TYPE_LONG,
+        oracledb.DB_TYPE_BINARY_DOUBLE,
+        oracledb.DB_TYPE_NUMBER,
+        oracledb.DB_TYPE_TIMESTAMP,
+    ]
+    assert input_size_for(Integer()) == oracledb.DB_TYPE_NUMBER
+    assert input_size_for(String()) == oracledb.DB_TYPE_LONG
+    assert input_size_for(Text()) == oracledb.DB_TYPE_LONG
+
+
+def test_load_rows_direct_path_and_bool_binds():
+    conn = FakeConnection(oracle.dialect())
+    loader = OracleArrayDmlLoader(direct_path=True)
+    n = loader.load_rows(
+        conn,  # type: ignore[arg-type]
+        _target(),
+        [{"id": 1, "name": "a", "flag": True}, {"id": 2, "flag": False}],
+    )
+    assert n == 2
+    setinputsizes, executemany = conn.calls
+    sizes = setinputsizes.args
+    sql, params = executemany.args
+    kwargs = executemany.kwargs
+    assert len(sizes) == 6
+    assert sql.startswith("INSERT /*+ APPEND_VALUES */ INTO items (id, name, body")
+    assert sql.endswith("VALUES (:1, :2, :3, :4, :5, :6)")
+    assert params[0] == (1, "a", None, None, 1, None)
+    assert kwargs == {}
+
+
+def test_load_arrow_with_batch_errors_counts_rejected_rows():
+    errors = [SimpleNamespace(offset=1, message="ORA-12899: value too large")]
+    conn = FakeConnection(oracle.dialect(), batch_errors=errors)
+    data = pa.table({"id": [1, 2, 3], "name": ["a", "b" * 50, "c"]})
+    n = OracleArrayDmlLoader(batch_errors=True).load_arrow(conn, _target(), data)  # type: ignore[arg-type]
+    assert n == 2
+    (executemany,) = conn.called("executemany")
+    sql, params = executemany.args
+    kwargs = executemany.kwargs
+    assert "APPEND_VALUES" not in sql
+    assert kwargs == {"batcherrors": True}
+    assert params[2] == (3, "c")
+
+
+def test_factory_only_uses_direct_path_for_emptied_tables():
+    engine = SimpleNamespace(dialect=SimpleNamespace(driver="oracledb"))
+    loader = _factory(engine, {"direct_path": True, "write_mode": "truncate"})  # type: ignore[arg-type]
+    assert loader is not None and loader.direct_path is True
+    loader = _factory(engine, {"direct_path": True, "write_mode": "append"})  # type: ignore[arg-type]
+    assert loader is not None and loader.direct_path is False
+
+
+def test_direct_transfer_counts_rows_written_by_the_loader(tmp_path, monkeypatch):
+    src = create_engine(f"sqlite+pysqlite:///{tmp_path / 'src.sqlite'}")
+    dst = create_engine(f"sqlite+pysqlite:///{tmp_path / 'dst.sqlite'}")
+    with src.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(
+            text("INSERT INTO items (id, name) VALUES (:id, 'x')"),
+            [{"id": i} for i in range(1, 13)],
+        )
+
+    class _RejectingLoader(BulkLoader):
+        """Inserts odd IDs only, like a loader with batch errors."""
+
+        name = "rejecting"
+
+        def load_rows(self, conn, table, rows):
+            kept = [r for r in rows if r["id"] % 2]
+            conn.execute(table.insert(), kept)
+            return len(kept)
+
+    monkeypatch.setattr(
+        "sql_to_staging.functions.direct_transfer.get_bulk_loader",
+        lambda engine, options=None: _RejectingLoader(),
+    )
+    results = direct_transfer(src, dst, ["items"], chunk_size=5)
+
+    # Rejected rows are not reported as inserted
+    assert results[0].rows == 6
+    with dst.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 6
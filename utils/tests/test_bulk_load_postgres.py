@@ -0,0 +1,162 @@
+# Tests for the native bulk load path (PostgreSQL COPY loader and its callers)
+# Focuses on COPY CSV rendering (NULL vs empty string, NUL bytes, binary) and loader fallback
+# This ensures bulk-loaded data matches the regular INSERT path and failures degrade gracefully
+
+from datetime import datetime
+from pathlib import Path
+
+import polars as pl
+import pyarrow as pa
+from sqlalchemy import Column, Integer, String, Table, create_engine, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import DBAPIError
+
+from tests.fake_dbapi import FakeConnection, items_table
+from utils.bulk_load import BulkLoader, get_bulk_loader
+from utils.bulk_load.postgres import PostgresCopyLoader, rows_to_csv
+from utils.parquet.upload_parquet import upload_parquet
+
+
+def _target() -> Table:
+    return items_table(
+        Column("id", Integer), Column("name", String), Column("payload", String)
+    )
+
+
+def test_rows_to_csv_null_empty_nul_and_types():
+    out = rows_to_csv(
+        [
+            {"a": None, "b": "", "c": 'x"\x00y'},
+            {"a": True, "b": b"\x01\xff", "c": datetime(2024, 1, 2, 3, 4, 5)},
+        ],
+        ["a", "b", "c"],
+    )
+    assert out.splitlines() == [
+        ',"","x""y"',
+        "t,\\x01ff,2024-01-02 03:04:05",
+    ]
+
+
+def test_copy_loader_load_rows_builds_copy_statement():
+    conn = FakeConnection(postgresql.dialect())
+    n = PostgresCopyLoader().load_rows(
+        conn,  # type: ignore[arg-type]
+        _target(),
+        [{"id": 1, "name": "a", "payload": None}],
+    )
+    assert n == 1
+    ((sql, data),) = [c.args for c in conn.called("copy_expert")]
+    assert sql == "COPY stg.items (id, name, payload) FROM STDIN WITH (FORMAT csv)"
+    assert data == '1,"a",\n'
+
+
+def test_copy_loader_load_arrow_strips_nul_and_selects_columns():
+    conn = FakeConnection(postgresql.dialect())
+    data = pa.table(
+        {
+            "name": pa.array(["a\x00b", None], type=pa.large_string()),
+            "id": [1, 2],
+            "extra": [9, 9],
+        }
+    )
+    n = PostgresCopyLoader().load_arrow(conn, _target(), data)  # type: ignore[arg-type]
+    assert n == 2
+    ((sql, csv),) = [c.args for c in conn.called("copy_expert")]
+    # Only columns present in both the data and the table, in table order
+    assert "(id, name)" in sql
+    assert csv.splitlines() == ['1,"ab"', "2,"]
+
+
+def test_get_bulk_loader_none_without_native_path(tmp_path: Path):
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'x.sqlite'}")
+    assert get_bulk_loader(engine) is None
+
+
+class _RecordingLoader(BulkLoader):
+    name = "recording"
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = 0
+
+    def load_arrow(self, conn, table, data):
+        self.calls += 1
+        if self.fail:
+            raise DBAPIError("COPY", None, Exception("boom"))
+        conn.execute(table.insert(), data.to_pylist())
+        return data.num_rows
+
+
+def _write_parts(input_dir: Path) -> None:
+    input_dir.mkdir()
+    pl.DataFrame({"ID": [1, 2], "Name": ["a", "b"]}).write_parquet(
+        input_dir / "items_part0000.parquet"
+    )
+    pl.DataFrame({"ID": [3], "Name": ["c"]}).write_parquet(
+        input_dir / "items_part0001.parquet"
+    )
+
+
+def test_upload_parquet_uses_bulk_loader(tmp_path: Path, monkeypatch):
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'dst.sqlite'}")
+    _write_parts(tmp_path / "data")
+    loader = _RecordingLoader()
+    monkeypatch.setattr(
+        "utils.parquet.upload_parquet.get_bulk_loader",
+        lambda engine, options=None: loader,
+    )
+
+    upload_parquet(engine, input_dir=str(tmp_path / "data"), cleanup=False)
+
+    assert loader.calls == 2
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT id, name FROM items ORDER BY id")).all()
+    assert [tuple(r) for r in rows] == [(1, "a"), (2, "b"), (3, "c")]
+
+
+def test_upload_parquet_falls_back_when_bulk_load_fails(tmp_path: Path, monkeypatch):
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'dst.sqlite'}")
+    _write_parts(tmp_path / "data")
+    loader = _RecordingLoader(fail=True)
+    monkeypatch.setattr(
+        "utils.parquet.upload_parquet.get_bulk_loader",
+        lambda engine, options=None: loader,
+    )
+
+    upload_parquet(engine, input_dir=str(tmp_path / "data"), cleanup=False)
+
+    # The loader is dropped after the first failure
+    assert loader.calls == 1
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar_one() == 3
+
+
+def test_direct_transfer_falls_back_when_bulk_load_fails(tmp_path: Path, monkeypatch):
+    from sql_to_staging.functions.direct_transfer import direct_transfer
+
+    src = create_engine(f"sqlite+pysqlite:///{tmp_path / 'src.sqlite'}")
+    dst = create_engine(f"sqlite+pysqlite:///{tmp_path / 'dst.sqlite'}")
+    with src.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(
+            text("INSERT INTO items (id, name) VALUES (1, 'a'), (2, 'b'), (3, 'c')")
+        )
+
+    class _FailingRowsLoader(BulkLoader):
+        name = "failing"
+        calls = 0
+
+        def load_rows(self, conn, table, rows):
+            type(self).calls += 1
+            raise DBAPIError("COPY", None, Exception("boom"))
+
+    monkeypatch.setattr(
+        "sql_to_staging.functions.direct_transfer.get_bulk_loader",
+        lambda engine, options=None: _FailingRowsLoader(),
+    )
+
+    direct_transfer(src, dst, ["items"], chunk_size=2)
+
+    assert _FailingRowsLoader.calls == 1
+    with dst.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar_one() == 3
@@ -0,0 +1,30 @@
+# Tests for the dialect and SQL literal helpers used by raw catalog queries
+# Focuses on resolving engines and ConnectorX URIs to one dialect name and on literal quoting
+# This ensures catalog lookups build the same SQL for SQLAlchemy and ConnectorX sources
+
+from sqlalchemy import create_engine
+
+from utils.database.dialects import (
+    connectorx_scheme,
+    dialect_of,
+    scheme_dialect,
+    sql_literal,
+)
+
+
+def test_connectorx_scheme_drops_the_driver():
+    assert connectorx_scheme("postgresql+psycopg2://u:p@h/db") == "postgresql"
+    assert connectorx_scheme("MSSQL://u:p@h:1433/db") == "mssql"
+
+
+def test_dialect_of_engines_and_uris():
+    assert dialect_of(create_engine("sqlite://")) == "sqlite"
+    assert dialect_of("postgres://u:p@h:5432/db") == "postgresql"
+    assert dialect_of("mariadb://u:p@h/db") == "mysql"
+    assert dialect_of("sqlserver://u:p@h/db") == "mssql"
+    assert scheme_dialect("duckdb") == "duckdb"
+
+
+def test_sql_literal_doubles_quotes():
+    assert sql_literal("szukhis") == "'szukhis'"
+    assert sql_literal("O'Brien") == "'O''Brien'"
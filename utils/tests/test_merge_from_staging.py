@@ -0,0 +1,49 @@
+# Tests for utils.database.merge.merge_from_staging
+# Focuses on replacing matched rows, inserting new ones and dropping the staging table
+# This ensures incremental merges are portable DELETE + INSERT upserts keyed by the merge keys
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from utils.database.merge import merge_from_staging
+
+
+def _mk_engine(tmp_path: Path):
+    return create_engine(f"sqlite+pysqlite:///{tmp_path / 'db.sqlite'}")
+
+
+def test_merge_replaces_matches_and_inserts_new_rows(tmp_path: Path):
+    engine = _mk_engine(tmp_path)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INT, part INT, name TEXT, extra TEXT)"))
+        conn.execute(text("INSERT INTO t VALUES (1, 1, 'a', 'x'), (1, 2, 'b', 'x')"))
+        conn.execute(text("CREATE TABLE t__delta (ID INT, PART INT, NAME TEXT)"))
+        conn.execute(text("INSERT INTO t__delta VALUES (1, 2, 'B'), (2, 1, 'c')"))
+
+    inserted = merge_from_staging(
+        engine, schema=None, target="t", staging="t__delta", key_columns=["id", "part"]
+    )
+
+    assert inserted == 2
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT id, part, name FROM t ORDER BY id, part"))
+        assert [tuple(r) for r in rows] == [(1, 1, "a"), (1, 2, "B"), (2, 1, "c")]
+    assert not inspect(engine).has_table("t__delta")
+
+
+def test_merge_requires_known_key(tmp_path: Path):
+    engine = _mk_engine(tmp_path)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INT)"))
+        conn.execute(text("CREATE TABLE t__delta (id INT)"))
+
+    with pytest.raises(ValueError):
+        merge_from_staging(
+            engine, schema=None, target="t", staging="t__delta", key_columns=[]
+        )
+    with pytest.raises(ValueError):
+        merge_from_staging(
+            engine, schema=None, target="t", staging="t__delta", key_columns=["nope"]
+        )
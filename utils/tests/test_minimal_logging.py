@@ -0,0 +1,72 @@
+# Tests for minimally logged staging tables (MINIMAL_LOGGING)
+# Focuses on UNLOGGED DDL for PostgreSQL, NOLOGGING for Oracle and no-ops on other dialects
+# This ensures staging loads can skip WAL/redo without changing the table definitions
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import polars as pl
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, text
+from sqlalchemy.dialects import oracle, postgresql
+from sqlalchemy.schema import CreateTable
+
+from sql_to_staging.functions.direct_transfer import _build_destination_table
+from utils.database.minimal_logging import alter_minimal_logging
+from utils.parquet.upload_parquet import upload_parquet
+
+
+def _source() -> Table:
+    return Table("src", MetaData(), Column("id", Integer, nullable=False))
+
+
+def _build(dialect: str, minimal_logging: bool) -> Table:
+    return _build_destination_table(
+        _source(),
+        MetaData(),
+        "items",
+        None,
+        True,
+        source_dialect="sqlite",
+        dest_dialect=dialect,
+        minimal_logging=minimal_logging,
+    )
+
+
+def test_postgres_staging_table_is_unlogged():
+    ddl = str(
+        CreateTable(_build("postgresql", True)).compile(dialect=postgresql.dialect())
+    )
+    assert ddl.strip().startswith("CREATE UNLOGGED TABLE items")
+    plain = str(
+        CreateTable(_build("postgresql", False)).compile(dialect=postgresql.dialect())
+    )
+    assert "UNLOGGED" not in plain
+
+
+def test_oracle_nologging_after_create_and_alter():
+    table = _build("oracle", True)
+    create = table.dispatch.after_create
+    assert len(create) == 1
+    assert "UNLOGGED" not in str(CreateTable(table).compile(dialect=oracle.dialect()))
+
+    conn = MagicMock()
+    alter_minimal_logging(conn, "oracle", "STG.ITEMS")
+    alter_minimal_logging(conn, "postgresql", "stg.items")
+    alter_minimal_logging(conn, "sqlite", "items")
+    sent = [str(call.args[0]) for call in conn.execute.call_args_list]
+    assert sent == [
+        "ALTER TABLE STG.ITEMS NOLOGGING",
+        "ALTER TABLE stg.items SET UNLOGGED",
+    ]
+
+
+def test_upload_with_minimal_logging_on_sqlite(tmp_path: Path):
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'db.sqlite'}")
+    data = tmp_path / "data"
+    data.mkdir()
+    pl.DataFrame({"id": [1, 2, 3]}).write_parquet(data / "items_part0000.parquet")
+
+    upload_parquet(engine, input_dir=str(data), minimal_logging=True)
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar_one() == 3
@@ -0,0 +1,59 @@
+# Tests for utils.database.swap (shadow-table loads)
+# Focuses on swapping a loaded shadow table into place and cleaning up stale shadows
+# This ensures replace loads never leave readers with an empty or partial staging table
+
+from pathlib import Path
+
+from sqlalchemy import create_engine, inspect, text
+
+from utils.database.swap import (
+    drop_shadow_tables,
+    shadow_table_name,
+    swap_table,
+)
+
+
+def _mk_engine(tmp_path: Path):
+    return create_engine(f"sqlite+pysqlite:///{tmp_path / 'db.sqlite'}")
+
+
+def test_swap_replaces_existing_and_creates_missing_target(tmp_path: Path):
+    engine = _mk_engine(tmp_path)
+    shadow = shadow_table_name("t", "abc123")
+    assert shadow == "t__load_abc123"
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INT, old_col TEXT)"))
+        conn.execute(text("INSERT INTO t VALUES (1, 'old')"))
+        conn.execute(text(f"CREATE TABLE {shadow} (id INT, name TEXT)"))
+        conn.execute(text(f"INSERT INTO {shadow} VALUES (2, 'new'), (3, 'new')"))
+
+    swap_table(engine, schema=None, target="t", shadow=shadow)
+
+    assert sorted(inspect(engine).get_table_names()) == ["t"]
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT id, name FROM t ORDER BY id")).all() == [
+            (2, "new"),
+            (3, "new"),
+        ]
+
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE u__load_x (id INT)"))
+    swap_table(engine, schema=None, target="u", shadow="u__load_x")
+    assert sorted(inspect(engine).get_table_names()) == ["t", "u"]
+
+
+def test_drop_shadow_tables_keeps_current_and_unrelated(tmp_path: Path):
+    engine = _mk_engine(tmp_path)
+    with engine.begin() as conn:
+        for name in ("t", "t__load_old1", "t__load_cur", "tx__load_1", "t__delta"):
+            conn.execute(text(f"CREATE TABLE {name} (id INT)"))
+
+    dropped = drop_shadow_tables(engine, schema=None, target="t", keep="t__load_cur")
+
+    assert dropped == ["t__load_old1"]
+    assert sorted(inspect(engine).get_table_names()) == [
+        "t",
+        "t__delta",
+        "t__load_cur",
+        "tx__load_1",
+    ]